@@ -0,0 +1,152 @@
+"""Cold-start time of the stdio server: launch to first ``tools/list``.
+
+Starts ``kafka-connect-mcp`` over stdio the way an MCP client does,
+sends ``initialize`` and ``tools/list`` straight away and times each
+phase until the tool list arrives.  Repeats ``--runs`` times and prints
+the median and best run::
+
+    python benchmarks/bench_startup.py --runs 10
+
+``--importtime`` instead prints the slowest imports of a single start
+(``python -X importtime``), which is where cold-start work usually hides.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER = "from kafka_connect_mcp.server import main; main()"
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+
+def time_to_tools_list(env: dict[str, str] | None = None) -> dict[str, float]:
+    """Seconds from launch to the ``initialize`` and ``tools/list`` replies.
+
+    ``cpu`` is the server's user plus system CPU time for the whole run,
+    which is far less noisy than wall time on a busy machine.
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", SERVER],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    try:
+        proc.stdin.write(
+            b"".join(
+                json.dumps(m).encode() + b"\n"
+                for m in (INITIALIZE, INITIALIZED, TOOLS_LIST)
+            )
+        )
+        proc.stdin.flush()
+        result: dict[str, float] = {}
+        while "tools_list" not in result:
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError("server exited before tools/list")
+            reply = json.loads(line)
+            if reply.get("id") == 0:
+                result["initialize"] = time.perf_counter() - start
+            elif reply.get("id") == 1:
+                result["tools_list"] = time.perf_counter() - start
+                result["tools"] = len(reply["result"]["tools"])
+    finally:
+        proc.stdin.close()
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    result["cpu"] = usage.ru_utime + usage.ru_stime
+    return result
+
+
+def import_profile(limit: int) -> None:
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import kafka_connect_mcp.server",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in out.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            rows.append((int(cumulative), int(own), name.strip()))
+    for cumulative, own, name in sorted(rows, reverse=True)[:limit]:
+        print(f"{cumulative / 1000:9.1f} ms {own / 1000:9.1f} ms  {name}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="Print the slowest imports instead of timing starts",
+    )
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true")
+    opts = parser.parse_args(argv)
+
+    if opts.importtime:
+        print(" cumulative       self  module")
+        import_profile(opts.top)
+        return
+
+    env = dict(os.environ)
+    time_to_tools_list(env)  # warm the OS file cache and .pyc files
+    runs = [time_to_tools_list(env) for _ in range(opts.runs)]
+    summary = {
+        "runs": opts.runs,
+        "tools": runs[0]["tools"],
+        "initialize_median_s": statistics.median(
+            r["initialize"] for r in runs
+        ),
+        "tools_list_median_s": statistics.median(
+            r["tools_list"] for r in runs
+        ),
+        "tools_list_best_s": min(r["tools_list"] for r in runs),
+        "cpu_median_s": statistics.median(r["cpu"] for r in runs),
+    }
+    if opts.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{summary['tools']} tools, {opts.runs} runs")
+    print(
+        f"initialize  median {summary['initialize_median_s'] * 1000:7.0f} ms"
+    )
+    print(
+        f"tools/list  median {summary['tools_list_median_s'] * 1000:7.0f} ms"
+        f"  best {summary['tools_list_best_s'] * 1000:7.0f} ms"
+    )
+    print(f"server CPU  median {summary['cpu_median_s'] * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
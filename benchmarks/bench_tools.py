@@ -0,0 +1,333 @@
+"""Per-tool throughput, latency and memory through a real MCP client.
+
+Starts the simulated Connect cluster (``fake_connect.py``), then for each
+transport starts the server the way a client would: stdio as a
+subprocess of the MCP client, SSE and streamable HTTP as a listening
+server.  Each tool scenario runs ``--concurrency`` concurrent
+``tools/call`` requests for ``--duration`` seconds over that one
+session.  Prints calls per second, p50/p99 latency, errors and the
+server's resident memory after the scenario (and its peak so far)::
+
+    python benchmarks/bench_tools.py --transports stdio sse --duration 5
+
+Everything runs on localhost, so it works offline (CI uploads the
+``--output`` JSON as an artifact).  ``--failed-fraction``,
+``--trace-bytes``, ``--latency-ms`` and the rebalance options shape the
+simulated cluster; see ``fake_connect.py --help``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bench_workers import free_port, percentile, stop, wait_for
+from fake_connect import SINK_CLASS, connector_name
+
+HERE = Path(__file__).resolve().parent
+SERVER = "from kafka_connect_mcp.server import main; main()"
+
+Args = Callable[[random.Random, int], dict]
+
+
+def _named(**extra) -> Args:
+    return lambda rng, n: {
+        "name": connector_name(rng.randrange(n)),
+        **extra,
+    }
+
+
+# Scenario label -> (tool, arguments for a random call).
+SCENARIOS: dict[str, tuple[str, Args]] = {
+    "list_connectors": ("list_connectors", lambda rng, n: {}),
+    "list_connectors_page": (
+        "list_connectors",
+        lambda rng, n: {"limit": 100},
+    ),
+    "get_connector": ("get_connector", _named()),
+    "get_connector_config": ("get_connector_config", _named()),
+    "get_connector_status": ("get_connector_status", _named()),
+    "get_connector_status_full": (
+        "get_connector_status",
+        _named(full_traces=True),
+    ),
+    "get_cluster_snapshot_failed": (
+        "get_cluster_snapshot",
+        lambda rng, n: {"task_state": "FAILED", "limit": 50},
+    ),
+    "get_cluster_topology": ("get_cluster_topology", lambda rng, n: {}),
+    "restart_failed_dry_run": (
+        "restart_failed",
+        lambda rng, n: {"dry_run": True},
+    ),
+    "list_connector_plugins": (
+        "list_connector_plugins",
+        lambda rng, n: {},
+    ),
+    "validate_connector_config": (
+        "validate_connector_config",
+        lambda rng, n: {
+            "plugin_class": SINK_CLASS,
+            "config": {
+                "s3.bucket.name": "b",
+                "flush.size": "1000",
+                "storage.class": "S3Storage",
+                "format.class": "JsonFormat",
+            },
+        },
+    ),
+    "restart_connector": ("restart_connector", _named()),
+}
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+
+def memory(pid: int) -> dict[str, float]:
+    """Resident and peak resident memory of ``pid`` in MiB (Linux)."""
+    fields: dict[str, float] = {}
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    fields[key] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return {
+        "rss_mb": fields.get("VmRSS", float("nan")),
+        "peak_mb": fields.get("VmHWM", float("nan")),
+    }
+
+
+def _server_child() -> int | None:
+    """Pid of the stdio server the MCP client started under us."""
+    me = str(os.getpid())
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            cmdline = (entry / "cmdline").read_bytes()
+        except OSError:
+            continue
+        ppid = stat.rsplit(")", 1)[1].split()[1]
+        if ppid == me and b"kafka_connect_mcp" in cmdline:
+            return int(entry.name)
+    return None
+
+
+async def run_scenario(
+    client, tool: str, make_args: Args, opts: argparse.Namespace
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    rng = random.Random(opts.seed)
+    stop_at = time.monotonic() + opts.duration
+
+    async def loop() -> None:
+        nonlocal errors
+        while time.monotonic() < stop_at:
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(
+                    tool, make_args(rng, opts.connectors), raise_on_error=False
+                )
+                ok = not result.is_error
+            except Exception:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(opts.concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def _bench_session(
+    transport, pid: Callable[[], int | None], opts: argparse.Namespace
+) -> list[dict]:
+    from fastmcp import Client
+
+    rows = []
+    async with Client(transport, timeout=60) as client:
+        server_pid = pid()
+        for label in opts.scenarios:
+            tool, make_args = SCENARIOS[label]
+            # One untimed call warms caches and lazy imports for the tool.
+            warm = make_args(random.Random(0), opts.connectors)
+            await client.call_tool(tool, warm, raise_on_error=False)
+            row = await run_scenario(client, tool, make_args, opts)
+            rows.append(
+                {"scenario": label, **row, **memory(server_pid or -1)}
+            )
+    return rows
+
+
+def run_transport(
+    name: str, env: dict, opts: argparse.Namespace
+) -> list[dict]:
+    from fastmcp.client.transports import (
+        SSETransport,
+        StdioTransport,
+        StreamableHttpTransport,
+    )
+
+    if name == "stdio":
+        transport = StdioTransport(
+            command=sys.executable,
+            args=["-c", SERVER],
+            env=env,
+            log_file=Path(os.devnull),
+        )
+        return asyncio.run(_bench_session(transport, _server_child, opts))
+
+    port = free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            SERVER,
+            "--transport",
+            name,
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for(f"http://127.0.0.1:{port}/metrics")
+        if name == "sse":
+            transport = SSETransport(f"http://127.0.0.1:{port}/sse")
+        else:
+            transport = StreamableHttpTransport(f"http://127.0.0.1:{port}/mcp")
+        return asyncio.run(_bench_session(transport, lambda: proc.pid, opts))
+    finally:
+        stop(proc)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transports", nargs="+", choices=TRANSPORTS, default=["stdio", "sse"]
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        metavar="SCENARIO",
+        help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Seconds per scenario"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Calls in flight"
+    )
+    parser.add_argument("--connectors", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--failed-fraction", type=float, default=0.05)
+    parser.add_argument("--trace-bytes", type=int, default=16_384)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--write-latency-ms", type=float, default=0.0)
+    parser.add_argument("--rebalance-after-write", type=float, default=0.0)
+    parser.add_argument("--rebalance-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON"
+    )
+    parser.add_argument("--output", help="Also write the JSON results here")
+    opts = parser.parse_args(argv)
+
+    connect_port = free_port()
+    fake = subprocess.Popen(
+        [
+            sys.executable,
+            str(HERE / "fake_connect.py"),
+            "--port",
+            str(connect_port),
+            *(
+                arg
+                for flag in (
+                    "connectors",
+                    "tasks",
+                    "workers",
+                    "failed_fraction",
+                    "trace_bytes",
+                    "latency_ms",
+                    "jitter_ms",
+                    "write_latency_ms",
+                    "rebalance_after_write",
+                    "rebalance_rate",
+                    "seed",
+                )
+                for arg in (
+                    f"--{flag.replace('_', '-')}",
+                    str(getattr(opts, flag)),
+                )
+            ),
+        ]
+    )
+    connect_url = f"http://127.0.0.1:{connect_port}"
+    env = {
+        **os.environ,
+        "KAFKA_CONNECT_URL": connect_url,
+        "KAFKA_CONNECT_ENABLE_RESTART": "true",
+    }
+    env.pop("KAFKA_CONNECT_CLUSTERS", None)
+    env.pop("KAFKA_CONNECT_CLUSTERS_FILE", None)
+    env.pop("KAFKA_CONNECT_OTEL_ENDPOINT", None)
+    results = []
+    try:
+        wait_for(connect_url)
+        for name in opts.transports:
+            for row in run_transport(name, env, opts):
+                results.append({"transport": name, **row})
+    finally:
+        stop(fake)
+
+    if opts.output:
+        Path(opts.output).write_text(json.dumps(results, indent=2))
+    if opts.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(
+        f"connectors={opts.connectors} concurrency={opts.concurrency} "
+        f"latency={opts.latency_ms}ms failed={opts.failed_fraction}"
+    )
+    print(
+        f"{'transport':<16}{'scenario':<30}{'calls/s':>9}{'p50 ms':>9}"
+        f"{'p99 ms':>9}{'errors':>8}{'rss MB':>8}{'peak MB':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['transport']:<16}{r['scenario']:<30}{r['rps']:>9.0f}"
+            f"{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['errors']:>8}"
+            f"{r['rss_mb']:>8.0f}{r['peak_mb']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
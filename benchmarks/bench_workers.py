@@ -0,0 +1,216 @@
+"""Throughput of the streamable-HTTP transport as workers are added.
+
+Starts the fake Connect API, then for each worker count starts
+``kafka-connect-mcp --transport streamable-http --workers N`` and drives
+it with stateless ``tools/call`` requests from several load-generator
+processes for a fixed time.  Prints requests per second, latency
+percentiles and the speedup over the first worker count::
+
+    python benchmarks/bench_workers.py --workers 1 2 4 --duration 10
+
+Load generators share the machine with the server, so keep
+``--clients`` below the core count minus the largest worker count for
+numbers that reflect the server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fake_connect import connector_name
+
+HERE = Path(__file__).resolve().parent
+ACCEPT = {"Accept": "application/json, text/event-stream"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{url} did not come up within {timeout}s")
+
+
+def stop(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def tool_call(tool: str, connectors: int) -> dict:
+    arguments = {}
+    if tool != "list_connectors":
+        arguments["name"] = connector_name(random.randrange(connectors))
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": arguments},
+    }
+
+
+async def _drive(
+    url: str, tool: str, connectors: int, concurrency: int, duration: float
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+
+        async def loop() -> None:
+            nonlocal errors
+            while time.monotonic() < stop_at:
+                start = time.perf_counter()
+                try:
+                    resp = await client.post(
+                        url, json=tool_call(tool, connectors), headers=ACCEPT
+                    )
+                    ok = resp.status_code == 200 and '"isError":false' in (
+                        resp.text
+                    )
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return latencies, errors
+
+
+def _client(args: tuple) -> tuple[list[float], int]:
+    return asyncio.run(_drive(*args))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_one(workers: int, connect_url: str, opts: argparse.Namespace) -> dict:
+    port = free_port()
+    env = {**os.environ, "KAFKA_CONNECT_URL": connect_url}
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "kafka_connect_mcp.server",
+            "--transport",
+            "streamable-http",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--stateless",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for(f"http://127.0.0.1:{port}/metrics")
+        url = f"http://127.0.0.1:{port}/mcp"
+        # Warm pooled connections and code paths in every worker.
+        _client((url, opts.tool, opts.connectors, opts.concurrency, 1.0))
+        job = (url, opts.tool, opts.connectors, opts.concurrency, opts.duration)
+        with multiprocessing.Pool(opts.clients) as pool:
+            results = pool.map(_client, [job] * opts.clients)
+    finally:
+        stop(proc)
+    latencies = [lat for lats, _ in results for lat in lats]
+    return {
+        "workers": workers,
+        "requests": len(latencies),
+        "errors": sum(errors for _, errors in results),
+        "rps": len(latencies) / opts.duration,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--clients", type=int, default=2, help="Load-generator processes"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="In-flight requests per load generator",
+    )
+    parser.add_argument("--tool", default="get_connector_status")
+    parser.add_argument("--connectors", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON"
+    )
+    opts = parser.parse_args(argv)
+
+    connect_port = free_port()
+    fake = subprocess.Popen(
+        [
+            sys.executable,
+            str(HERE / "fake_connect.py"),
+            "--port",
+            str(connect_port),
+            "--connectors",
+            str(opts.connectors),
+            "--latency-ms",
+            str(opts.latency_ms),
+        ]
+    )
+    try:
+        connect_url = f"http://127.0.0.1:{connect_port}"
+        wait_for(connect_url)
+        results = [run_one(n, connect_url, opts) for n in opts.workers]
+    finally:
+        stop(fake)
+
+    if opts.json:
+        print(json.dumps(results, indent=2))
+        return
+    base = results[0]["rps"] or float("nan")
+    print(f"cpus={os.cpu_count()} tool={opts.tool} clients={opts.clients}")
+    print("workers      req/s   p50 ms   p99 ms  errors  speedup")
+    for r in results:
+        print(
+            f"{r['workers']:>7} {r['rps']:>10.0f} {r['p50_ms']:>8.1f} "
+            f"{r['p99_ms']:>8.1f} {r['errors']:>7} {r['rps'] / base:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
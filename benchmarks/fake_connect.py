@@ -0,0 +1,619 @@
+"""Simulated Kafka Connect REST API for benchmarks and offline testing.
+
+Models a cluster of connectors, tasks and workers closely enough for the
+MCP server to run every tool against it, plus the behaviour that makes
+real clusters slow or awkward:
+
+* any number of connectors and tasks spread over named workers;
+* a fraction of failed tasks (and whole connectors) carrying large Java
+  stack traces, shared by all failed tasks of a connector;
+* injected latency, with jitter and extra latency on writes (a slow
+  leader);
+* rebalances: every write opens a window in which requests are answered
+  with ``409`` and Connect's rebalance message, and any request can hit
+  one at random.
+
+Writes change the state, so create/pause/restart/delete round-trip as on
+a real cluster.  Run it on its own with::
+
+    python benchmarks/fake_connect.py --port 18083 --connectors 5000 \\
+        --failed-fraction 0.02 --latency-ms 5 --rebalance-after-write 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+REBALANCE_MESSAGE = (
+    "Request cannot be completed because a rebalance is expected"
+)
+
+PLUGINS: dict[str, dict[str, Any]] = {
+    "io.confluent.connect.s3.S3SinkConnector": {
+        "type": "sink",
+        "version": "10.5.0",
+        "config": [
+            ("s3.bucket.name", "STRING", True, None),
+            ("s3.region", "STRING", False, "us-west-2"),
+            ("flush.size", "INT", True, None),
+            ("storage.class", "CLASS", True, None),
+            ("format.class", "CLASS", True, None),
+            ("s3.part.size", "INT", False, "26214400"),
+        ],
+    },
+    "io.confluent.connect.jdbc.JdbcSourceConnector": {
+        "type": "source",
+        "version": "10.7.4",
+        "config": [
+            ("connection.url", "STRING", True, None),
+            ("connection.user", "STRING", False, None),
+            ("connection.password", "PASSWORD", False, None),
+            ("mode", "STRING", False, ""),
+            ("poll.interval.ms", "INT", False, "5000"),
+            ("table.whitelist", "LIST", False, ""),
+        ],
+    },
+    "org.apache.kafka.connect.file.FileStreamSinkConnector": {
+        "type": "sink",
+        "version": "3.7.0",
+        "config": [("file", "STRING", False, None)],
+    },
+}
+SINK_CLASS = "io.confluent.connect.s3.S3SinkConnector"
+SOURCE_CLASS = "io.confluent.connect.jdbc.JdbcSourceConnector"
+
+
+def connector_name(index: int) -> str:
+    """Name of the ``index``-th seeded connector; every fourth is a source."""
+    kind = "source" if index % 4 == 3 else "sink"
+    return f"{kind}-{index:04d}"
+
+
+@dataclass
+class SimSettings:
+    """Shape and behaviour of the simulated cluster."""
+
+    connectors: int = 50
+    tasks: int = 4
+    workers: int = 3
+    failed_fraction: float = 0.0
+    trace_bytes: int = 16_384
+    latency: float = 0.0
+    jitter: float = 0.0
+    write_latency: float = 0.0
+    rebalance_after_write: float = 0.0
+    rebalance_rate: float = 0.0
+    seed: int = 0
+
+
+def make_trace(size: int, seed: int = 0) -> str:
+    """A Connect-style stack trace of roughly ``size`` bytes."""
+    rng = random.Random(seed)
+    lines = [
+        "org.apache.kafka.connect.errors.ConnectException: "
+        "Exiting WorkerSinkTask due to unrecoverable exception.",
+    ]
+    frames = [
+        "org.apache.kafka.connect.runtime.WorkerSinkTask.deliverMessages"
+        "(WorkerSinkTask.java:{n})",
+        "org.apache.kafka.connect.runtime.WorkerSinkTask.poll"
+        "(WorkerSinkTask.java:{n})",
+        "org.apache.kafka.connect.runtime.WorkerTask.doRun"
+        "(WorkerTask.java:{n})",
+        "io.confluent.connect.s3.S3SinkTask.put(S3SinkTask.java:{n})",
+        "java.base/java.util.concurrent.ThreadPoolExecutor.runWorker"
+        "(ThreadPoolExecutor.java:{n})",
+    ]
+    causes = [
+        "Caused by: org.apache.kafka.connect.errors.RetriableException: "
+        "Failed to write to S3",
+        "Caused by: java.net.SocketTimeoutException: Read timed out",
+    ]
+    size_so_far = len(lines[0])
+    cause = 0
+    while size_so_far < size:
+        if cause < len(causes) and size_so_far > size * (cause + 1) / 3:
+            line = causes[cause]
+            cause += 1
+        else:
+            frame = rng.choice(frames).format(n=rng.randrange(50, 900))
+            line = f"\tat {frame}"
+        lines.append(line)
+        size_so_far += len(line) + 1
+    return "\n".join(lines)
+
+
+class SimulatedCluster:
+    """Connector and task state plus the rules for answering requests."""
+
+    def __init__(self, settings: SimSettings) -> None:
+        self.settings = settings
+        self.rng = random.Random(settings.seed)
+        self.workers = [
+            f"worker-{i + 1}:8083" for i in range(max(1, settings.workers))
+        ]
+        self.connectors: dict[str, dict[str, Any]] = {}
+        self.rebalancing_until = 0.0
+        self.requests = 0
+        self.writes = 0
+        self.conflicts = 0
+        for i in range(settings.connectors):
+            name = connector_name(i)
+            sink = name.startswith("sink")
+            self._add(
+                name,
+                {
+                    "connector.class": SINK_CLASS if sink else SOURCE_CLASS,
+                    "tasks.max": str(settings.tasks),
+                    "topics" if sink else "topic.prefix": f"{name}-topic",
+                },
+            )
+            if self.rng.random() < settings.failed_fraction:
+                self._fail(name, whole=self.rng.random() < 0.2)
+
+    # ── state ─────────────────────────────────────────────────
+
+    def _worker(self) -> str:
+        return self.rng.choice(self.workers)
+
+    def _add(self, name: str, config: dict[str, str]) -> dict[str, Any]:
+        config = {**config, "name": name}
+        plugin = PLUGINS.get(config.get("connector.class", ""), {})
+        tasks = max(1, int(config.get("tasks.max", "1")))
+        entry = {
+            "config": config,
+            "type": plugin.get("type", "sink"),
+            "state": "RUNNING",
+            "worker_id": self._worker(),
+            "trace": None,
+            "tasks": [
+                {
+                    "id": t,
+                    "state": "RUNNING",
+                    "worker_id": self._worker(),
+                    "trace": None,
+                }
+                for t in range(tasks)
+            ],
+        }
+        self.connectors[name] = entry
+        return entry
+
+    def _fail(self, name: str, *, whole: bool) -> None:
+        conn = self.connectors[name]
+        trace = make_trace(
+            self.settings.trace_bytes, seed=self.rng.randrange(1 << 30)
+        )
+        if whole:
+            conn["state"] = "FAILED"
+            conn["trace"] = trace
+        tasks = conn["tasks"]
+        failed = tasks if whole else tasks[: max(1, len(tasks) // 2)]
+        for task in failed:
+            task["state"] = "FAILED"
+            task["trace"] = trace
+
+    def info(self, name: str) -> dict[str, Any]:
+        conn = self.connectors[name]
+        return {
+            "name": name,
+            "config": conn["config"],
+            "tasks": [
+                {"connector": name, "task": t["id"]} for t in conn["tasks"]
+            ],
+            "type": conn["type"],
+        }
+
+    def status(self, name: str) -> dict[str, Any]:
+        conn = self.connectors[name]
+        connector = {"state": conn["state"], "worker_id": conn["worker_id"]}
+        if conn["trace"]:
+            connector["trace"] = conn["trace"]
+        return {
+            "name": name,
+            "connector": connector,
+            "tasks": [self.task_status(t) for t in conn["tasks"]],
+            "type": conn["type"],
+        }
+
+    @staticmethod
+    def task_status(task: dict[str, Any]) -> dict[str, Any]:
+        result = {
+            "id": task["id"],
+            "state": task["state"],
+            "worker_id": task["worker_id"],
+        }
+        if task["trace"]:
+            result["trace"] = task["trace"]
+        return result
+
+    def restart(
+        self, name: str, *, include_tasks: bool, only_failed: bool
+    ) -> None:
+        conn = self.connectors[name]
+        if not only_failed or conn["state"] == "FAILED":
+            conn["state"] = "RUNNING"
+            conn["trace"] = None
+        if include_tasks:
+            for task in conn["tasks"]:
+                if not only_failed or task["state"] == "FAILED":
+                    self.restart_task(task)
+
+    @staticmethod
+    def restart_task(task: dict[str, Any]) -> None:
+        task["state"] = "RUNNING"
+        task["trace"] = None
+
+    # ── request rules ─────────────────────────────────────────
+
+    def rebalancing(self) -> bool:
+        if time.monotonic() < self.rebalancing_until:
+            return True
+        rate = self.settings.rebalance_rate
+        return rate > 0 and self.rng.random() < rate
+
+    def wrote(self) -> None:
+        self.writes += 1
+        window = self.settings.rebalance_after_write
+        if window > 0:
+            self.rebalancing_until = time.monotonic() + window
+
+    def delay(self, write: bool) -> float:
+        s = self.settings
+        delay = s.latency + (self.rng.uniform(0, s.jitter) if s.jitter else 0)
+        return delay + (s.write_latency if write else 0.0)
+
+
+def _error(status: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        {"error_code": status, "message": message}, status_code=status
+    )
+
+
+def _not_found(name: str) -> JSONResponse:
+    return _error(404, f"Connector {name} not found")
+
+
+def build_app(
+    settings: SimSettings | None = None, **overrides: Any
+) -> Starlette:
+    """Starlette app serving a :class:`SimulatedCluster`.
+
+    The cluster is available as ``app.state.cluster``.
+    """
+    settings = settings or SimSettings(**overrides)
+    cluster = SimulatedCluster(settings)
+
+    def endpoint(handler, *, write: bool = False, upsert: bool = False):
+        async def wrapped(request: Request) -> Response:
+            cluster.requests += 1
+            delay = cluster.delay(write)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if cluster.rebalancing():
+                cluster.conflicts += 1
+                return _error(409, REBALANCE_MESSAGE)
+            name = request.path_params.get("name")
+            if name is not None and name not in cluster.connectors:
+                if not upsert:
+                    return _not_found(name)
+            response = await handler(request)
+            if write and response.status_code < 400:
+                cluster.wrote()
+            return response
+
+        return wrapped
+
+    async def root(request: Request) -> Response:
+        return JSONResponse(
+            {
+                "version": "3.7.0",
+                "commit": "simulated",
+                "kafka_cluster_id": "sim-cluster",
+            }
+        )
+
+    async def list_connectors(request: Request) -> Response:
+        expand = request.query_params.getlist("expand")
+        if not expand:
+            return JSONResponse(list(cluster.connectors))
+        result = {}
+        for name in cluster.connectors:
+            entry = {}
+            if "info" in expand:
+                entry["info"] = cluster.info(name)
+            if "status" in expand:
+                entry["status"] = cluster.status(name)
+            result[name] = entry
+        return JSONResponse(result)
+
+    async def create_connector(request: Request) -> Response:
+        body = await request.json()
+        name = body.get("name")
+        if not name:
+            return _error(400, "Connector config must include a name")
+        if name in cluster.connectors:
+            return _error(409, f"Connector {name} already exists")
+        cluster._add(name, body.get("config", {}))
+        return JSONResponse(cluster.info(name), status_code=201)
+
+    async def get_connector(request: Request) -> Response:
+        return JSONResponse(cluster.info(request.path_params["name"]))
+
+    async def delete_connector(request: Request) -> Response:
+        del cluster.connectors[request.path_params["name"]]
+        return Response(status_code=204)
+
+    async def get_config(request: Request) -> Response:
+        name = request.path_params["name"]
+        return JSONResponse(cluster.connectors[name]["config"])
+
+    async def put_config(request: Request) -> Response:
+        name = request.path_params["name"]
+        config = await request.json()
+        created = name not in cluster.connectors
+        if created:
+            cluster._add(name, config)
+        else:
+            cluster.connectors[name]["config"] = {**config, "name": name}
+        return JSONResponse(
+            cluster.info(name), status_code=201 if created else 200
+        )
+
+    async def get_status(request: Request) -> Response:
+        return JSONResponse(cluster.status(request.path_params["name"]))
+
+    async def get_tasks(request: Request) -> Response:
+        name = request.path_params["name"]
+        conn = cluster.connectors[name]
+        return JSONResponse(
+            [
+                {
+                    "id": {"connector": name, "task": t["id"]},
+                    "config": conn["config"],
+                }
+                for t in conn["tasks"]
+            ]
+        )
+
+    def set_state(state: str):
+        async def handler(request: Request) -> Response:
+            conn = cluster.connectors[request.path_params["name"]]
+            conn["state"] = state
+            for task in conn["tasks"]:
+                task["state"] = state
+            return Response(status_code=202)
+
+        return handler
+
+    async def restart(request: Request) -> Response:
+        name = request.path_params["name"]
+        params = request.query_params
+        include_tasks = params.get("includeTasks", "false") == "true"
+        cluster.restart(
+            name,
+            include_tasks=include_tasks,
+            only_failed=params.get("onlyFailed", "false") == "true",
+        )
+        if include_tasks:
+            return JSONResponse(cluster.status(name), status_code=202)
+        return Response(status_code=204)
+
+    def _task(request: Request) -> dict[str, Any] | None:
+        conn = cluster.connectors[request.path_params["name"]]
+        task_id = request.path_params["task_id"]
+        return next((t for t in conn["tasks"] if t["id"] == task_id), None)
+
+    async def task_status(request: Request) -> Response:
+        task = _task(request)
+        if task is None:
+            return _error(404, "Task not found")
+        return JSONResponse(cluster.task_status(task))
+
+    async def restart_task(request: Request) -> Response:
+        task = _task(request)
+        if task is None:
+            return _error(404, "Task not found")
+        cluster.restart_task(task)
+        return Response(status_code=204)
+
+    async def list_plugins(request: Request) -> Response:
+        return JSONResponse(
+            [
+                {"class": cls, "type": p["type"], "version": p["version"]}
+                for cls, p in PLUGINS.items()
+            ]
+        )
+
+    def _definition(plugin_class: str) -> list[dict[str, Any]] | None:
+        plugin = PLUGINS.get(plugin_class)
+        if plugin is None:
+            return None
+        return [
+            {
+                "name": name,
+                "type": kind,
+                "required": required,
+                "default_value": default,
+                "importance": "HIGH" if required else "MEDIUM",
+                "documentation": f"{name} setting.",
+            }
+            for name, kind, required, default in plugin["config"]
+        ]
+
+    async def plugin_config(request: Request) -> Response:
+        definition = _definition(request.path_params["plugin"])
+        if definition is None:
+            return _error(404, "Plugin not found")
+        return JSONResponse(definition)
+
+    async def validate(request: Request) -> Response:
+        plugin_class = request.path_params["plugin"]
+        definition = _definition(plugin_class)
+        if definition is None:
+            return _error(404, "Plugin not found")
+        config = await request.json()
+        configs = []
+        errors = 0
+        for key in definition:
+            problems = []
+            if key["required"] and not config.get(key["name"]):
+                problems.append("Missing required configuration")
+                errors += 1
+            configs.append(
+                {
+                    "definition": key,
+                    "value": {
+                        "name": key["name"],
+                        "value": config.get(key["name"]),
+                        "errors": problems,
+                    },
+                }
+            )
+        return JSONResponse(
+            {
+                "name": plugin_class,
+                "error_count": errors,
+                "groups": ["Common"],
+                "configs": configs,
+            }
+        )
+
+    routes = [
+        Route("/", endpoint(root)),
+        Route("/connectors", endpoint(list_connectors)),
+        Route(
+            "/connectors",
+            endpoint(create_connector, write=True),
+            methods=["POST"],
+        ),
+        Route("/connectors/{name}", endpoint(get_connector)),
+        Route(
+            "/connectors/{name}",
+            endpoint(delete_connector, write=True),
+            methods=["DELETE"],
+        ),
+        Route("/connectors/{name}/config", endpoint(get_config)),
+        Route(
+            "/connectors/{name}/config",
+            endpoint(put_config, write=True, upsert=True),
+            methods=["PUT"],
+        ),
+        Route("/connectors/{name}/status", endpoint(get_status)),
+        Route("/connectors/{name}/tasks", endpoint(get_tasks)),
+        Route(
+            "/connectors/{name}/pause",
+            endpoint(set_state("PAUSED"), write=True),
+            methods=["PUT"],
+        ),
+        Route(
+            "/connectors/{name}/resume",
+            endpoint(set_state("RUNNING"), write=True),
+            methods=["PUT"],
+        ),
+        Route(
+            "/connectors/{name}/restart",
+            endpoint(restart, write=True),
+            methods=["POST"],
+        ),
+        Route(
+            "/connectors/{name}/tasks/{task_id:int}/status",
+            endpoint(task_status),
+        ),
+        Route(
+            "/connectors/{name}/tasks/{task_id:int}/restart",
+            endpoint(restart_task, write=True),
+            methods=["POST"],
+        ),
+        Route("/connector-plugins", endpoint(list_plugins)),
+        Route(
+            "/connector-plugins/{plugin}/config", endpoint(plugin_config)
+        ),
+        Route(
+            "/connector-plugins/{plugin}/config/validate",
+            endpoint(validate),
+            methods=["PUT"],
+        ),
+    ]
+    app = Starlette(routes=routes)
+    app.state.cluster = cluster
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18083)
+    parser.add_argument("--connectors", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument(
+        "--failed-fraction",
+        type=float,
+        default=0.0,
+        help="Share of connectors with failed tasks",
+    )
+    parser.add_argument(
+        "--trace-bytes",
+        type=int,
+        default=16_384,
+        help="Size of each failure stack trace",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Delay on every request"
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="Random extra delay"
+    )
+    parser.add_argument(
+        "--write-latency-ms",
+        type=float,
+        default=0.0,
+        help="Extra delay on writes (a slow leader)",
+    )
+    parser.add_argument(
+        "--rebalance-after-write",
+        type=float,
+        default=0.0,
+        help="Seconds every write answers 409 rebalance afterwards",
+    )
+    parser.add_argument(
+        "--rebalance-rate",
+        type=float,
+        default=0.0,
+        help="Chance any request hits a 409 rebalance",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    app = build_app(
+        SimSettings(
+            connectors=args.connectors,
+            tasks=args.tasks,
+            workers=args.workers,
+            failed_fraction=args.failed_fraction,
+            trace_bytes=args.trace_bytes,
+            latency=args.latency_ms / 1000,
+            jitter=args.jitter_ms / 1000,
+            write_latency=args.write_latency_ms / 1000,
+            rebalance_after_write=args.rebalance_after_write,
+            rebalance_rate=args.rebalance_rate,
+            seed=args.seed,
+        )
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
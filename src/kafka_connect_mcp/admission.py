@@ -0,0 +1,221 @@
+"""Admission control for mutating Connect requests.
+
+Every write to Connect can restart a connector and trigger a group
+rebalance, so a misbehaving client sending writes in a tight loop can
+keep a cluster rebalancing.  :class:`MutationScheduler` sits in front of
+each cluster's writes and admits them through:
+
+* a token bucket limiting the sustained write rate;
+* a cap on concurrent writes;
+* a per-connector lock, so writes to one connector run one at a time;
+* a bounded queue of waiting writes.
+
+When a write cannot be admitted at once it either waits (up to a
+deadline) or is rejected straight away, depending on the configured
+saturation mode.  Rejections raise :class:`MutationRejectedError`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from kafka_connect_mcp.env import env_float, env_int
+from kafka_connect_mcp.ratelimit import TokenBucket
+
+SATURATION_MODES = ("wait", "reject")
+
+
+class MutationRejectedError(RuntimeError):
+    """Raised when a write is not admitted by the mutation scheduler."""
+
+    def __init__(
+        self,
+        *,
+        cluster: str,
+        reason: str,
+        retry_after: float,
+        connector: str | None = None,
+    ) -> None:
+        self.details = {
+            "type": "mutation_rejected",
+            "cluster": cluster,
+            "connector": connector,
+            "reason": reason,
+            "retry_after": round(retry_after, 2),
+        }
+        connector_hint = f" for connector '{connector}'" if connector else ""
+        super().__init__(
+            f"Write{connector_hint} on cluster '{cluster}' rejected: "
+            f"{reason}. Retry after {retry_after:.1f}s."
+        )
+
+
+class MutationScheduler:
+    """Rate, concurrency and per-connector admission of writes."""
+
+    def __init__(
+        self,
+        cluster: str,
+        *,
+        rate: float = 2.0,
+        burst: int = 10,
+        max_concurrent: int = 4,
+        max_queue: int = 64,
+        saturation: str = "wait",
+        max_wait: float = 30.0,
+    ) -> None:
+        if saturation not in SATURATION_MODES:
+            raise ValueError(
+                f"Unknown saturation mode '{saturation}'; "
+                f"expected one of {', '.join(SATURATION_MODES)}"
+            )
+        self.cluster = cluster
+        self.saturation = saturation
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.max_concurrent = max(1, max_concurrent)
+        self._bucket = TokenBucket(rate, burst)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self.queued = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @classmethod
+    def from_env(cls, cluster: str) -> MutationScheduler:
+        """Build a scheduler from ``KAFKA_CONNECT_MUTATION_*`` variables."""
+        return cls(
+            cluster,
+            rate=env_float("KAFKA_CONNECT_MUTATION_RATE", 2.0),
+            burst=env_int("KAFKA_CONNECT_MUTATION_BURST", 10),
+            max_concurrent=env_int("KAFKA_CONNECT_MUTATION_CONCURRENCY", 4),
+            max_queue=env_int("KAFKA_CONNECT_MUTATION_QUEUE", 64),
+            saturation=os.environ.get(
+                "KAFKA_CONNECT_MUTATION_SATURATION", "wait"
+            )
+            .strip()
+            .lower(),
+            max_wait=env_float("KAFKA_CONNECT_MUTATION_MAX_WAIT", 30.0),
+        )
+
+    def _reject(
+        self, reason: str, connector: str | None, retry_after: float
+    ) -> MutationRejectedError:
+        self.rejected += 1
+        return MutationRejectedError(
+            cluster=self.cluster,
+            connector=connector,
+            reason=reason,
+            retry_after=retry_after,
+        )
+
+    def _connector_lock(self, connector: str) -> asyncio.Lock:
+        self._lock_users[connector] = self._lock_users.get(connector, 0) + 1
+        return self._locks.setdefault(connector, asyncio.Lock())
+
+    def _release_connector_lock(self, connector: str) -> None:
+        self._lock_users[connector] -= 1
+        if not self._lock_users[connector]:
+            del self._lock_users[connector]
+            del self._locks[connector]
+
+    def _try_admit_now(self, lock: asyncio.Lock | None) -> str | None:
+        """Take every resource without waiting, or name the busy one."""
+        if lock is not None and lock.locked():
+            return "another write to this connector is in progress"
+        if self._slots.locked():
+            return f"{self.max_concurrent} writes already in progress"
+        if not self._bucket.try_acquire():
+            return "write rate limit reached"
+        return None
+
+    async def _wait_for(self, lock: asyncio.Lock | None) -> None:
+        if lock is not None:
+            await lock.acquire()
+        try:
+            await self._slots.acquire()
+            try:
+                await self._bucket.acquire()
+            except BaseException:
+                self._slots.release()
+                raise
+        except BaseException:
+            if lock is not None:
+                lock.release()
+            raise
+
+    @asynccontextmanager
+    async def admit(self, connector: str | None = None) -> AsyncIterator[None]:
+        """Hold an admission for one write to ``connector``."""
+        lock = None if connector is None else self._connector_lock(connector)
+        try:
+            busy = self._try_admit_now(lock)
+            if busy is None:
+                if lock is not None:
+                    await lock.acquire()
+                await self._slots.acquire()
+            elif self.saturation == "reject":
+                raise self._reject(busy, connector, self._bucket.retry_after())
+            elif self.queued >= self.max_queue:
+                raise self._reject(
+                    f"{self.queued} writes already queued",
+                    connector,
+                    self._bucket.retry_after(),
+                )
+            else:
+                await self._queue(lock, connector)
+            self.admitted += 1
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self._slots.release()
+                if lock is not None:
+                    lock.release()
+        finally:
+            if connector is not None:
+                self._release_connector_lock(connector)
+
+    async def _queue(
+        self, lock: asyncio.Lock | None, connector: str | None
+    ) -> None:
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await self._wait_for(lock)
+        except TimeoutError:
+            raise self._reject(
+                f"still queued after {self.max_wait:.1f}s",
+                connector,
+                self._bucket.retry_after(),
+            ) from None
+        finally:
+            self.queued -= 1
+            waited = time.monotonic() - start
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "saturation": self.saturation,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_seconds_total": round(self.wait_total, 3),
+            "wait_seconds_max": round(self.wait_max, 3),
+        }
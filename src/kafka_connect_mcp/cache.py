@@ -0,0 +1,128 @@
+"""In-process TTL + LRU cache for Kafka Connect read endpoints."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from kafka_connect_mcp.env import env_float, env_int
+
+MISSING: Any = object()
+
+# Default TTL (seconds) per cached endpoint kind. A TTL of 0 disables
+# caching for that kind.
+DEFAULT_TTLS: dict[str, float] = {
+    "cluster_info": 300.0,
+    "connector_plugins": 300.0,
+    "plugin_config": 300.0,
+    "connectors": 10.0,
+    "connector_info": 30.0,
+    "connector_config": 30.0,
+}
+
+TTL_ENVS: dict[str, str] = {
+    "cluster_info": "KAFKA_CONNECT_CACHE_TTL_CLUSTER_INFO",
+    "connector_plugins": "KAFKA_CONNECT_CACHE_TTL_PLUGINS",
+    "plugin_config": "KAFKA_CONNECT_CACHE_TTL_PLUGIN_CONFIG",
+    "connectors": "KAFKA_CONNECT_CACHE_TTL_CONNECTORS",
+    "connector_info": "KAFKA_CONNECT_CACHE_TTL_CONNECTOR",
+    "connector_config": "KAFKA_CONNECT_CACHE_TTL_CONFIG",
+}
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Size bound and per-endpoint TTLs for the read cache."""
+
+    max_entries: int
+    ttls: dict[str, float]
+
+    @classmethod
+    def from_env(cls) -> CacheSettings:
+        """Build settings from ``KAFKA_CONNECT_CACHE_*`` variables."""
+        return cls(
+            max_entries=env_int("KAFKA_CONNECT_CACHE_MAX_ENTRIES", 1024),
+            ttls={
+                kind: env_float(TTL_ENVS[kind], default)
+                for kind, default in DEFAULT_TTLS.items()
+            },
+        )
+
+
+class TTLCache:
+    """A size-bounded LRU cache whose entries expire per key kind.
+
+    Keys are tuples whose first element names the endpoint kind (for
+    example ``("connector_config", "my-sink")``); the kind selects the
+    TTL from ``ttls``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttls: dict[str, float],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttls = dict(ttls)
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> TTLCache:
+        return cls(max_entries=settings.max_entries, ttls=settings.ttls)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached value for ``key`` or ``MISSING``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store ``value`` under ``key`` using the TTL for its kind."""
+        ttl = self.ttls.get(key[0], 0.0)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, *keys: tuple) -> None:
+        """Drop ``keys`` if present."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
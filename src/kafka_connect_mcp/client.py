@@ -0,0 +1,102 @@
+"""Pooled HTTP client settings for the Kafka Connect REST API.
+
+httpx is imported when the first client is built rather than with this
+module, so reading the settings stays cheap.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kafka_connect_mcp.env import env_bool, env_float, env_int
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass(frozen=True)
+class ClientSettings:
+    """Connection pool and timeout settings for the shared Connect client."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> ClientSettings:
+        """Build settings from ``KAFKA_CONNECT_*`` environment variables."""
+        return cls(
+            max_connections=env_int(
+                "KAFKA_CONNECT_MAX_CONNECTIONS", cls.max_connections
+            ),
+            max_keepalive_connections=env_int(
+                "KAFKA_CONNECT_MAX_KEEPALIVE_CONNECTIONS",
+                cls.max_keepalive_connections,
+            ),
+            keepalive_expiry=env_float(
+                "KAFKA_CONNECT_KEEPALIVE_EXPIRY", cls.keepalive_expiry
+            ),
+            connect_timeout=env_float(
+                "KAFKA_CONNECT_CONNECT_TIMEOUT", cls.connect_timeout
+            ),
+            read_timeout=env_float(
+                "KAFKA_CONNECT_READ_TIMEOUT", cls.read_timeout
+            ),
+            http2=env_bool("KAFKA_CONNECT_HTTP2", cls.http2),
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        import httpx
+
+        return httpx.Timeout(
+            self.read_timeout,
+            connect=self.connect_timeout,
+            pool=self.connect_timeout,
+        )
+
+
+def build_client(
+    base_url: str,
+    settings: ClientSettings,
+    *,
+    auth: httpx.Auth | None = None,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """Create a long-lived, connection-pooling client for ``base_url``."""
+    import httpx
+
+    if settings.http2:
+        _require_h2()
+    return httpx.AsyncClient(
+        base_url=base_url,
+        limits=settings.limits,
+        timeout=settings.timeout,
+        http2=settings.http2,
+        auth=auth,
+        headers=headers,
+    )
+
+
+def _require_h2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError as exc:
+        raise RuntimeError(
+            "KAFKA_CONNECT_HTTP2=true requires the 'h2' package. "
+            "Install kafka-connect-mcp[http2] to enable it."
+        ) from exc
@@ -0,0 +1,567 @@
+"""Registry of Kafka Connect clusters and their per-cluster state.
+
+By default the server talks to a single cluster named ``default`` at
+``KAFKA_CONNECT_URL``.  To manage several clusters from one process,
+point ``KAFKA_CONNECT_CLUSTERS_FILE`` at a JSON or TOML file (or put the
+same JSON document in ``KAFKA_CONNECT_CLUSTERS``)::
+
+    {
+      "default": "prod-eu",
+      "clusters": {
+        "prod-eu": {
+          "url": "https://connect-eu:8083",
+          "auth": {"username": "svc", "password_env": "EU_CONNECT_PASSWORD"},
+          "read_timeout": 60,
+          "policy": {"KAFKA_CONNECT_ENABLE_RESTART": true}
+        },
+        "staging": {
+          "url": "https://connect-staging:8083",
+          "policy_file": "/etc/kafka-connect-mcp/staging-policy.toml"
+        },
+        "prod-us": {
+          "urls": ["https://connect-us-1:8083", "https://connect-us-2:8083"],
+          "routing": "least_latency",
+          "leader_url": "https://connect-us-1:8083"
+        }
+      }
+    }
+
+Any :class:`~kafka_connect_mcp.client.ClientSettings` field may be set
+per cluster, as may the worker routing options ``routing``,
+``leader_url`` and ``health_check_interval`` (see
+:mod:`kafka_connect_mcp.routing`).  ``policy`` uses the same keys as the
+safety environment variables and ``policy_file`` names a policy file
+(see :mod:`kafka_connect_mcp.safety`) that is reloaded when it changes.
+A cluster with neither follows ``KAFKA_CONNECT_POLICY_FILE`` when set,
+otherwise the process environment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import os
+import time
+import tomllib
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+import httpx
+
+from kafka_connect_mcp.admission import MutationScheduler
+from kafka_connect_mcp.cache import MISSING, CacheSettings, TTLCache
+from kafka_connect_mcp.client import ClientSettings, build_client
+from kafka_connect_mcp.deadlines import cancelled_by_deadline
+from kafka_connect_mcp.env import env_float, env_int
+from kafka_connect_mcp.metrics import (
+    RequestTimer,
+    endpoint_template,
+    pool_stats,
+    record_upstream,
+)
+from kafka_connect_mcp.resilience import (
+    NOT_SENT_ERRORS,
+    CircuitBreaker,
+    RetryPolicy,
+)
+from kafka_connect_mcp.routing import Worker, WorkerPool
+from kafka_connect_mcp.safety import PolicyFile, SafetyPolicy
+from kafka_connect_mcp.singleflight import SingleFlight
+from kafka_connect_mcp.snapshot import EXPAND_PARAMS, normalize_snapshot
+from kafka_connect_mcp.telemetry import span
+from kafka_connect_mcp.traces import TraceStore
+from kafka_connect_mcp.watcher import StatusWatcher
+
+DEFAULT_CLUSTER = "default"
+
+T = TypeVar("T")
+
+
+class UnknownClusterError(LookupError):
+    """Raised when a tool names a cluster that is not configured."""
+
+    def __init__(self, name: str, known: list[str]) -> None:
+        self.details = {
+            "type": "unknown_cluster",
+            "cluster": name,
+            "known_clusters": known,
+        }
+        super().__init__(
+            f"Unknown cluster '{name}'. Known clusters: {', '.join(known)}"
+        )
+
+
+@dataclass(frozen=True)
+class ClusterConfig:
+    """Static description of one Kafka Connect cluster."""
+
+    name: str
+    urls: tuple[str, ...]
+    client: ClientSettings = field(default_factory=ClientSettings)
+    username: str | None = None
+    password: str | None = field(default=None, repr=False)
+    token: str | None = field(default=None, repr=False)
+    policy: Mapping[str, str] | None = None
+    policy_file: str | None = None
+    routing: str = "round_robin"
+    leader_url: str | None = None
+    health_check_interval: float = 10.0
+
+    @property
+    def auth(self) -> httpx.Auth | None:
+        if self.username is not None:
+            return httpx.BasicAuth(self.username, self.password or "")
+        return None
+
+    @property
+    def headers(self) -> dict[str, str] | None:
+        if self.token is not None:
+            return {"Authorization": f"Bearer {self.token}"}
+        return None
+
+
+def _secret(spec: Mapping[str, Any], key: str) -> str | None:
+    if key in spec:
+        return str(spec[key])
+    env_name = spec.get(f"{key}_env")
+    if env_name is None:
+        return None
+    value = os.getenv(env_name)
+    if value is None:
+        raise ValueError(f"Environment variable {env_name} is not set")
+    return value
+
+
+def _policy_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+_CLIENT_FIELDS = {f.name for f in dataclasses.fields(ClientSettings)}
+
+
+def _split_urls(value: str) -> tuple[str, ...]:
+    return tuple(u.strip() for u in value.split(",") if u.strip())
+
+
+def _routing_defaults() -> dict[str, Any]:
+    return {
+        "routing": os.getenv("KAFKA_CONNECT_ROUTING", "round_robin"),
+        "health_check_interval": env_float(
+            "KAFKA_CONNECT_HEALTH_CHECK_INTERVAL", 10.0
+        ),
+    }
+
+
+def parse_cluster(
+    name: str, spec: Mapping[str, Any], base: ClientSettings
+) -> ClusterConfig:
+    """Build a :class:`ClusterConfig` from one entry of the config file."""
+    if "urls" in spec:
+        urls = tuple(spec["urls"])
+    elif "url" in spec:
+        urls = _split_urls(spec["url"])
+    else:
+        raise ValueError(f"Cluster '{name}' needs a 'url' or 'urls' entry")
+    if not urls:
+        raise ValueError(f"Cluster '{name}' has an empty 'urls' list")
+
+    overrides = {k: v for k, v in spec.items() if k in _CLIENT_FIELDS}
+    auth = spec.get("auth") or {}
+    policy = spec.get("policy")
+    routing = _routing_defaults()
+    return ClusterConfig(
+        name=name,
+        urls=urls,
+        client=dataclasses.replace(base, **overrides),
+        username=_secret(auth, "username"),
+        password=_secret(auth, "password"),
+        token=_secret(auth, "token"),
+        policy=(
+            None
+            if policy is None
+            else {k: _policy_value(v) for k, v in policy.items()}
+        ),
+        policy_file=spec.get("policy_file"),
+        routing=spec.get("routing", routing["routing"]),
+        leader_url=spec.get("leader_url"),
+        health_check_interval=float(
+            spec.get("health_check_interval", routing["health_check_interval"])
+        ),
+    )
+
+
+def load_cluster_configs(
+    document: Mapping[str, Any], base: ClientSettings
+) -> tuple[list[ClusterConfig], str]:
+    """Parse a cluster config document into configs and the default name."""
+    specs = document.get("clusters") or {}
+    if not specs:
+        raise ValueError("Cluster config must define at least one cluster")
+    configs = [parse_cluster(name, spec, base) for name, spec in specs.items()]
+    default = document.get("default", configs[0].name)
+    if default not in specs:
+        raise ValueError(f"Default cluster '{default}' is not defined")
+    return configs, default
+
+
+def _read_document(path: Path) -> dict[str, Any]:
+    if path.suffix == ".toml":
+        with path.open("rb") as fh:
+            return tomllib.load(fh)
+    return json.loads(path.read_text())
+
+
+class Cluster:
+    """Runtime state for one cluster: pooled client, cache and policy."""
+
+    def __init__(self, config: ClusterConfig) -> None:
+        self.config = config
+        self.cache = TTLCache.from_settings(CacheSettings.from_env())
+        # Bumped per cache key on invalidation, so a read that started
+        # before a mutation neither caches nor shares its stale result.
+        self._generations: dict[tuple, int] = {}
+        self.inflight = SingleFlight()
+        self.workers = WorkerPool(
+            config.urls,
+            strategy=config.routing,
+            leader_url=config.leader_url,
+            health_check_interval=config.health_check_interval,
+        )
+        self.retry = RetryPolicy.from_env()
+        self.breaker = CircuitBreaker(
+            failure_threshold=env_int("KAFKA_CONNECT_BREAKER_THRESHOLD", 5),
+            reset_timeout=env_float("KAFKA_CONNECT_BREAKER_RESET", 30.0),
+        )
+        self.mutations = MutationScheduler.from_env(config.name)
+        self._policy_file: PolicyFile | None = None
+        self._policy: SafetyPolicy | None = None
+        policy_file = config.policy_file or os.getenv("KAFKA_CONNECT_POLICY_FILE")
+        if config.policy is not None:
+            self._policy = dataclasses.replace(
+                SafetyPolicy.from_env(config.policy), source="cluster config"
+            )
+        elif policy_file:
+            self._policy_file = PolicyFile(policy_file)
+        else:
+            self._policy = SafetyPolicy.from_env()
+        self.traces = TraceStore(
+            env_int("KAFKA_CONNECT_TRACE_STORE_BYTES", 8 * 1024 * 1024)
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._watcher: StatusWatcher | None = None
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def base_url(self) -> str:
+        return self.config.urls[0]
+
+    def client(self) -> httpx.AsyncClient:
+        """Return this cluster's pooled client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = build_client(
+                self.base_url,
+                self.config.client,
+                auth=self.config.auth,
+                headers=self.config.headers,
+            )
+        return self._client
+
+    def watcher(self) -> StatusWatcher:
+        """Return this cluster's status watcher, started on first use."""
+        if self._watcher is None:
+            self._watcher = StatusWatcher.from_env(self.fetch_snapshot)
+        self._watcher.start()
+        return self._watcher
+
+    async def fetch_snapshot(self) -> list[dict[str, Any]]:
+        """All connectors and tasks from one expanded ``/connectors`` call."""
+        payload = await self.get_json("/connectors", params=EXPAND_PARAMS)
+        return normalize_snapshot(payload)
+
+    async def aclose(self) -> None:
+        if self._watcher is not None:
+            await self._watcher.aclose()
+        await self.workers.aclose()
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _health_check(self, worker: Worker) -> None:
+        resp = await self.client().get(
+            f"{worker.url}/", timeout=self.config.client.connect_timeout
+        )
+        resp.raise_for_status()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request with retries, backoff and circuit breaking.
+
+        GETs are idempotent; other methods are only retried after an
+        ambiguous failure when ``idempotent=True`` is passed. See
+        :class:`~kafka_connect_mcp.resilience.RetryPolicy`.
+        """
+        if idempotent is None:
+            idempotent = method.upper() == "GET"
+        return await self.retry.run(
+            lambda: self._send(method, path, **kwargs),
+            cluster=self.name,
+            breaker=self.breaker,
+            idempotent=idempotent,
+        )
+
+    async def _send(
+        self, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request to the best worker, failing over on errors.
+
+        Reads go to a healthy worker picked by the routing strategy and
+        move on to the next worker on any transport error.  Mutations go
+        to the leader and only fail over when the request provably never
+        left this process.  A worker still silent when the tool call's
+        deadline cancels the request is marked down, so later calls go
+        to healthy workers rather than queueing behind it.
+        """
+        client = self.client()
+        self.workers.start_health_checks(self._health_check)
+        mutation = method.upper() != "GET"
+        candidates = (
+            self.workers.write_candidates()
+            if mutation
+            else self.workers.read_candidates()
+        )
+        error: httpx.TransportError | None = None
+        for worker in candidates:
+            timer = RequestTimer()
+            extensions = {**kwargs.pop("extensions", {}), "trace": timer.trace}
+            with span(
+                f"{method} {endpoint_template(path)}",
+                **{
+                    "http.request.method": method,
+                    "url.full": f"{worker.url}{path}",
+                    "kafka_connect.cluster": self.name,
+                },
+            ) as trace_span:
+                start = time.monotonic()
+                try:
+                    resp = await client.request(
+                        method,
+                        f"{worker.url}{path}",
+                        extensions=extensions,
+                        **kwargs,
+                    )
+                except httpx.TransportError as exc:
+                    record_upstream(
+                        self.name,
+                        method,
+                        path,
+                        time.monotonic() - start,
+                        None,
+                        timer,
+                    )
+                    worker.mark_down(exc)
+                    if mutation and not isinstance(exc, NOT_SENT_ERRORS):
+                        raise
+                    error = exc
+                    continue
+                except asyncio.CancelledError as exc:
+                    if cancelled_by_deadline(exc):
+                        worker.mark_down("no reply within the call deadline")
+                    raise
+                elapsed = time.monotonic() - start
+                record_upstream(self.name, method, path, elapsed, resp, timer)
+                if trace_span is not None:
+                    trace_span.set_attribute(
+                        "http.response.status_code", resp.status_code
+                    )
+                    for phase, seconds in timer.phases.items():
+                        trace_span.set_attribute(
+                            f"kafka_connect.{phase}_seconds", seconds
+                        )
+            worker.observe(elapsed)
+            return resp
+        assert error is not None
+        raise error
+
+    async def get_json(
+        self,
+        path: str,
+        params: list[tuple[str, str]] | None = None,
+        *,
+        generation: int = 0,
+    ) -> Any:
+        """GET ``path`` and decode it, sharing identical in-flight requests.
+
+        Only requests with the same ``generation`` are shared; see
+        :meth:`cached_get`.
+        """
+
+        async def fetch() -> Any:
+            resp = await self.request("GET", path, params=params)
+            resp.raise_for_status()
+            return resp.json()
+
+        key = (path, tuple(params or ()), generation)
+        return await self.inflight.do(key, fetch)
+
+    async def cached_get(
+        self, key: tuple, path: str, *, fresh: bool = False
+    ) -> Any:
+        """GET ``path`` through the read cache unless ``fresh`` is set.
+
+        A read that was in flight when ``key`` was invalidated is neither
+        cached nor joined by later reads: it may predate the mutation.
+        """
+        if not fresh:
+            value = self.cache.get(key)
+            if value is not MISSING:
+                return value
+        generation = self._generations.get(key, 0)
+        value = await self.get_json(path, generation=generation)
+        if self._generations.get(key, 0) == generation:
+            self.cache.set(key, value)
+        return value
+
+    def invalidate(self, *keys: tuple) -> None:
+        """Forget cached reads for ``keys`` and any still in flight."""
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        self.cache.discard(*keys)
+
+    def invalidate_connector(self, name: str) -> None:
+        """Forget cached reads that a mutation of ``name`` may have changed."""
+        self.invalidate(
+            ("connectors",),
+            ("connector_info", name),
+            ("connector_config", name),
+        )
+
+    @property
+    def policy(self) -> SafetyPolicy:
+        """The safety policy in force for this cluster."""
+        if self._policy_file is not None:
+            return self._policy_file.current()
+        assert self._policy is not None
+        return self._policy
+
+    def enforce_mutation_allowed(
+        self, *, tool: str, connector: str | None = None
+    ) -> None:
+        """Check ``tool`` against this cluster's own safety policy."""
+        self.policy.check(tool=tool, connector=connector, cluster=self.name)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pool": pool_stats(self._client),
+            "cache": self.cache.stats(),
+            "coalescing": self.inflight.stats(),
+            "routing": self.workers.stats(),
+            "retries": self.retry.stats(),
+            "circuit_breaker": self.breaker.stats(),
+            "mutations": self.mutations.stats(),
+            "policy": (
+                {"source": self.policy.source}
+                if self._policy_file is None
+                else self._policy_file.stats()
+            ),
+            "traces": self.traces.stats(),
+            "watcher": (
+                None if self._watcher is None else self._watcher.stats()
+            ),
+        }
+
+
+class ClusterRegistry:
+    """All configured clusters, addressable by name."""
+
+    def __init__(self, configs: list[ClusterConfig], default: str) -> None:
+        self._clusters = {config.name: Cluster(config) for config in configs}
+        if default not in self._clusters:
+            raise ValueError(f"Default cluster '{default}' is not defined")
+        self.default = default
+
+    @classmethod
+    def from_env(cls, default_url: str) -> ClusterRegistry:
+        """Load clusters from the environment.
+
+        Uses ``KAFKA_CONNECT_CLUSTERS_FILE`` or ``KAFKA_CONNECT_CLUSTERS``
+        when set, otherwise a single ``default`` cluster at
+        ``default_url``.
+        """
+        base = ClientSettings.from_env()
+        path = os.getenv("KAFKA_CONNECT_CLUSTERS_FILE")
+        inline = os.getenv("KAFKA_CONNECT_CLUSTERS")
+        if path:
+            document = _read_document(Path(path))
+        elif inline:
+            document = json.loads(inline)
+        else:
+            spec = {"url": default_url}
+            leader_url = os.getenv("KAFKA_CONNECT_LEADER_URL")
+            if leader_url:
+                spec["leader_url"] = leader_url
+            config = parse_cluster(DEFAULT_CLUSTER, spec, base)
+            return cls([config], DEFAULT_CLUSTER)
+        return cls(*load_cluster_configs(document, base))
+
+    def __iter__(self) -> Iterator[Cluster]:
+        return iter(self._clusters.values())
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._clusters)
+
+    def get(self, name: str | None = None) -> Cluster:
+        """Return the named cluster, or the default one."""
+        key = self.default if name is None else name
+        try:
+            return self._clusters[key]
+        except KeyError:
+            raise UnknownClusterError(key, self.names) from None
+
+    def select(self, names: list[str] | None = None) -> list[Cluster]:
+        """Return the named clusters, or all of them."""
+        if not names:
+            return list(self)
+        return [self.get(name) for name in names]
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(cluster.aclose() for cluster in self))
+
+
+async def fan_out(
+    clusters: list[Cluster], fn: Callable[[Cluster], Awaitable[T]]
+) -> tuple[dict[str, T], dict[str, str]]:
+    """Run ``fn`` against every cluster concurrently.
+
+    Returns ``(results, errors)`` keyed by cluster name so one unhealthy
+    cluster does not hide the answers from the others.
+    """
+    outcomes = await asyncio.gather(
+        *(fn(cluster) for cluster in clusters), return_exceptions=True
+    )
+    results: dict[str, T] = {}
+    errors: dict[str, str] = {}
+    for cluster, outcome in zip(clusters, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            errors[cluster.name] = f"{type(outcome).__name__}: {outcome}"
+        else:
+            results[cluster.name] = outcome
+    return results, errors
@@ -0,0 +1,128 @@
+"""Long-lived server that many stdio sessions share over a Unix socket.
+
+Every connection to the socket is one MCP session speaking the stdio
+framing (newline-delimited JSON-RPC), so ``kafka-connect-mcp-shim`` can
+forward an editor's stdin/stdout to it byte for byte.  All sessions share
+the process's cluster registry: one pooled client, read cache and
+watcher per cluster however many sessions are open.
+
+The daemon exits after ``idle_timeout`` seconds without sessions, and
+on SIGTERM or SIGINT, removing its socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import time
+
+from mcp.server.stdio import stdio_server
+
+from kafka_connect_mcp.server import mcp
+from kafka_connect_mcp.shim import try_connect
+
+logger = logging.getLogger(__name__)
+
+# Largest single JSON-RPC line accepted from a session.
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class _Connection:
+    """Line-oriented async file over a socket, as ``stdio_server`` expects."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    def __aiter__(self):
+        return self._reader.__aiter__()
+
+    async def write(self, data: str) -> None:
+        self._writer.write(data.encode())
+
+    async def flush(self) -> None:
+        await self._writer.drain()
+
+
+def _claim_socket(path: str) -> None:
+    """Remove a stale socket at ``path``, or fail if a daemon owns it."""
+    if not os.path.exists(path):
+        return
+    sock = try_connect(path)
+    if sock is not None:
+        sock.close()
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    os.unlink(path)
+
+
+async def serve(path: str, *, idle_timeout: float = 600.0) -> None:
+    """Serve MCP sessions on the Unix socket at ``path`` until stopped.
+
+    ``idle_timeout <= 0`` keeps the daemon running without sessions.
+    """
+    _claim_socket(path)
+    sessions = 0
+    last_active = time.monotonic()
+    stop = asyncio.Event()
+
+    async def session(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        nonlocal sessions, last_active
+        sessions += 1
+        conn = _Connection(reader, writer)
+        try:
+            # Same wiring as FastMCP.run_stdio_async, with the socket in
+            # place of the process's stdin and stdout.
+            async with stdio_server(stdin=conn, stdout=conn) as (read, write):
+                await mcp._mcp_server.run(
+                    read,
+                    write,
+                    mcp._mcp_server.create_initialization_options(),
+                )
+        except Exception:  # noqa: BLE001 - one session must not stop the rest
+            logger.exception("MCP session ended with an error")
+        finally:
+            sessions -= 1
+            last_active = time.monotonic()
+            writer.close()
+
+    loop = asyncio.get_running_loop()
+    signals = []
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+            signals.append(sig)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    async with mcp._lifespan_manager():
+        listener = await asyncio.start_unix_server(
+            session, path, limit=MAX_MESSAGE_BYTES
+        )
+        os.chmod(path, 0o600)
+        inode = os.stat(path).st_ino
+        logger.info("kafka-connect-mcp daemon listening on %s", path)
+        try:
+            async with listener:
+                while not stop.is_set():
+                    idle = time.monotonic() - last_active
+                    if sessions == 0 and 0 < idle_timeout <= idle:
+                        logger.info("No sessions for %.0fs, exiting", idle)
+                        break
+                    try:
+                        await asyncio.wait_for(stop.wait(), timeout=1.0)
+                    except TimeoutError:
+                        pass
+        finally:
+            for sig in signals:
+                loop.remove_signal_handler(sig)
+            try:
+                if os.stat(path).st_ino == inode:
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
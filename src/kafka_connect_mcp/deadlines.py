@@ -0,0 +1,244 @@
+"""Deadline budgets for tool calls.
+
+Every tool call runs under a deadline: ``KAFKA_CONNECT_TOOL_TIMEOUT``
+seconds, or the tool's own entry in ``KAFKA_CONNECT_TOOL_TIMEOUTS``
+(``restart_failed=300,get_cluster_snapshot=20``).  A client can shorten
+it for one call with ``timeout`` (seconds) in the request's ``_meta``,
+but not extend it past the tool's budget.
+
+The budget covers the whole call: admission queueing, every upstream
+attempt and the backoff between retries.  When it runs out the call is
+cancelled, exactly as when the client sends ``notifications/cancelled``,
+so in-flight Connect requests are aborted and their pooled connections
+freed at once instead of holding a slot until the read timeout.  Code
+below the tool reads what is left with :func:`remaining`.
+
+Work that outlives a call (health checks, the status watcher) runs in a
+:func:`detached_context` without a deadline.  Work shared between calls
+(coalesced requests) runs until the latest deadline among the calls
+waiting for it, so a short budget never cuts the retries of a caller
+with a longer one; each call still enforces its own by being cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from contextvars import Context, ContextVar, copy_context
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from kafka_connect_mcp.env import env_csv, env_float
+
+# Tools that wait or pace themselves on purpose get more room than the
+# default; wait_for_connector_state accepts a timeout of up to 600s.
+LONG_RUNNING_TOOLS: dict[str, float] = {
+    "wait_for_connector_state": 660.0,
+    "restart_failed": 600.0,
+    "apply_connectors": 1800.0,
+}
+
+
+class SharedDeadline:
+    """Deadline of work shared by several calls: the latest of theirs.
+
+    Shared work is only worth finishing while some call still waits for
+    it, so it runs until the last waiter's deadline, or without one when
+    any waiter has none.
+    """
+
+    def __init__(self) -> None:
+        self._deadlines: list[float | None] = []
+
+    def join(self) -> float | None:
+        """Add the current call as a waiter; pass the result to ``leave``."""
+        deadline = _current()
+        self._deadlines.append(deadline)
+        return deadline
+
+    def leave(self, deadline: float | None) -> None:
+        self._deadlines.remove(deadline)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    @property
+    def at(self) -> float | None:
+        if not self._deadlines or None in self._deadlines:
+            return None
+        return max(self._deadlines)
+
+
+# Event-loop time by which the current tool call must finish.
+_deadline: ContextVar[float | SharedDeadline | None] = ContextVar(
+    "kafka_connect_deadline", default=None
+)
+
+
+def _current() -> float | None:
+    deadline = _deadline.get()
+    if isinstance(deadline, SharedDeadline):
+        return deadline.at
+    return deadline
+
+
+def remaining() -> float | None:
+    """Seconds left before the current call's deadline, or ``None``."""
+    deadline = _current()
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+
+def expired() -> bool:
+    """Whether the current call has run past its deadline."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+# Cancel message for shared work abandoned by calls whose deadlines ran
+# out, so the work can tell that apart from a plain cancellation.
+_EXPIRED = "call deadline expired"
+
+
+def detached_context(shared: SharedDeadline | None = None) -> Context:
+    """Copy of the current context without the call's own deadline.
+
+    For tasks that outlive the current call (no deadline), or that are
+    shared between calls (the ``shared`` deadline of all waiters).
+    """
+    context = copy_context()
+    context.run(_deadline.set, shared)
+    return context
+
+
+def cancel_message() -> str | None:
+    """Message to cancel shared work with on behalf of the current call."""
+    return _EXPIRED if expired() else None
+
+
+def cancelled_by_deadline(error: asyncio.CancelledError) -> bool:
+    """Whether ``error`` comes from a deadline, here or in every waiter."""
+    return expired() or _EXPIRED in error.args
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a tool call does not finish within its budget."""
+
+    def __init__(self, *, tool: str, timeout: float) -> None:
+        self.details = {
+            "type": "deadline_exceeded",
+            "tool": tool,
+            "timeout": round(timeout, 2),
+        }
+        super().__init__(
+            f"Tool '{tool}' did not finish within {timeout:.1f}s; its "
+            "Connect requests were cancelled."
+        )
+
+
+def _parse_budgets(entries: set[str]) -> dict[str, float]:
+    budgets = {}
+    for entry in entries:
+        tool, sep, seconds = entry.partition("=")
+        if not sep:
+            raise ValueError(
+                f"KAFKA_CONNECT_TOOL_TIMEOUTS entry '{entry}' must look "
+                "like tool=seconds"
+            )
+        budgets[tool.strip()] = float(seconds)
+    return budgets
+
+
+@dataclass(frozen=True)
+class DeadlineSettings:
+    """Default and per-tool budgets in seconds; ``0`` means no deadline."""
+
+    default: float = 60.0
+    per_tool: Mapping[str, float] = field(
+        default_factory=lambda: dict(LONG_RUNNING_TOOLS)
+    )
+
+    @classmethod
+    def from_env(cls) -> DeadlineSettings:
+        """Build settings from ``KAFKA_CONNECT_TOOL_TIMEOUT(S)``."""
+        return cls(
+            default=env_float("KAFKA_CONNECT_TOOL_TIMEOUT", cls.default),
+            per_tool={
+                **LONG_RUNNING_TOOLS,
+                **_parse_budgets(env_csv("KAFKA_CONNECT_TOOL_TIMEOUTS")),
+            },
+        )
+
+    def budget(
+        self, tool: str, requested: float | None = None
+    ) -> float | None:
+        """Budget for one call of ``tool``; a request may only shorten it."""
+        budget = self.per_tool.get(tool, self.default)
+        if requested is not None and requested > 0:
+            budget = requested if budget <= 0 else min(budget, requested)
+        return budget if budget > 0 else None
+
+
+def _requested_timeout(context: MiddlewareContext) -> float | None:
+    """``timeout`` from the request's ``_meta``, if the client sent one."""
+    meta = getattr(context.message, "meta", None)
+    if not meta and context.fastmcp_context is not None:
+        request = context.fastmcp_context.request_context
+        meta = getattr(request, "meta", None)
+    if meta is None:
+        return None
+    # A plain mapping in newer MCP SDKs, a pydantic ``Meta`` model (extra
+    # fields as attributes) in older ones.
+    if isinstance(meta, Mapping):
+        value = meta.get("timeout")
+    else:
+        value = getattr(meta, "timeout", None)
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DeadlineMiddleware(Middleware):
+    """Cancel every tool call that outlives its deadline budget."""
+
+    def __init__(self, settings: DeadlineSettings | None = None) -> None:
+        self.settings = settings
+
+    def load(self) -> None:
+        """Read the budgets from the environment.
+
+        The server calls this at startup, so a malformed
+        ``KAFKA_CONNECT_TOOL_TIMEOUTS`` stops it there instead of failing
+        every tool call.
+        """
+        self.settings = DeadlineSettings.from_env()
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: Callable[..., Any]
+    ) -> Any:
+        if self.settings is None:
+            self.load()
+        tool = context.message.name
+        budget = self.settings.budget(tool, _requested_timeout(context))
+        if budget is None:
+            return await call_next(context)
+        deadline = asyncio.get_running_loop().time() + budget
+        token = _deadline.set(deadline)
+        timeout = asyncio.timeout_at(deadline)
+        try:
+            async with timeout:
+                return await call_next(context)
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            error = DeadlineExceededError(tool=tool, timeout=budget)
+            # Raised outside the tool, so FastMCP would not turn it into
+            # an error result on its own.
+            raise ToolError(str(error)) from error
+        finally:
+            _deadline.reset(token)
@@ -0,0 +1,45 @@
+"""Typed readers for ``KAFKA_CONNECT_*`` environment settings.
+
+Unset variables, and blank numeric ones, fall back to the default.
+``env`` replaces ``os.environ`` for callers that load settings from
+another mapping, such as a cluster's inline policy.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+
+
+def _get(name: str, env: Mapping[str, str] | None) -> str | None:
+    value = (os.environ if env is None else env).get(name)
+    if value is None or not value.strip():
+        return None
+    return value
+
+
+def env_int(name: str, default: int, env: Mapping[str, str] | None = None) -> int:
+    value = _get(name, env)
+    return default if value is None else int(value)
+
+
+def env_float(
+    name: str, default: float, env: Mapping[str, str] | None = None
+) -> float:
+    value = _get(name, env)
+    return default if value is None else float(value)
+
+
+def env_bool(
+    name: str, default: bool, env: Mapping[str, str] | None = None
+) -> bool:
+    value = (os.environ if env is None else env).get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def env_csv(name: str, env: Mapping[str, str] | None = None) -> set[str]:
+    raw = (os.environ if env is None else env).get(name, "")
+    values = (v.strip() for v in raw.split(","))
+    return {v for v in values if v}
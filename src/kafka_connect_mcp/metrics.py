@@ -0,0 +1,346 @@
+"""In-process metrics with Prometheus text exposition.
+
+Tool calls and upstream Connect requests are timed on the hot path into
+a small registry of counters and histograms; per-cluster state (pool,
+cache, retries, breaker, write admission) is read at scrape time by
+collectors.  :func:`render` produces the Prometheus text format served at
+``/metrics`` by the HTTP transports.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from kafka_connect_mcp.telemetry import span
+
+if TYPE_CHECKING:
+    import httpx
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow
+# validations on busy workers.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0,
+)  # fmt: skip
+
+Labels = tuple[str, ...]
+# (name, help, type, [(labels, value)]) produced by a collector at scrape time.
+Sample = tuple[str, str, str, list[tuple[dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *values: str, amount: float = 1.0) -> None:
+        self._values[values] = self._values.get(values, 0.0) + amount
+
+    def value(self, *values: str) -> float:
+        return self._values.get(values, 0.0)
+
+    def lines(self) -> Iterable[str]:
+        for values, total in sorted(self._values.items()):
+            labels = dict(zip(self.labels, values, strict=True))
+            yield f"{self.name}{_format_labels(labels)} {_number(total)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # values -> [bucket counts..., +Inf count, sum]
+        self._series: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, *values: str) -> None:
+        series = self._series.get(values)
+        if series is None:
+            series = self._series[values] = [0.0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *values: str) -> int:
+        series = self._series.get(values)
+        return 0 if series is None else int(sum(series[:-1]))
+
+    def lines(self) -> Iterable[str]:
+        for values, series in sorted(self._series.items()):
+            labels = dict(zip(self.labels, values, strict=True))
+            running = 0.0
+            for bound, count in zip(
+                (*self.buckets, float("inf")), series[:-1], strict=True
+            ):
+                running += count
+                bucket = _format_labels({**labels, "le": _number(bound)})
+                yield f"{self.name}_bucket{bucket} {_number(running)}"
+            yield f"{self.name}_sum{_format_labels(labels)} {series[-1]!r}"
+            yield f"{self.name}_count{_format_labels(labels)} {_number(running)}"
+
+
+class Registry:
+    """Named metrics plus scrape-time collectors."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._collectors: list[Callable[[], Iterable[Sample]]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric = self._metrics.setdefault(name, Counter(name, help, labels))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = ()
+    ) -> Histogram:
+        metric = self._metrics.setdefault(name, Histogram(name, help, labels))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        out: list[str] = []
+        for metric in self._metrics.values():
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+        for collector in self._collectors:
+            for name, help, kind, samples in collector():
+                out.append(f"# HELP {name} {help}")
+                out.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    out.append(f"{name}{_format_labels(labels)} {_number(value)}")
+        return "\n".join(out) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_CALLS = REGISTRY.counter(
+    "kafka_connect_mcp_tool_calls_total", "MCP tool calls.", ("tool",)
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "kafka_connect_mcp_tool_errors_total",
+    "MCP tool calls that raised an error.",
+    ("tool", "error"),
+)
+TOOL_LATENCY = REGISTRY.histogram(
+    "kafka_connect_mcp_tool_duration_seconds",
+    "MCP tool call latency.",
+    ("tool",),
+)
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "kafka_connect_mcp_upstream_requests_total",
+    "Requests sent to Connect workers.",
+    ("cluster", "method", "endpoint", "status"),
+)
+UPSTREAM_LATENCY = REGISTRY.histogram(
+    "kafka_connect_mcp_upstream_duration_seconds",
+    "Total latency of requests to Connect workers.",
+    ("cluster", "method", "endpoint"),
+)
+UPSTREAM_PHASES = REGISTRY.histogram(
+    "kafka_connect_mcp_upstream_phase_seconds",
+    "Latency of each phase of a Connect request "
+    "(connect, tls, ttfb, body); connect/tls only for new connections.",
+    ("cluster", "endpoint", "phase"),
+)
+
+_ENDPOINT_RULES = (
+    (re.compile(r"^/connectors/[^/]+"), "/connectors/{name}"),
+    (re.compile(r"/tasks/\d+"), "/tasks/{id}"),
+    (re.compile(r"^/connector-plugins/[^/]+"), "/connector-plugins/{plugin}"),
+)
+
+
+def endpoint_template(path: str) -> str:
+    """Low-cardinality endpoint label for a Connect REST path."""
+    path = path.split("?", 1)[0]
+    for pattern, replacement in _ENDPOINT_RULES:
+        path = pattern.sub(replacement, path, count=1)
+    return path
+
+
+# httpcore trace events that open and close each timed phase.
+_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "receive_response_body": "body",
+}
+
+
+class RequestTimer:
+    """Collects httpcore trace events for one request.
+
+    Pass :meth:`trace` as the ``trace`` request extension; phase
+    durations are available in :attr:`phases` once the response body has
+    been read.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
+
+    async def trace(self, event: str, info: dict[str, Any]) -> None:
+        name, _, stage = event.rpartition(".")
+        key = name.split(".", 1)[1] if name.startswith("http") else name
+        now = self._clock()
+        if key == "send_request_headers" and stage == "started":
+            self._started["ttfb"] = now
+        elif key == "receive_response_headers" and stage == "complete":
+            if "ttfb" in self._started:
+                self.phases["ttfb"] = now - self._started.pop("ttfb")
+        phase = _PHASES.get(key)
+        if phase is None:
+            return
+        if stage == "started":
+            self._started[phase] = now
+        elif stage == "complete" and phase in self._started:
+            self.phases[phase] = now - self._started.pop(phase)
+
+
+def record_upstream(
+    cluster: str,
+    method: str,
+    path: str,
+    elapsed: float,
+    response: httpx.Response | None,
+    timer: RequestTimer,
+) -> None:
+    """Record one request to a Connect worker."""
+    endpoint = endpoint_template(path)
+    status = "error" if response is None else str(response.status_code)
+    UPSTREAM_REQUESTS.inc(cluster, method, endpoint, status)
+    UPSTREAM_LATENCY.observe(elapsed, cluster, method, endpoint)
+    for phase, seconds in timer.phases.items():
+        UPSTREAM_PHASES.observe(seconds, cluster, endpoint, phase)
+
+
+def pool_stats(client: httpx.AsyncClient | None) -> dict[str, int]:
+    """Open and idle connections in a client's pool (best effort)."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", ()))
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {"connections": len(connections), "idle": idle}
+
+
+# Per-cluster gauges and counters read from ``Cluster.stats()`` at
+# scrape time: (metric, help, type, path into the stats dict).
+CLUSTER_METRICS = (
+    ("pool_connections", "Open connections in the pool.", "gauge",
+     ("pool", "connections")),
+    ("pool_idle_connections", "Idle connections in the pool.", "gauge",
+     ("pool", "idle")),
+    ("cache_entries", "Entries in the read cache.", "gauge",
+     ("cache", "entries")),
+    ("cache_hits_total", "Read cache hits.", "counter", ("cache", "hits")),
+    ("cache_misses_total", "Read cache misses.", "counter",
+     ("cache", "misses")),
+    ("cache_evictions_total", "Read cache evictions.", "counter",
+     ("cache", "evictions")),
+    ("coalesced_requests_total", "GETs served by an in-flight request.",
+     "counter", ("coalescing", "coalesced")),
+    ("abandoned_requests_total",
+     "Upstream GETs cancelled because every caller went away.", "counter",
+     ("coalescing", "abandoned")),
+    ("retries_total", "Retried upstream requests.", "counter",
+     ("retries", "retries")),
+    ("retry_giveups_total", "Requests that gave up after retries.",
+     "counter", ("retries", "giveups")),
+    ("circuit_breaker_opens_total", "Times the circuit breaker opened.",
+     "counter", ("circuit_breaker", "opens")),
+    ("mutations_in_flight", "Writes currently admitted.", "gauge",
+     ("mutations", "in_flight")),
+    ("mutation_queue_depth", "Writes waiting for admission.", "gauge",
+     ("mutations", "queued")),
+    ("mutations_rejected_total", "Writes rejected by admission control.",
+     "counter", ("mutations", "rejected")),
+    ("mutation_wait_seconds_total", "Time writes spent queued.", "counter",
+     ("mutations", "wait_seconds_total")),
+)  # fmt: skip
+
+
+def cluster_samples(stats: dict[str, dict[str, Any]]) -> Iterable[Sample]:
+    """Samples for :data:`CLUSTER_METRICS` from per-cluster stats."""
+    for suffix, help, kind, (section, key) in CLUSTER_METRICS:
+        samples = [
+            ({"cluster": cluster}, float(values[section][key]))
+            for cluster, values in stats.items()
+            if values.get(section) and key in values[section]
+        ]
+        yield f"kafka_connect_mcp_{suffix}", help, kind, samples
+    yield (
+        "kafka_connect_mcp_circuit_breaker_open",
+        "1 while the circuit breaker is open or half-open.",
+        "gauge",
+        [
+            (
+                {"cluster": cluster},
+                float(values["circuit_breaker"]["state"] != "closed"),
+            )
+            for cluster, values in stats.items()
+        ],
+    )
+
+
+class MetricsMiddleware(Middleware):
+    """Count and time every MCP tool call (and trace it when enabled)."""
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: Callable[..., Any]
+    ) -> Any:
+        tool = context.message.name
+        TOOL_CALLS.inc(tool)
+        start = time.perf_counter()
+        try:
+            with span(f"tool {tool}", **{"mcp.tool": tool}):
+                return await call_next(context)
+        except Exception as exc:
+            # FastMCP wraps tool exceptions in ToolError; label the cause.
+            cause = exc.__cause__ or exc
+            TOOL_ERRORS.inc(tool, type(cause).__name__)
+            raise
+        finally:
+            TOOL_LATENCY.observe(time.perf_counter() - start, tool)
@@ -0,0 +1,52 @@
+"""Merge patches and diffs for connector configurations.
+
+Every ``PUT /connectors/{name}/config`` restarts the connector and often
+triggers a group rebalance, even when nothing changed.  These helpers let
+the patch tool apply a JSON merge patch (RFC 7396) to the current config
+and skip the PUT when the result is identical.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def config_value(value: Any) -> str:
+    """Connect's string form of a config value (it stores only strings)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def merge_patch(
+    current: dict[str, Any], patch: dict[str, Any]
+) -> dict[str, str]:
+    """Apply ``patch`` to ``current``; a ``None`` value removes the key."""
+    merged = {k: config_value(v) for k, v in current.items()}
+    for key, value in patch.items():
+        if value is None:
+            merged.pop(key, None)
+        else:
+            merged[key] = config_value(value)
+    return merged
+
+
+def config_diff(
+    old: dict[str, Any], new: dict[str, Any]
+) -> dict[str, Any]:
+    """Keys added, removed and changed between two configs."""
+    old = {k: config_value(v) for k, v in old.items()}
+    new = {k: config_value(v) for k, v in new.items()}
+    return {
+        "added": {k: new[k] for k in sorted(new.keys() - old.keys())},
+        "removed": sorted(old.keys() - new.keys()),
+        "changed": {
+            k: {"from": old[k], "to": new[k]}
+            for k in sorted(old.keys() & new.keys())
+            if old[k] != new[k]
+        },
+    }
+
+
+def is_empty(diff: dict[str, Any]) -> bool:
+    return not (diff["added"] or diff["removed"] or diff["changed"])
@@ -0,0 +1,124 @@
+"""Local pre-validation of connector configs against plugin definitions.
+
+``PUT /connector-plugins/{class}/config/validate`` runs on a Connect
+worker and can take seconds for heavy plugins (JDBC, Debezium).  The
+plugin catalog (``GET /connector-plugins``) and each plugin's config
+definition (``GET /connector-plugins/{class}/config``) rarely change, so
+they are cached and used to catch the cheap mistakes locally first:
+missing required keys, values of the wrong type and unknown keys.
+
+The definition endpoint does not expose validators or recommended
+values, so range and enum checks are left to the remote validation.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Keys Connect accepts for every connector; they are not part of a
+# plugin's own definition.
+COMMON_KEYS = frozenset(
+    {
+        "name",
+        "connector.class",
+        "tasks.max",
+        "tasks.max.enforce",
+        "topics",
+        "topics.regex",
+        "key.converter",
+        "value.converter",
+        "header.converter",
+        "config.action.reload",
+        "transforms",
+        "predicates",
+        "exactly.once.support",
+        "transaction.boundary",
+        "transaction.boundary.interval.ms",
+        "offsets.storage.topic",
+    }
+)
+COMMON_PREFIXES = (
+    "errors.",
+    "transforms.",
+    "predicates.",
+    "key.converter.",
+    "value.converter.",
+    "header.converter.",
+    "consumer.override.",
+    "producer.override.",
+    "admin.override.",
+    "topic.creation.",
+)
+
+_INTEGER_TYPES = {"INT", "SHORT", "LONG"}
+_BOOLEANS = {"true", "false"}
+
+
+def find_plugin(
+    catalog: list[dict[str, Any]], plugin_class: str
+) -> dict[str, Any] | None:
+    """Catalog entry for a full class name or Connect's short aliases."""
+    for plugin in catalog:
+        cls = plugin.get("class", "")
+        simple = cls.rsplit(".", 1)[-1]
+        aliases = {cls, simple, simple.removesuffix("Connector")}
+        if plugin_class in aliases:
+            return plugin
+    return None
+
+
+def _type_error(kind: str, value: Any) -> str | None:
+    text = str(value).strip()
+    if kind in _INTEGER_TYPES:
+        if isinstance(value, bool):
+            return f"Expected an integer ({kind}), got {value!r}"
+        try:
+            int(text)
+        except ValueError:
+            return f"Expected an integer ({kind}), got {value!r}"
+    elif kind == "DOUBLE":
+        try:
+            float(text)
+        except ValueError:
+            return f"Expected a number (DOUBLE), got {value!r}"
+    elif kind == "BOOLEAN":
+        if not isinstance(value, bool) and text.lower() not in _BOOLEANS:
+            return f"Expected true or false, got {value!r}"
+    return None
+
+
+def _is_common(key: str) -> bool:
+    return key in COMMON_KEYS or key.startswith(COMMON_PREFIXES)
+
+
+def check_config(
+    definition: list[dict[str, Any]], config: dict[str, Any]
+) -> dict[str, Any]:
+    """Check ``config`` against a plugin's config definition.
+
+    Returns ``errors`` (missing required keys, type mismatches) and
+    ``warnings`` (keys neither the plugin nor Connect itself defines;
+    Connect ignores these, so they are often typos), both keyed by
+    config name.
+    """
+    errors: dict[str, list[str]] = {}
+    warnings: dict[str, list[str]] = {}
+    keys = {}
+    for key in definition:
+        keys[key["name"]] = key
+        value = config.get(key["name"])
+        if value is None or str(value) == "":
+            if key.get("required") and key.get("default_value") is None:
+                errors.setdefault(key["name"], []).append(
+                    "Missing required configuration"
+                )
+            continue
+        problem = _type_error(str(key.get("type", "")).upper(), value)
+        if problem:
+            errors.setdefault(key["name"], []).append(problem)
+    for name in config:
+        if name not in keys and not _is_common(name):
+            warnings.setdefault(name, []).append(
+                "Unknown configuration; Connect will ignore it"
+            )
+    return {"errors": errors, "warnings": warnings}
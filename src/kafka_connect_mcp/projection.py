@@ -0,0 +1,146 @@
+"""Paging and field projection for tool results.
+
+List tools take ``limit``/``cursor``: items are sorted by name and the
+cursor is the name of the last item returned, so pages stay consistent
+while connectors are added or removed between calls.  Detail tools take
+``fields``, a list of paths such as ``config.connector.class`` or
+``tasks[*].state``, and return only those parts of the payload.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+_INDEX = re.compile(r"^(?P<key>[^\[\]]*)(?P<index>(\[(\*|\d+)\])*)$")
+_MISSING = object()
+
+MAX_LIMIT = 1000
+
+
+def paginate(
+    items: list[Any],
+    *,
+    limit: int | None,
+    cursor: str | None,
+    key: Callable[[Any], str] = str,
+) -> tuple[list[Any], str | None]:
+    """One page of ``items`` (sorted by ``key``) after ``cursor``.
+
+    Returns the page and the cursor for the next one, or ``None`` when
+    this was the last page.
+    """
+    ordered = sorted(items, key=key)
+    if cursor is not None:
+        ordered = [item for item in ordered if key(item) > cursor]
+    if limit is None:
+        return ordered, None
+    limit = min(max(limit, 1), MAX_LIMIT)
+    page = ordered[:limit]
+    more = len(ordered) > limit
+    return page, key(page[-1]) if more else None
+
+
+def _tokens(path: str) -> list[tuple[str, list[str]]]:
+    """Split a path into (segment, [index, ...]) pairs."""
+    tokens = []
+    for part in path.split("."):
+        match = _INDEX.match(part)
+        if match is None:
+            raise ValueError(f"Invalid field path '{path}'")
+        indexes = re.findall(r"\[(\*|\d+)\]", match["index"])
+        tokens.append((match["key"], indexes))
+    return tokens
+
+
+def _extract(node: Any, tokens: list[tuple[str, list[str]]]) -> Any:
+    if not tokens:
+        return node
+    if isinstance(node, list):
+        return _extract_list(node, ["*"], tokens)
+    if not isinstance(node, dict):
+        return _MISSING
+    # Connect config keys contain dots ("connector.class"), so match the
+    # longest run of segments that names an existing key.
+    for end in range(len(tokens), 0, -1):
+        # Indexes may only follow the last segment of a key.
+        if any(indexes for _, indexes in tokens[: end - 1]):
+            continue
+        name = ".".join(segment for segment, _ in tokens[:end])
+        if name not in node:
+            continue
+        value = node[name]
+        indexes = tokens[end - 1][1]
+        rest = tokens[end:]
+        if indexes:
+            if not isinstance(value, list):
+                return _MISSING
+            value = _extract_list(value, indexes, rest)
+        else:
+            value = _extract(value, rest)
+        if value is _MISSING:
+            return _MISSING
+        return {name: value}
+    return _MISSING
+
+
+def _extract_list(
+    items: list[Any], indexes: list[str], rest: list[tuple[str, list[str]]]
+) -> Any:
+    index, deeper = indexes[0], indexes[1:]
+
+    def inner(item: Any) -> Any:
+        if deeper:
+            if not isinstance(item, list):
+                return _MISSING
+            return _extract_list(item, deeper, rest)
+        return _extract(item, rest)
+
+    if index == "*":
+        return [inner(item) for item in items]
+    position = int(index)
+    if position >= len(items):
+        return _MISSING
+    return {position: inner(items[position])}
+
+
+def _merge(a: Any, b: Any) -> Any:
+    if a is _MISSING:
+        return b
+    if b is _MISSING:
+        return a
+    if isinstance(a, dict) and isinstance(b, dict):
+        merged = dict(a)
+        for key, value in b.items():
+            merged[key] = _merge(merged.get(key, _MISSING), value)
+        return merged
+    if isinstance(a, list) and isinstance(b, list):
+        return [_merge(x, y) for x, y in zip(a, b, strict=False)]
+    return b
+
+
+def _finish(node: Any) -> Any:
+    if isinstance(node, dict):
+        if node and all(isinstance(k, int) for k in node):
+            return [_finish(node[k]) for k in sorted(node)]
+        return {k: _finish(v) for k, v in node.items() if v is not _MISSING}
+    if isinstance(node, list):
+        return [_finish(v) for v in node if v is not _MISSING]
+    return node
+
+
+def project(payload: Any, fields: list[str] | None) -> Any:
+    """The parts of ``payload`` named by ``fields``.
+
+    Paths use dots between keys (keys that themselves contain dots, like
+    ``connector.class``, are matched whole), ``[*]`` for every list item
+    and ``[n]`` for one.  Paths that do not exist are left out.
+    ``fields=None`` returns ``payload`` unchanged.
+    """
+    if not fields:
+        return payload
+    result: Any = _MISSING
+    for path in fields:
+        result = _merge(result, _extract(payload, _tokens(path)))
+    return {} if result is _MISSING else _finish(result)
@@ -0,0 +1,70 @@
+"""Token-bucket rate limiting for bursts of Connect requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second with bursts up to ``burst``.
+
+    ``rate <= 0`` disables limiting.  Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right now."""
+        if self.rate <= 0:
+            return True
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next token is available."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await self._sleep(delay)
+                self._refill()
+            self._tokens -= 1
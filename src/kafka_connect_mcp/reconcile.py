@@ -0,0 +1,174 @@
+"""Plan and apply a desired-state manifest of connectors.
+
+A manifest maps connector names to their full desired config.  It is
+diffed against the live configs (one expanded ``/connectors`` call) into
+per-connector steps, which are then carried out a few at a time with a
+pause between batches so that a large rollout does not set off a storm of
+back-to-back rebalances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from kafka_connect_mcp.admission import MutationRejectedError
+from kafka_connect_mcp.patching import config_diff, config_value, is_empty
+from kafka_connect_mcp.resilience import UpstreamUnavailableError
+from kafka_connect_mcp.safety import PolicyBlockedError
+
+if TYPE_CHECKING:
+    from kafka_connect_mcp.clusters import Cluster
+
+# The tool whose policy governs each action.
+ACTION_TOOLS = {
+    "create": "create_connector",
+    "update": "update_connector_config",
+    "delete": "delete_connector",
+}
+
+
+async def live_configs(cluster: Cluster) -> dict[str, dict[str, str]]:
+    """Current config of every connector on ``cluster``."""
+    payload = await cluster.get_json("/connectors", params=[("expand", "info")])
+    return {
+        name: (entry.get("info") or {}).get("config") or {}
+        for name, entry in payload.items()
+    }
+
+
+def _desired(name: str, config: dict[str, Any]) -> dict[str, str]:
+    # Connect echoes the name back inside the config; include it so that
+    # manifests without it do not show a spurious diff.
+    return {"name": name, **{k: config_value(v) for k, v in config.items()}}
+
+
+def plan_changes(
+    desired: dict[str, dict[str, Any]],
+    live: dict[str, dict[str, str]],
+    *,
+    prune: bool = False,
+) -> list[dict[str, Any]]:
+    """Steps that take ``live`` to ``desired``, sorted by connector name.
+
+    Connectors that are live but absent from the manifest are deleted
+    only when ``prune`` is set.
+    """
+    steps = []
+    for name in sorted(desired.keys() | live.keys()):
+        if name not in desired:
+            if prune:
+                steps.append({"name": name, "action": "delete"})
+            continue
+        config = _desired(name, desired[name])
+        if name not in live:
+            steps.append({"name": name, "action": "create", "config": config})
+            continue
+        diff = config_diff(live[name], config)
+        action = "unchanged" if is_empty(diff) else "update"
+        steps.append(
+            {"name": name, "action": action, "config": config, "diff": diff}
+        )
+    return steps
+
+
+def check_policy(cluster: Cluster, steps: list[dict[str, Any]]) -> None:
+    """Mark the steps the safety policy would block, in place."""
+    for step in steps:
+        tool = ACTION_TOOLS.get(step["action"])
+        if tool is None:
+            continue
+        try:
+            cluster.enforce_mutation_allowed(tool=tool, connector=step["name"])
+        except PolicyBlockedError as exc:
+            step["blocked"] = exc.details
+
+
+def summarize_steps(steps: list[dict[str, Any]], field: str) -> dict[str, int]:
+    return dict(Counter(step[field] for step in steps))
+
+
+async def _apply_step(cluster: Cluster, step: dict[str, Any]) -> dict[str, Any]:
+    name, action = step["name"], step["action"]
+    result: dict[str, Any] = {"name": name, "action": action}
+    try:
+        cluster.enforce_mutation_allowed(
+            tool=ACTION_TOOLS[action], connector=name
+        )
+        async with cluster.mutations.admit(name):
+            if action == "create":
+                resp = await cluster.request(
+                    "POST",
+                    "/connectors",
+                    json={"name": name, "config": step["config"]},
+                )
+            elif action == "update":
+                resp = await cluster.request(
+                    "PUT",
+                    f"/connectors/{name}/config",
+                    json=step["config"],
+                    idempotent=True,
+                )
+            else:
+                resp = await cluster.request("DELETE", f"/connectors/{name}")
+        resp.raise_for_status()
+    except PolicyBlockedError as exc:
+        result.update(result="blocked", error=exc.details)
+        return result
+    except MutationRejectedError as exc:
+        result.update(result="rejected", error=exc.details)
+        return result
+    except httpx.HTTPStatusError as exc:
+        result.update(result="error", error=_message(exc.response))
+        return result
+    except (UpstreamUnavailableError, httpx.TransportError) as exc:
+        result.update(result="error", error=str(exc))
+        return result
+    finally:
+        cluster.invalidate_connector(name)
+    result["result"] = "ok"
+    return result
+
+
+def _message(resp: httpx.Response) -> str:
+    try:
+        message = resp.json().get("message")
+    except ValueError:
+        message = None
+    return f"HTTP {resp.status_code}: {message or resp.text}"
+
+
+async def apply_steps(
+    cluster: Cluster,
+    steps: list[dict[str, Any]],
+    *,
+    concurrency: int = 4,
+    batch_pause: float = 2.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> list[dict[str, Any]]:
+    """Carry out ``steps`` in batches of ``concurrency``.
+
+    Steps within a batch run concurrently; ``batch_pause`` seconds pass
+    between batches so the worker group can settle.  A failed or blocked
+    step is reported and does not stop the others.
+    """
+    concurrency = max(1, concurrency)
+    pending = [s for s in steps if s["action"] != "unchanged"]
+    results = {
+        s["name"]: {"name": s["name"], "action": s["action"], "result": "skipped"}
+        for s in steps
+        if s["action"] == "unchanged"
+    }
+    for start in range(0, len(pending), concurrency):
+        if start:
+            await sleep(batch_pause)
+        batch = pending[start : start + concurrency]
+        for result in await asyncio.gather(
+            *(_apply_step(cluster, step) for step in batch)
+        ):
+            results[result["name"]] = result
+    return [results[s["name"]] for s in steps]
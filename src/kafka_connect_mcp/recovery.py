@@ -0,0 +1,162 @@
+"""Bulk restart of failed connectors and tasks.
+
+After a broker or network outage hundreds of tasks can be FAILED at once.
+:func:`find_failed` picks them out of one expanded ``/connectors``
+payload and :func:`restart_targets` restarts them with as few calls as
+possible: one ``restart?includeTasks=true&onlyFailed=true`` per connector
+when every failed instance was selected, individual task restarts when a
+filter selected only some of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from kafka_connect_mcp.admission import MutationRejectedError
+from kafka_connect_mcp.ratelimit import TokenBucket
+from kafka_connect_mcp.resilience import UpstreamUnavailableError
+from kafka_connect_mcp.safety import PolicyBlockedError
+
+if TYPE_CHECKING:
+    from kafka_connect_mcp.clusters import Cluster
+
+
+def _failed(instance: dict[str, Any]) -> bool:
+    return str(instance.get("state", "")).upper() == "FAILED"
+
+
+def find_failed(
+    payload: dict[str, Any],
+    *,
+    name_glob: str | None = None,
+    trace_pattern: str | None = None,
+) -> list[dict[str, Any]]:
+    """Failed connectors and tasks in an ``expand=status`` payload.
+
+    ``trace_pattern`` is a regular expression searched in each failed
+    instance's stack trace; instances whose trace does not match are left
+    out.  Each result notes whether the selection covers every failed
+    instance of the connector (``all_failed``).
+    """
+    try:
+        pattern = re.compile(trace_pattern) if trace_pattern else None
+    except re.error as exc:
+        raise ValueError(f"Invalid trace_pattern: {exc}") from None
+
+    def selected(instance: dict[str, Any]) -> bool:
+        return _failed(instance) and (
+            pattern is None or bool(pattern.search(instance.get("trace") or ""))
+        )
+
+    found = []
+    for name in sorted(payload):
+        if name_glob is not None and not fnmatchcase(name, name_glob):
+            continue
+        status = payload[name].get("status") or {}
+        connector = status.get("connector") or {}
+        tasks = status.get("tasks") or []
+        connector_failed = selected(connector)
+        task_ids = [t.get("id") for t in tasks if selected(t)]
+        if not connector_failed and not task_ids:
+            continue
+        failed_total = _failed(connector) + sum(_failed(t) for t in tasks)
+        found.append(
+            {
+                "name": name,
+                "connector": connector_failed,
+                "tasks": task_ids,
+                "all_failed": connector_failed + len(task_ids)
+                == failed_total,
+            }
+        )
+    return found
+
+
+async def _restart_one(
+    cluster: Cluster, target: dict[str, Any], bucket: TokenBucket
+) -> dict[str, Any]:
+    name = target["name"]
+    outcome: dict[str, Any] = {"name": name, "calls": 0, "tasks": 0}
+
+    async def post(path: str, **params: str) -> None:
+        await bucket.acquire()
+        async with cluster.mutations.admit(name):
+            outcome["calls"] += 1
+            resp = await cluster.request(
+                "POST", path, params=params, idempotent=bool(params)
+            )
+        resp.raise_for_status()
+
+    try:
+        if target["all_failed"]:
+            cluster.enforce_mutation_allowed(
+                tool="restart_connector", connector=name
+            )
+            await post(
+                f"/connectors/{name}/restart",
+                includeTasks="true",
+                onlyFailed="true",
+            )
+            outcome["tasks"] = len(target["tasks"])
+        else:
+            if target["connector"]:
+                cluster.enforce_mutation_allowed(
+                    tool="restart_connector", connector=name
+                )
+            if target["tasks"]:
+                cluster.enforce_mutation_allowed(
+                    tool="restart_task", connector=name
+                )
+            if target["connector"]:
+                await post(f"/connectors/{name}/restart")
+            for task_id in target["tasks"]:
+                await post(f"/connectors/{name}/tasks/{task_id}/restart")
+                outcome["tasks"] += 1
+    except PolicyBlockedError as exc:
+        outcome["blocked"] = exc.details["reason"]
+    except MutationRejectedError as exc:
+        outcome["error"] = str(exc)
+    except httpx.HTTPStatusError as exc:
+        outcome["error"] = f"HTTP {exc.response.status_code}"
+    except (UpstreamUnavailableError, httpx.TransportError) as exc:
+        outcome["error"] = str(exc)
+    if outcome["calls"]:
+        cluster.invalidate_connector(name)
+    return outcome
+
+
+async def restart_targets(
+    cluster: Cluster,
+    targets: list[dict[str, Any]],
+    *,
+    concurrency: int = 8,
+    rate: float = 5.0,
+) -> dict[str, Any]:
+    """Restart ``targets`` from :func:`find_failed` and summarize.
+
+    At most ``concurrency`` connectors are restarted at once and restart
+    calls are limited to ``rate`` per second across all of them.  Each
+    call is still admitted by the cluster's mutation scheduler, so the
+    cluster write rate and concurrency bound both settings from above.
+    """
+    bucket = TokenBucket(rate, burst=max(1, concurrency))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(target: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await _restart_one(cluster, target, bucket)
+
+    outcomes = await asyncio.gather(*(run(t) for t in targets))
+    ok = [o for o in outcomes if "blocked" not in o and "error" not in o]
+    return {
+        "restarted_connectors": len(ok),
+        "restarted_tasks": sum(o["tasks"] for o in ok),
+        "calls": sum(o["calls"] for o in outcomes),
+        "blocked": {o["name"]: o["blocked"] for o in outcomes if "blocked" in o},
+        "errors": {o["name"]: o["error"] for o in outcomes if "error" in o},
+    }
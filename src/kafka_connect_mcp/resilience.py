@@ -0,0 +1,328 @@
+"""Retries, backoff and circuit breaking for Kafka Connect requests.
+
+Connect answers ``409`` while the worker group is rebalancing and busy
+workers time out or return ``503``.  Surfacing those straight to the
+model makes it retry in a tight loop, which only prolongs the rebalance.
+:class:`RetryPolicy` retries them here with jittered exponential
+backoff, and :class:`CircuitBreaker` fails fast while a cluster keeps
+failing.  When a call finally gives up it raises
+:class:`UpstreamUnavailableError`, whose ``details`` tell the caller
+when to try again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from kafka_connect_mcp.deadlines import remaining
+from kafka_connect_mcp.env import env_float, env_int
+
+# Phrases Connect uses in 409 bodies when a request was rejected because
+# of a rebalance rather than a genuine conflict ("already exists").
+_REBALANCE_HINTS = (
+    "rebalance",
+    "stale configuration",
+    "conflicting operation",
+)
+
+# Transport failures where the request never reached Connect, so it is
+# safe to resend whatever the method.
+NOT_SENT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised when Connect stays unavailable after retries."""
+
+    def __init__(
+        self,
+        *,
+        cluster: str,
+        reason: str,
+        retry_after: float,
+        attempts: int = 0,
+        status: int | None = None,
+    ) -> None:
+        self.details = {
+            "type": "upstream_unavailable",
+            "cluster": cluster,
+            "reason": reason,
+            "retry_after": round(retry_after, 2),
+            "attempts": attempts,
+            "status": status,
+        }
+        super().__init__(
+            f"Cluster '{cluster}' is unavailable: {reason}. "
+            f"Retry after {retry_after:.1f}s."
+        )
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """Raised without contacting Connect while the breaker is open."""
+
+
+def is_rebalance_conflict(resp: httpx.Response) -> bool:
+    """Whether a 409 means "rebalance in progress" rather than a conflict."""
+    if resp.status_code != 409:
+        return False
+    try:
+        message = str(resp.json().get("message", ""))
+    except ValueError:
+        message = resp.text
+    message = message.lower()
+    return any(hint in message for hint in _REBALANCE_HINTS)
+
+
+def _retry_after_header(resp: httpx.Response) -> float | None:
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one cluster.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    every call fails fast for ``reset_timeout`` seconds.  It then lets a
+    single trial call through (half-open); success closes it again,
+    failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+        self.opens = 0
+        self.short_circuits = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        elapsed = self._clock() - self._opened_at
+        return max(0.0, self.reset_timeout - elapsed)
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now."""
+        if self.failure_threshold <= 0:
+            return True
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        self.short_circuits += 1
+        return False
+
+    def release(self) -> None:
+        """Free the half-open trial slot without a verdict.
+
+        For a trial call that was cancelled or failed for a reason that
+        says nothing about the cluster's health, so the next call can try.
+        """
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        was_trial = self._trial_in_flight
+        self._trial_in_flight = False
+        if was_trial or (
+            self.failure_threshold > 0
+            and self._opened_at is None
+            and self._failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
+            self.opens += 1
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opens": self.opens,
+            "short_circuits": self.short_circuits,
+        }
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff for transient Connect failures.
+
+    Rules:
+
+    * connection failures (request never sent) and ``409`` rebalance
+      rejections are retried for every method;
+    * ``503`` responses and timeouts after the request was sent are only
+      retried for idempotent calls: GETs, or calls the caller marked
+      ``idempotent`` (for example a restart with ``onlyFailed=true``).
+
+    Retries stop early when the backoff would outlast the tool call's
+    deadline (see :mod:`kafka_connect_mcp.deadlines`).
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.25
+    max_delay: float = 5.0
+    retries: int = 0
+    giveups: int = 0
+
+    @classmethod
+    def from_env(cls) -> RetryPolicy:
+        """Build a policy from ``KAFKA_CONNECT_RETRY_*`` variables."""
+        return cls(
+            max_attempts=env_int(
+                "KAFKA_CONNECT_RETRY_MAX_ATTEMPTS", cls.max_attempts
+            ),
+            base_delay=env_float(
+                "KAFKA_CONNECT_RETRY_BASE_DELAY", cls.base_delay
+            ),
+            max_delay=env_float(
+                "KAFKA_CONNECT_RETRY_MAX_DELAY", cls.max_delay
+            ),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def _should_retry(
+        self,
+        outcome: httpx.Response | BaseException,
+        idempotent: bool,
+    ) -> bool:
+        if isinstance(outcome, httpx.Response):
+            if is_rebalance_conflict(outcome):
+                return True
+            return outcome.status_code == 503 and idempotent
+        if isinstance(outcome, NOT_SENT_ERRORS):
+            return True
+        return isinstance(outcome, httpx.TransportError) and idempotent
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        cluster: str,
+        breaker: CircuitBreaker,
+        idempotent: bool,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> httpx.Response:
+        """Call ``send`` until it succeeds, is not retryable, or gives up."""
+        attempts = max(1, self.max_attempts)
+        attempt = 0
+        while True:
+            attempt += 1
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    cluster=cluster,
+                    reason="circuit breaker is open after repeated failures",
+                    retry_after=breaker.retry_after(),
+                    attempts=attempt - 1,
+                )
+            try:
+                outcome: httpx.Response | BaseException = await send()
+            except httpx.TransportError as exc:
+                outcome = exc
+            except BaseException:
+                # Cancelled (deadline, client) or a bug: without this the
+                # breaker would stay half-open with its trial never ending.
+                breaker.release()
+                raise
+
+            retryable = self._should_retry(outcome, idempotent)
+            if (
+                retryable
+                or isinstance(outcome, BaseException)
+                or outcome.status_code >= 500
+            ):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if not retryable:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                return outcome
+
+            delay = self.backoff(attempt)
+            if isinstance(outcome, httpx.Response):
+                hinted = _retry_after_header(outcome)
+                if hinted is not None:
+                    delay = min(self.max_delay, max(delay, hinted))
+            left = remaining()
+            if attempt >= attempts or (left is not None and delay >= left):
+                self.giveups += 1
+                raise _give_up(
+                    outcome,
+                    cluster=cluster,
+                    attempts=attempt,
+                    retry_after=max(delay, breaker.retry_after()),
+                )
+            self.retries += 1
+            await sleep(delay)
+
+    def stats(self) -> dict:
+        return {"retries": self.retries, "giveups": self.giveups}
+
+
+def _give_up(
+    outcome: httpx.Response | BaseException,
+    *,
+    cluster: str,
+    attempts: int,
+    retry_after: float,
+) -> UpstreamUnavailableError:
+    if isinstance(outcome, BaseException):
+        error = UpstreamUnavailableError(
+            cluster=cluster,
+            reason=f"{type(outcome).__name__}: {outcome}",
+            retry_after=retry_after,
+            attempts=attempts,
+        )
+        error.__cause__ = outcome
+        return error
+    reason = f"HTTP {outcome.status_code}"
+    if is_rebalance_conflict(outcome):
+        reason += " rebalance in progress"
+    return UpstreamUnavailableError(
+        cluster=cluster,
+        reason=reason,
+        retry_after=retry_after,
+        attempts=attempts,
+        status=outcome.status_code,
+    )
@@ -0,0 +1,206 @@
+"""Worker-aware request routing for a Kafka Connect cluster.
+
+Any worker can serve reads, and any worker forwards writes to the group
+leader.  Given several worker URLs, :class:`WorkerPool` spreads reads
+over healthy workers (round-robin or least observed latency), sends
+mutations to the leader when it is known, and fails over when a worker
+stops answering.  Connect's REST API does not advertise which worker is
+the leader, so the write target is the configured ``leader_url`` or,
+failing that, the first healthy worker in configured order; it stays
+sticky until that worker goes down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from kafka_connect_mcp.deadlines import detached_context
+
+ROUTING_STRATEGIES = ("round_robin", "least_latency")
+
+# Weight of the newest sample in the per-worker latency moving average.
+_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class Worker:
+    """Live routing state for one Connect worker."""
+
+    url: str
+    healthy: bool = True
+    latency: float | None = None
+    requests: int = 0
+    failures: int = 0
+    last_error: str | None = None
+    last_checked: float | None = None
+
+    def mark_up(self, seconds: float) -> None:
+        """Record a successful exchange that took ``seconds``."""
+        self.healthy = True
+        self.last_error = None
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += _EWMA_ALPHA * (seconds - self.latency)
+
+    def observe(self, seconds: float) -> None:
+        self.requests += 1
+        self.mark_up(seconds)
+
+    def mark_down(self, error: BaseException | str) -> None:
+        self.failures += 1
+        self.healthy = False
+        self.last_error = (
+            error
+            if isinstance(error, str)
+            else f"{type(error).__name__}: {error}"
+        )
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "latency_ms": (
+                None if self.latency is None else round(self.latency * 1e3, 2)
+            ),
+            "requests": self.requests,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+
+class WorkerPool:
+    """Choose which worker of a cluster serves each request."""
+
+    def __init__(
+        self,
+        urls: tuple[str, ...] | list[str],
+        *,
+        strategy: str = "round_robin",
+        leader_url: str | None = None,
+        health_check_interval: float = 10.0,
+    ) -> None:
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(
+                f"Unknown routing strategy '{strategy}'; "
+                f"expected one of {', '.join(ROUTING_STRATEGIES)}"
+            )
+        self.workers = [Worker(url.rstrip("/")) for url in urls]
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+        self._rr = itertools.count()
+        self._leader: Worker | None = None
+        if leader_url is not None:
+            self._leader = self._find_or_add(leader_url.rstrip("/"))
+        self._health_task: asyncio.Task[None] | None = None
+
+    def _find_or_add(self, url: str) -> Worker:
+        for worker in self.workers:
+            if worker.url == url:
+                return worker
+        worker = Worker(url)
+        self.workers.append(worker)
+        return worker
+
+    @property
+    def leader(self) -> Worker | None:
+        return self._leader
+
+    def _ordered(self, preferred: Worker | None) -> list[Worker]:
+        """Preferred worker first, then other healthy, then unhealthy."""
+        rest = [w for w in self.workers if w is not preferred]
+        healthy = [w for w in rest if w.healthy]
+        down = [w for w in rest if not w.healthy]
+        if preferred is None:
+            return healthy + down
+        if not preferred.healthy:
+            return healthy + [preferred] + down
+        return [preferred] + healthy + down
+
+    def read_candidates(self) -> list[Worker]:
+        """Workers to try for a read, best first."""
+        healthy = [w for w in self.workers if w.healthy]
+        if not healthy:
+            return list(self.workers)
+        if self.strategy == "least_latency":
+            # Unmeasured workers sort first so they get probed.
+            preferred = min(
+                healthy,
+                key=lambda w: -1.0 if w.latency is None else w.latency,
+            )
+        else:
+            preferred = healthy[next(self._rr) % len(healthy)]
+        return self._ordered(preferred)
+
+    def write_candidates(self) -> list[Worker]:
+        """Workers to try for a mutation: the leader first, then failover."""
+        target = self._leader
+        if target is None or not target.healthy:
+            target = next((w for w in self.workers if w.healthy), None)
+        return self._ordered(target)
+
+    # ── Health checks ─────────────────────────────────────────
+
+    def start_health_checks(
+        self, check: Callable[[Worker], Awaitable[None]]
+    ) -> None:
+        """Probe every worker in the background with ``check``.
+
+        ``check`` should raise when the worker is unhealthy.  Nothing is
+        started for a single-worker pool or when the interval is zero.
+        """
+        if (
+            len(self.workers) < 2
+            or self.health_check_interval <= 0
+            or (
+                self._health_task is not None
+                and not self._health_task.done()
+            )
+        ):
+            return
+        # Started from a tool call; the checks outlive its deadline.
+        self._health_task = asyncio.get_running_loop().create_task(
+            self._health_loop(check), context=detached_context()
+        )
+
+    async def check_all(
+        self, check: Callable[[Worker], Awaitable[None]]
+    ) -> None:
+        async def probe(worker: Worker) -> None:
+            start = time.monotonic()
+            try:
+                await check(worker)
+            except Exception as exc:  # noqa: BLE001 - any failure marks down
+                worker.mark_down(exc)
+            else:
+                worker.mark_up(time.monotonic() - start)
+            worker.last_checked = time.time()
+
+        await asyncio.gather(*(probe(w) for w in self.workers))
+
+    async def _health_loop(
+        self, check: Callable[[Worker], Awaitable[None]]
+    ) -> None:
+        while True:
+            await self.check_all(check)
+            await asyncio.sleep(self.health_check_interval)
+
+    async def aclose(self) -> None:
+        task, self._health_task = self._health_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict:
+        return {
+            "strategy": self.strategy,
+            "leader": None if self._leader is None else self._leader.url,
+            "workers": [w.stats() for w in self.workers],
+        }
@@ -1,8 +1,45 @@
-"""Safety policy for mutating Kafka Connect operations."""
+"""Safety policy for mutating Kafka Connect operations.
+
+The policy is compiled once into an immutable :class:`SafetyPolicy`:
+per-capability switches plus allow and deny lists whose entries are
+exact connector names, globs (``pg-*``) or regular expressions
+(``re:^orders-\\d+$``).  Checking a connector is a set lookup and at most
+a couple of precompiled regex matches.
+
+Policies come from the environment (``KAFKA_CONNECT_ENABLE_*``,
+``KAFKA_CONNECT_MUTATION_ALLOWLIST``/``_DENYLIST`` and per-capability
+``KAFKA_CONNECT_<CAPABILITY>_ALLOWLIST``/``_DENYLIST``) or from a JSON or
+TOML policy file, which :class:`PolicyFile` reloads when it changes::
+
+    allow = ["pg-*", "orders-sink"]
+    deny = ["re:.*-critical$"]
+
+    [capabilities.restart]
+    enabled = true
+
+    [capabilities.delete]
+    enabled = true
+    allow = ["scratch-*"]
+
+Top-level ``allow``/``deny`` apply to every capability; a connector must
+pass both the top-level and the capability's own lists.
+"""
 
 from __future__ import annotations
 
+import json
 import os
+import re
+import threading
+import time
+import tomllib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from fnmatch import translate
+from pathlib import Path
+from typing import Any
+
+from kafka_connect_mcp.env import env_bool, env_csv
 
 CAPABILITY_ENVS: dict[str, str] = {
     "create": "KAFKA_CONNECT_ENABLE_CREATE",
@@ -15,6 +52,7 @@ CAPABILITY_ENVS: dict[str, str] = {
 TOOL_CAPABILITIES: dict[str, str] = {
     "create_connector": "create",
     "update_connector_config": "update",
+    "patch_connector_config": "update",
     "delete_connector": "delete",
     "pause_connector": "pause_resume",
     "resume_connector": "pause_resume",
@@ -23,20 +61,6 @@ TOOL_CAPABILITIES: dict[str, str] = {
 }
 
 
-def _env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    normalized = value.strip().lower()
-    return normalized in {"1", "true", "yes", "on"}
-
-
-def _env_csv(name: str) -> set[str]:
-    raw = os.getenv(name, "")
-    values = (v.strip() for v in raw.split(","))
-    return {v for v in values if v}
-
-
 class PolicyBlockedError(RuntimeError):
     """Raised when a mutating tool is blocked by policy."""
 
@@ -47,6 +71,7 @@ class PolicyBlockedError(RuntimeError):
         reason: str,
         required_env: list[str],
         connector: str | None = None,
+        cluster: str | None = None,
     ) -> None:
         self.details = {
             "type": "policy_blocked",
@@ -54,38 +79,286 @@ class PolicyBlockedError(RuntimeError):
             "reason": reason,
             "required_env": required_env,
             "connector": connector,
+            "cluster": cluster,
         }
         required = ", ".join(required_env)
         connector_hint = f" for connector '{connector}'" if connector else ""
+        cluster_hint = f" on cluster '{cluster}'" if cluster else ""
         super().__init__(
-            f"{tool} is blocked{connector_hint}: {reason}. "
+            f"{tool} is blocked{connector_hint}{cluster_hint}: {reason}. "
             f"Set {required} to enable."
         )
 
 
+_GLOB_CHARS = frozenset("*?[")
+_REGEX_PREFIX = "re:"
+
+
+@dataclass(frozen=True)
+class NameMatcher:
+    """Precompiled matcher for a list of names, globs and regexes."""
+
+    label: str
+    exact: frozenset[str] = frozenset()
+    pattern: re.Pattern[str] | None = None
+
+    @classmethod
+    def compile(cls, label: str, entries: Iterable[str]) -> NameMatcher | None:
+        """Compile ``entries``; ``None`` when the list is empty.
+
+        Entries starting with ``re:`` are regular expressions that must
+        match the whole name, entries with ``*``, ``?`` or ``[`` are globs
+        and everything else is an exact name.
+        """
+        exact: set[str] = set()
+        patterns: list[str] = []
+        for entry in entries:
+            entry = entry.strip()
+            if not entry:
+                continue
+            if entry.startswith(_REGEX_PREFIX):
+                regex = entry[len(_REGEX_PREFIX) :]
+                try:
+                    re.compile(regex)
+                except re.error as exc:
+                    raise ValueError(
+                        f"Invalid pattern '{entry}' in {label}: {exc}"
+                    ) from None
+                patterns.append(f"(?:{regex})")
+            elif _GLOB_CHARS & set(entry):
+                patterns.append(translate(entry))
+            else:
+                exact.add(entry)
+        if not exact and not patterns:
+            return None
+        pattern = None
+        if patterns:
+            # Entries that compile alone can still clash once joined: an
+            # inline global flag such as (?i) is only valid at the start.
+            try:
+                pattern = re.compile("|".join(patterns))
+            except re.error as exc:
+                raise ValueError(
+                    f"Invalid patterns in {label}: {exc} "
+                    "(use scoped flags such as '(?i:...)')"
+                ) from None
+        return cls(label=label, exact=frozenset(exact), pattern=pattern)
+
+    def matches(self, name: str) -> bool:
+        if name in self.exact:
+            return True
+        return self.pattern is not None and self.pattern.fullmatch(
+            name
+        ) is not None
+
+
+@dataclass(frozen=True)
+class CapabilityRule:
+    """Whether a capability is enabled, and for which connectors."""
+
+    enabled: bool = False
+    enable_hint: str = ""
+    allow: tuple[NameMatcher, ...] = ()
+    deny: tuple[NameMatcher, ...] = ()
+
+
+@dataclass(frozen=True)
+class SafetyPolicy:
+    """Compiled, immutable mutation policy."""
+
+    rules: Mapping[str, CapabilityRule] = field(default_factory=dict)
+    source: str = "environment"
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> SafetyPolicy:
+        """Compile the policy from environment-style settings."""
+        env = os.environ if env is None else env
+        allow = NameMatcher.compile(
+            "KAFKA_CONNECT_MUTATION_ALLOWLIST",
+            env_csv("KAFKA_CONNECT_MUTATION_ALLOWLIST", env),
+        )
+        deny = NameMatcher.compile(
+            "KAFKA_CONNECT_MUTATION_DENYLIST",
+            env_csv("KAFKA_CONNECT_MUTATION_DENYLIST", env),
+        )
+        rules = {}
+        for capability, enable_env in CAPABILITY_ENVS.items():
+            prefix = f"KAFKA_CONNECT_{capability.upper()}"
+            rules[capability] = CapabilityRule(
+                enabled=env_bool(enable_env, False, env),
+                enable_hint=f"{enable_env}=true",
+                allow=_present(
+                    allow,
+                    NameMatcher.compile(
+                        f"{prefix}_ALLOWLIST",
+                        env_csv(f"{prefix}_ALLOWLIST", env),
+                    ),
+                ),
+                deny=_present(
+                    deny,
+                    NameMatcher.compile(
+                        f"{prefix}_DENYLIST",
+                        env_csv(f"{prefix}_DENYLIST", env),
+                    ),
+                ),
+            )
+        return cls(rules=rules)
+
+    @classmethod
+    def from_document(
+        cls, document: Mapping[str, Any], source: str = "policy file"
+    ) -> SafetyPolicy:
+        """Compile the policy from a parsed policy file."""
+        allow = NameMatcher.compile(f"{source} allow", document.get("allow", ()))
+        deny = NameMatcher.compile(f"{source} deny", document.get("deny", ()))
+        specs = document.get("capabilities") or {}
+        unknown = set(specs) - set(CAPABILITY_ENVS)
+        if unknown:
+            raise ValueError(
+                f"Unknown capabilities in {source}: {', '.join(sorted(unknown))}"
+            )
+        rules = {}
+        for capability in CAPABILITY_ENVS:
+            spec = specs.get(capability) or {}
+            key = f"capabilities.{capability}"
+            rules[capability] = CapabilityRule(
+                enabled=bool(spec.get("enabled", False)),
+                enable_hint=f"{key}.enabled = true in {source}",
+                allow=_present(
+                    allow,
+                    NameMatcher.compile(
+                        f"{source} {key}.allow", spec.get("allow", ())
+                    ),
+                ),
+                deny=_present(
+                    deny,
+                    NameMatcher.compile(
+                        f"{source} {key}.deny", spec.get("deny", ())
+                    ),
+                ),
+            )
+        return cls(rules=rules, source=source)
+
+    def check(
+        self,
+        *,
+        tool: str,
+        connector: str | None = None,
+        cluster: str | None = None,
+    ) -> None:
+        """Raise :class:`PolicyBlockedError` unless ``tool`` is allowed."""
+        capability = TOOL_CAPABILITIES[tool]
+        rule = self.rules.get(capability) or CapabilityRule()
+        if not rule.enabled:
+            raise PolicyBlockedError(
+                tool=tool,
+                connector=connector,
+                cluster=cluster,
+                reason=f"capability '{capability}' is disabled",
+                required_env=[rule.enable_hint],
+            )
+        if connector is None:
+            return
+        for matcher in rule.allow:
+            if not matcher.matches(connector):
+                raise PolicyBlockedError(
+                    tool=tool,
+                    connector=connector,
+                    cluster=cluster,
+                    reason=f"connector is not in {matcher.label}",
+                    required_env=[f"{matcher.label}={connector}"],
+                )
+        for matcher in rule.deny:
+            if matcher.matches(connector):
+                raise PolicyBlockedError(
+                    tool=tool,
+                    connector=connector,
+                    cluster=cluster,
+                    reason=f"connector matches {matcher.label}",
+                    required_env=[f"{matcher.label} without '{connector}'"],
+                )
+
+
+def _present(*matchers: NameMatcher | None) -> tuple[NameMatcher, ...]:
+    return tuple(m for m in matchers if m is not None)
+
+
+def _read_policy_file(path: Path) -> dict[str, Any]:
+    if path.suffix == ".toml":
+        with path.open("rb") as fh:
+            return tomllib.load(fh)
+    return json.loads(path.read_text())
+
+
+class PolicyFile:
+    """A policy file, recompiled when it changes on disk.
+
+    The file's modification time is checked at most every
+    ``check_interval`` seconds.  A new policy replaces the old one only
+    once it has been read and compiled in full, so callers never see a
+    half-loaded policy; if the new file is invalid the previous policy
+    stays in force and the error is kept in ``last_error``.
+    """
+
+    def __init__(self, path: str | Path, *, check_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = self.path.stat().st_mtime_ns
+        self._policy = SafetyPolicy.from_document(
+            _read_policy_file(self.path), source=str(self.path)
+        )
+        self._checked = time.monotonic()
+        self.reloads = 0
+        self.last_error: str | None = None
+
+    def current(self) -> SafetyPolicy:
+        """The policy in force, reloading the file if it changed."""
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval:
+            self._maybe_reload(now)
+        return self._policy
+
+    def _maybe_reload(self, now: float) -> None:
+        with self._lock:
+            self._checked = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+                if mtime == self._mtime:
+                    return
+                policy = SafetyPolicy.from_document(
+                    _read_policy_file(self.path), source=str(self.path)
+                )
+            except (OSError, ValueError, re.error, tomllib.TOMLDecodeError) as exc:
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return
+            self._mtime = mtime
+            self._policy = policy
+            self.reloads += 1
+            self.last_error = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
+
+
 def enforce_mutation_allowed(
     *,
     tool: str,
     connector: str | None = None,
+    cluster: str | None = None,
+    env: Mapping[str, str] | None = None,
 ) -> None:
-    """Ensure the requested mutating tool is enabled by current policy."""
-    capability = TOOL_CAPABILITIES[tool]
-    capability_env = CAPABILITY_ENVS[capability]
-    if not _env_bool(capability_env, False):
-        raise PolicyBlockedError(
-            tool=tool,
-            connector=connector,
-            reason=f"capability '{capability}' is disabled",
-            required_env=[f"{capability_env}=true"],
-        )
+    """Ensure the requested mutating tool is enabled by current policy.
 
-    allowlist = _env_csv("KAFKA_CONNECT_MUTATION_ALLOWLIST")
-    if connector and allowlist and connector not in allowlist:
-        raise PolicyBlockedError(
-            tool=tool,
-            connector=connector,
-            reason="connector is not in KAFKA_CONNECT_MUTATION_ALLOWLIST",
-            required_env=[
-                f"KAFKA_CONNECT_MUTATION_ALLOWLIST={connector}",
-            ],
-        )
+    ``env`` supplies the policy settings (same keys as the environment
+    variables); it defaults to the process environment.  This compiles
+    the policy on every call; long-lived callers should keep a
+    :class:`SafetyPolicy` and call :meth:`SafetyPolicy.check` instead.
+    """
+    SafetyPolicy.from_env(env).check(
+        tool=tool, connector=connector, cluster=cluster
+    )
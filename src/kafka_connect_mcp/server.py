@@ -5,211 +5,1020 @@ Translates MCP tool calls into Kafka Connect REST API requests.
 
 from __future__ import annotations
 
+import asyncio
 import os
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-import httpx
 from fastmcp import FastMCP
-from kafka_connect_mcp.safety import enforce_mutation_allowed
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
-CONNECT_URL = os.environ.get("KAFKA_CONNECT_URL", "http://localhost:8083")
+from kafka_connect_mcp.deadlines import DeadlineMiddleware
+from kafka_connect_mcp.env import env_bool, env_float, env_int
+from kafka_connect_mcp.metrics import (
+    REGISTRY,
+    MetricsMiddleware,
+    Sample,
+    cluster_samples,
+)
+from kafka_connect_mcp.patching import config_diff, is_empty, merge_patch
+from kafka_connect_mcp.plugins import check_config, find_plugin
+from kafka_connect_mcp.projection import paginate, project
+from kafka_connect_mcp.snapshot import (
+    EXPAND_PARAMS,
+    filter_connectors,
+    summarize,
+)
+from kafka_connect_mcp.telemetry import configure_tracing, shutdown_tracing
+from kafka_connect_mcp.topology import topology, worker_id_from_url
+from kafka_connect_mcp.traces import (
+    compact_task_trace,
+    dedupe_traces,
+    default_budget,
+    remember_traces,
+)
+from kafka_connect_mcp.waiting import wait_for_state
 
-mcp = FastMCP("kafka-connect", instructions="Manage Kafka Connect connectors")
+# Modules that pull in httpx (clusters, reconcile, recovery) are imported
+# where they are used, so starting the stdio server and listing tools
+# never loads them; the first tool call that needs them does.
+if TYPE_CHECKING:
+    from kafka_connect_mcp.clusters import Cluster, ClusterRegistry
 
+DEFAULT_CONNECT_URL = "http://localhost:8083"
 
-def _client() -> httpx.Client:
-    return httpx.Client(base_url=CONNECT_URL, timeout=30)
+# Overrides ``KAFKA_CONNECT_URL`` when set (tests, embedding).  Otherwise
+# the environment is read when the registry loads, which the server does
+# at startup in each worker process rather than at import.
+CONNECT_URL: str | None = None
 
+_registry: ClusterRegistry | None = None
 
-# ── Cluster ───────────────────────────────────────────────────
+
+def _clusters() -> ClusterRegistry:
+    """Return the process-wide cluster registry, loading it on first use."""
+    global _registry
+    if _registry is None:
+        from kafka_connect_mcp.clusters import ClusterRegistry
+
+        url = CONNECT_URL or os.environ.get(
+            "KAFKA_CONNECT_URL", DEFAULT_CONNECT_URL
+        )
+        _registry = ClusterRegistry.from_env(url)
+    return _registry
+
+
+def _cluster(name: str | None) -> Cluster:
+    return _clusters().get(name)
+
+
+async def aclose_clusters() -> None:
+    """Close every cluster's pooled client and release its connections."""
+    global _registry
+    registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    _deadlines.load()
+    configure_tracing()
+    try:
+        yield {}
+    finally:
+        await aclose_clusters()
+        shutdown_tracing()
+
+
+mcp = FastMCP(
+    "kafka-connect",
+    instructions="Manage Kafka Connect connectors",
+    lifespan=_lifespan,
+)
+mcp.add_middleware(MetricsMiddleware())
+_deadlines = DeadlineMiddleware()
+mcp.add_middleware(_deadlines)
+
+
+def _cluster_stats() -> Iterable[Sample]:
+    # Only report clusters already in use; a scrape must not load them.
+    clusters = [] if _registry is None else list(_registry)
+    return cluster_samples({c.name: c.stats() for c in clusters})
+
+
+REGISTRY.add_collector(_cluster_stats)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus metrics, served by the HTTP transports."""
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+# ── Clusters ──────────────────────────────────────────────────
+
+
+@mcp.tool()
+async def list_clusters() -> dict:
+    """List the Kafka Connect clusters this server can manage.
+
+    Every other tool accepts an optional 'cluster' argument naming one of
+    these; it defaults to the default cluster.
+    """
+    registry = _clusters()
+    return {
+        "default": registry.default,
+        "clusters": [
+            {"name": cluster.name, "urls": list(cluster.config.urls)}
+            for cluster in registry
+        ],
+    }
+
+
+@mcp.tool()
+async def get_cluster_info(
+    fresh: bool = False, cluster: str | None = None
+) -> dict:
+    """Get Kafka Connect cluster information and version.
+
+    Results are cached briefly; pass fresh=True to bypass the cache.
+    """
+    return await _cluster(cluster).cached_get(
+        ("cluster_info",), "/", fresh=fresh
+    )
+
+
+async def _snapshot(cluster: Cluster, **filters: str | None) -> dict:
+    connectors = filter_connectors(await cluster.fetch_snapshot(), **filters)
+    return {"summary": summarize(connectors), "connectors": connectors}
+
+
+@mcp.tool()
+async def get_cluster_snapshot(
+    connector_state: str | None = None,
+    task_state: str | None = None,
+    name_glob: str | None = None,
+    connector_type: str | None = None,
+    worker_id: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    cluster: str | None = None,
+) -> dict:
+    """Get the status of every connector and task in one request.
+
+    Uses ``GET /connectors?expand=status&expand=info``. Optional filters:
+    connector_state / task_state (e.g. FAILED), name_glob (e.g. 'pg-*'),
+    connector_type ('source' or 'sink') and worker_id. Task filters trim
+    each connector's task list to the matching tasks. The summary covers
+    every match; 'connectors' holds at most ``limit`` of them, continue
+    with ``cursor=next_cursor``. ``fields`` (e.g. ['name', 'state',
+    'tasks[*].state']) trims each connector to those paths.
+    """
+    result = await _snapshot(
+        _cluster(cluster),
+        connector_state=connector_state,
+        task_state=task_state,
+        name_glob=name_glob,
+        connector_type=connector_type,
+        worker_id=worker_id,
+    )
+    page, next_cursor = paginate(
+        result["connectors"],
+        limit=limit,
+        cursor=cursor,
+        key=lambda conn: conn["name"],
+    )
+    result["connectors"] = [project(conn, fields) for conn in page]
+    result["next_cursor"] = next_cursor
+    return result
+
+
+@mcp.tool()
+async def get_cluster_topology(cluster: str | None = None) -> dict:
+    """Get task placement and skew across the cluster's workers.
+
+    From one expanded status request: tasks, connector instances and
+    failures per worker, failures per connector class, the skew of the
+    busiest worker over the mean, and idle workers (workers that run no
+    tasks). When several worker URLs are configured, those the cluster
+    does not report are listed as unseen workers, outside the mean and
+    skew. Use it to spot a worker left overloaded after a rebalance.
+    """
+    c = _cluster(cluster)
+    # A single URL is usually an ingress or load balancer, not a worker.
+    urls = c.config.urls if len(c.config.urls) > 1 else ()
+    return topology(
+        await c.fetch_snapshot(),
+        known_workers=[worker_id_from_url(url) for url in urls],
+    )
 
 
 @mcp.tool()
-def get_cluster_info() -> dict:
-    """Get Kafka Connect cluster information and version."""
-    with _client() as c:
-        return c.get("/").json()
+async def get_fleet_snapshot(
+    connector_state: str | None = None,
+    task_state: str | None = None,
+    name_glob: str | None = None,
+    connector_type: str | None = None,
+    clusters: list[str] | None = None,
+) -> dict:
+    """Get connector and task states from several clusters at once.
+
+    Queries every configured cluster (or only those named in 'clusters')
+    concurrently and merges the results; each connector carries a
+    'cluster' field. Use task_state='FAILED' to find failed tasks
+    everywhere. Clusters that could not be reached are listed under
+    'errors' instead of failing the whole call.
+    """
+    from kafka_connect_mcp.clusters import fan_out
+
+    results, errors = await fan_out(
+        _clusters().select(clusters),
+        lambda c: _snapshot(
+            c,
+            connector_state=connector_state,
+            task_state=task_state,
+            name_glob=name_glob,
+            connector_type=connector_type,
+        ),
+    )
+    connectors = [
+        {"cluster": name, **conn}
+        for name, result in results.items()
+        for conn in result["connectors"]
+    ]
+    return {
+        "summary": summarize(connectors),
+        "clusters": {
+            name: result["summary"] for name, result in results.items()
+        },
+        "connectors": connectors,
+        "errors": errors,
+    }
+
+
+@mcp.tool()
+async def get_changes_since(
+    cursor: str | None = None, limit: int = 500, cluster: str | None = None
+) -> dict:
+    """Get connector and task state transitions since a cursor.
+
+    A background watcher polls the cluster once per interval and records
+    every transition (e.g. task 3 RUNNING -> FAILED). Call first without
+    a cursor to start watching and get the current cursor, then pass the
+    returned cursor on each later call to receive only what changed.
+    'more' means the page was cut by limit; 'truncated' means some
+    changes were evicted or the server restarted since the cursor was
+    issued, and a full get_cluster_snapshot is needed.
+    """
+    if env_int("KAFKA_CONNECT_MCP_WORKERS", 1) > 1:
+        # Each worker process would run its own watcher with its own
+        # cursors, and requests are spread over the workers.
+        raise RuntimeError(
+            "get_changes_since needs a single server process; this one "
+            "runs with --workers > 1. Use get_cluster_snapshot instead."
+        )
+    c = _cluster(cluster)
+    watcher = c.watcher()
+    if not watcher.ready.is_set():
+        try:
+            await asyncio.wait_for(
+                watcher.ready.wait(), c.config.client.read_timeout
+            )
+        except TimeoutError:
+            pass
+    return watcher.changes_since(cursor, limit)
 
 
 # ── Connectors ────────────────────────────────────────────────
 
 
 @mcp.tool()
-def list_connectors() -> list[str]:
-    """List all connector names in the cluster."""
-    with _client() as c:
-        return c.get("/connectors").json()
+async def list_connectors(
+    fresh: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    cluster: str | None = None,
+) -> list[str] | dict:
+    """List all connector names in the cluster.
+
+    Results are cached briefly; pass fresh=True to bypass the cache.
+    Without ``limit``/``cursor`` returns every name. With them returns
+    a page {'connectors', 'next_cursor', 'total'} of sorted names; pass
+    next_cursor back as ``cursor`` for the next page.
+    """
+    names = await _cluster(cluster).cached_get(
+        ("connectors",), "/connectors", fresh=fresh
+    )
+    if limit is None and cursor is None:
+        return names
+    page, next_cursor = paginate(names, limit=limit, cursor=cursor)
+    return {"connectors": page, "next_cursor": next_cursor, "total": len(names)}
 
 
 @mcp.tool()
-def get_connector(name: str) -> dict:
-    """Get connector info including config and tasks."""
-    with _client() as c:
-        resp = c.get(f"/connectors/{name}")
-        resp.raise_for_status()
-        return resp.json()
+async def get_connector(
+    name: str,
+    fresh: bool = False,
+    fields: list[str] | None = None,
+    cluster: str | None = None,
+) -> dict:
+    """Get connector info including config and tasks.
+
+    Results are cached briefly; pass fresh=True to bypass the cache.
+    ``fields`` returns only the given paths, e.g. ['type',
+    'config.connector.class', 'tasks[*].task'].
+    """
+    info = await _cluster(cluster).cached_get(
+        ("connector_info", name), f"/connectors/{name}", fresh=fresh
+    )
+    return project(info, fields)
 
 
 @mcp.tool()
-def get_connector_status(name: str) -> dict:
-    """Get the status of a connector and all its tasks."""
-    with _client() as c:
-        resp = c.get(f"/connectors/{name}/status")
-        resp.raise_for_status()
-        return resp.json()
+async def get_connector_status(
+    name: str,
+    full_traces: bool = False,
+    trace_budget: int | None = None,
+    fields: list[str] | None = None,
+    cluster: str | None = None,
+) -> dict:
+    """Get the status of a connector and all its tasks.
+
+    Stack traces of failed instances are deduplicated: each carries a
+    trace_id and the top-level 'traces' map holds one compacted copy
+    (exception chain plus root-cause frames within trace_budget bytes)
+    per distinct trace. Use get_trace for the full text, or pass
+    full_traces=True to get the raw payload. ``fields`` returns only the
+    given paths, e.g. ['connector.state', 'tasks[*].state'].
+    """
+    c = _cluster(cluster)
+    status = await c.get_json(f"/connectors/{name}/status")
+    if not full_traces:
+        status = dedupe_traces(
+            status, c.traces, trace_budget or default_budget()
+        )
+    return project(status, fields)
 
 
 @mcp.tool()
-def get_connector_config(name: str) -> dict:
-    """Get the configuration for a connector."""
-    with _client() as c:
-        resp = c.get(f"/connectors/{name}/config")
-        resp.raise_for_status()
-        return resp.json()
+async def wait_for_connector_state(
+    name: str,
+    connector_state: str = "RUNNING",
+    task_state: str | None = "RUNNING",
+    timeout: float = 60.0,
+    fail_fast: bool = True,
+    cluster: str | None = None,
+) -> dict:
+    """Wait until a connector (and its tasks) reach a state.
+
+    Use after create/resume/restart instead of polling
+    get_connector_status. Polls inside the server with adaptive backoff
+    until the connector is in connector_state and every task is in
+    task_state (set task_state to null to ignore tasks), the timeout in
+    seconds expires (max 600), or — with fail_fast — anything FAILS.
+    Returns the outcome ('reached', 'failed' or 'timeout'), the final
+    status and a timeline of the state transitions seen.
+    """
+    import httpx
+
+    c = _cluster(cluster)
+
+    async def fetch() -> dict | None:
+        try:
+            return await c.get_json(f"/connectors/{name}/status")
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return None
+            raise
+
+    return await wait_for_state(
+        fetch,
+        name=name,
+        connector_state=connector_state,
+        task_state=task_state,
+        timeout=timeout,
+        fail_fast=fail_fast,
+    )
+
+
+@mcp.tool()
+async def get_connector_config(
+    name: str,
+    fresh: bool = False,
+    fields: list[str] | None = None,
+    cluster: str | None = None,
+) -> dict:
+    """Get the configuration for a connector.
+
+    Results are cached briefly; pass fresh=True to bypass the cache.
+    ``fields`` returns only the given keys, e.g. ['connector.class',
+    'tasks.max'].
+    """
+    config = await _cluster(cluster).cached_get(
+        ("connector_config", name),
+        f"/connectors/{name}/config",
+        fresh=fresh,
+    )
+    return project(config, fields)
 
 
 @mcp.tool()
-def create_connector(name: str, config: dict) -> dict:
+async def create_connector(
+    name: str, config: dict, cluster: str | None = None
+) -> dict:
     """Create a new connector.
 
     The config dict should include 'connector.class' and all required
     properties for that connector type.
     """
-    enforce_mutation_allowed(tool="create_connector", connector=name)
-    with _client() as c:
-        resp = c.post("/connectors", json={"name": name, "config": config})
-        resp.raise_for_status()
-        return resp.json()
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="create_connector", connector=name)
+    async with c.mutations.admit(name):
+        resp = await c.request(
+            "POST", "/connectors", json={"name": name, "config": config}
+        )
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return resp.json()
 
 
 @mcp.tool()
-def update_connector_config(name: str, config: dict) -> dict:
+async def update_connector_config(
+    name: str, config: dict, cluster: str | None = None
+) -> dict:
     """Update (or create) a connector's configuration. This is a full replace."""
-    enforce_mutation_allowed(tool="update_connector_config", connector=name)
-    with _client() as c:
-        resp = c.put(f"/connectors/{name}/config", json=config)
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="update_connector_config", connector=name)
+    async with c.mutations.admit(name):
+        resp = await c.request(
+            "PUT", f"/connectors/{name}/config", json=config, idempotent=True
+        )
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return resp.json()
+
+
+@mcp.tool()
+async def patch_connector_config(
+    name: str,
+    patch: dict,
+    cluster: str | None = None,
+) -> dict:
+    """Change some keys of a connector's configuration.
+
+    ``patch`` is a JSON merge patch: listed keys are set, keys with a null
+    value are removed, all other keys are kept.  The current config is
+    read fresh and when the patch changes nothing the PUT is skipped, so
+    the connector is not restarted and the group does not rebalance.
+    Returns the diff and whether it was applied.
+    """
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="patch_connector_config", connector=name)
+    path = f"/connectors/{name}/config"
+    # Read, diff and write under the connector's admission, so concurrent
+    # patches apply one after the other instead of each PUTting a merge
+    # of the same original config.  The read is fresh either way: a
+    # cached config may hide another client's change, turning a real
+    # change into a skipped no-op or making the PUT silently revert it.
+    async with c.mutations.admit(name):
+        current = await c.cached_get(
+            ("connector_config", name), path, fresh=True
+        )
+        merged = merge_patch(current, patch)
+        diff = config_diff(current, merged)
+        if is_empty(diff):
+            return {"name": name, "applied": False, "diff": diff}
+        resp = await c.request("PUT", path, json=merged, idempotent=True)
         resp.raise_for_status()
-        return resp.json()
+        c.invalidate_connector(name)
+    return {"name": name, "applied": True, "diff": diff, "config": resp.json()}
 
 
 @mcp.tool()
-def delete_connector(name: str) -> str:
+async def delete_connector(name: str, cluster: str | None = None) -> str:
     """Delete a connector and all its tasks."""
-    enforce_mutation_allowed(tool="delete_connector", connector=name)
-    with _client() as c:
-        resp = c.delete(f"/connectors/{name}")
-        resp.raise_for_status()
-        return f"Connector '{name}' deleted."
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="delete_connector", connector=name)
+    async with c.mutations.admit(name):
+        resp = await c.request("DELETE", f"/connectors/{name}")
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return f"Connector '{name}' deleted."
 
 
 @mcp.tool()
-def pause_connector(name: str) -> str:
+async def pause_connector(name: str, cluster: str | None = None) -> str:
     """Pause a running connector."""
-    enforce_mutation_allowed(tool="pause_connector", connector=name)
-    with _client() as c:
-        resp = c.put(f"/connectors/{name}/pause")
-        resp.raise_for_status()
-        return f"Connector '{name}' paused."
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="pause_connector", connector=name)
+    async with c.mutations.admit(name):
+        resp = await c.request(
+            "PUT", f"/connectors/{name}/pause", idempotent=True
+        )
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return f"Connector '{name}' paused."
 
 
 @mcp.tool()
-def resume_connector(name: str) -> str:
+async def resume_connector(name: str, cluster: str | None = None) -> str:
     """Resume a paused connector."""
-    enforce_mutation_allowed(tool="resume_connector", connector=name)
-    with _client() as c:
-        resp = c.put(f"/connectors/{name}/resume")
-        resp.raise_for_status()
-        return f"Connector '{name}' resumed."
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="resume_connector", connector=name)
+    async with c.mutations.admit(name):
+        resp = await c.request(
+            "PUT", f"/connectors/{name}/resume", idempotent=True
+        )
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return f"Connector '{name}' resumed."
 
 
 @mcp.tool()
-def restart_connector(
-    name: str, include_tasks: bool = False, only_failed: bool = False
+async def restart_connector(
+    name: str,
+    include_tasks: bool = False,
+    only_failed: bool = False,
+    cluster: str | None = None,
 ) -> str:
     """Restart a connector. Optionally restart its tasks too."""
-    enforce_mutation_allowed(tool="restart_connector", connector=name)
-    with _client() as c:
-        params: dict[str, str] = {}
-        if include_tasks:
-            params["includeTasks"] = "true"
-        if only_failed:
-            params["onlyFailed"] = "true"
-        resp = c.post(f"/connectors/{name}/restart", params=params)
-        resp.raise_for_status()
-        return f"Connector '{name}' restarted."
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="restart_connector", connector=name)
+    params: dict[str, str] = {}
+    if include_tasks:
+        params["includeTasks"] = "true"
+    if only_failed:
+        params["onlyFailed"] = "true"
+    # Restarting only failed instances is safe to repeat; a full restart
+    # is not retried after an ambiguous failure.
+    async with c.mutations.admit(name):
+        resp = await c.request(
+            "POST",
+            f"/connectors/{name}/restart",
+            params=params,
+            idempotent=only_failed,
+        )
+    resp.raise_for_status()
+    c.invalidate_connector(name)
+    return f"Connector '{name}' restarted."
+
+
+@mcp.tool()
+async def restart_failed(
+    name_glob: str | None = None,
+    trace_pattern: str | None = None,
+    dry_run: bool = False,
+    concurrency: int = 8,
+    rate_per_second: float = 5.0,
+    cluster: str | None = None,
+) -> dict:
+    """Restart every FAILED connector and task on the cluster.
+
+    Finds failures in one snapshot request, optionally narrowed by
+    name_glob (e.g. 'pg-*') and trace_pattern (a regex searched in the
+    stack trace, e.g. 'TimeoutException'). A connector whose failed
+    instances were all selected is restarted with one
+    restart?includeTasks=true&onlyFailed=true call; otherwise only the
+    selected instances are restarted. Calls run at most ``concurrency``
+    connectors at a time and ``rate_per_second`` overall; every call is
+    also a cluster write, so the cluster's write limits
+    (KAFKA_CONNECT_MUTATION_RATE, _BURST and _CONCURRENCY, 2/s with a
+    burst of 10 and 4 at once by default) cap both. Each connector is
+    checked against the safety policy. dry_run=True only lists what
+    would be restarted. Returns a summary.
+    """
+    from kafka_connect_mcp.recovery import find_failed, restart_targets
+
+    c = _cluster(cluster)
+    payload = await c.get_json("/connectors", params=EXPAND_PARAMS)
+    targets = find_failed(
+        payload, name_glob=name_glob, trace_pattern=trace_pattern
+    )
+    result: dict = {
+        "matched_connectors": len(targets),
+        "matched_tasks": sum(len(t["tasks"]) for t in targets),
+    }
+    if dry_run:
+        result["targets"] = {t["name"]: t["tasks"] for t in targets}
+        return result
+    result.update(
+        await restart_targets(
+            c, targets, concurrency=concurrency, rate=rate_per_second
+        )
+    )
+    return result
+
+
+@mcp.tool()
+async def plan_connectors(
+    manifest: dict[str, dict],
+    prune: bool = False,
+    cluster: str | None = None,
+) -> dict:
+    """Diff a desired-state manifest against the live connectors.
+
+    ``manifest`` maps connector names to their full desired config. Each
+    connector is planned as create, update (with a key-level diff),
+    unchanged, or, with prune=True, delete when it is live but missing
+    from the manifest. Steps the safety policy would block are marked.
+    Nothing is changed; use apply_connectors to carry out the plan.
+    """
+    from kafka_connect_mcp.reconcile import (
+        check_policy,
+        live_configs,
+        plan_changes,
+        summarize_steps,
+    )
+
+    c = _cluster(cluster)
+    steps = plan_changes(manifest, await live_configs(c), prune=prune)
+    check_policy(c, steps)
+    for step in steps:
+        step.pop("config", None)
+    return {"summary": summarize_steps(steps, "action"), "steps": steps}
+
+
+@mcp.tool()
+async def apply_connectors(
+    manifest: dict[str, dict],
+    prune: bool = False,
+    concurrency: int = 4,
+    batch_pause: float = 2.0,
+    cluster: str | None = None,
+) -> dict:
+    """Bring the live connectors in line with a desired-state manifest.
+
+    Plans like plan_connectors against fresh live state, then creates,
+    updates and (with prune=True) deletes connectors at most
+    ``concurrency`` at a time, waiting ``batch_pause`` seconds between
+    batches to avoid back-to-back rebalances. Every step is checked
+    against the safety policy and the cluster's write admission control.
+    Returns a per-connector result (ok, skipped, blocked, rejected or
+    error); one failure does not stop the others.
+    """
+    from kafka_connect_mcp.reconcile import (
+        apply_steps,
+        live_configs,
+        plan_changes,
+        summarize_steps,
+    )
+
+    c = _cluster(cluster)
+    steps = plan_changes(manifest, await live_configs(c), prune=prune)
+    results = await apply_steps(
+        c, steps, concurrency=concurrency, batch_pause=batch_pause
+    )
+    return {"summary": summarize_steps(results, "result"), "results": results}
 
 
 # ── Tasks ─────────────────────────────────────────────────────
 
 
 @mcp.tool()
-def get_task_status(connector_name: str, task_id: int) -> dict:
-    """Get the status of a specific task for a connector."""
-    with _client() as c:
-        resp = c.get(f"/connectors/{connector_name}/tasks/{task_id}/status")
-        resp.raise_for_status()
-        return resp.json()
+async def get_task_status(
+    connector_name: str,
+    task_id: int,
+    full_traces: bool = False,
+    trace_budget: int | None = None,
+    cluster: str | None = None,
+) -> dict:
+    """Get the status of a specific task for a connector.
+
+    A failed task's trace is cut to its exception chain and root-cause
+    frames (trace_budget bytes); use get_trace with the returned
+    trace_id, or full_traces=True, for the full text.
+    """
+    c = _cluster(cluster)
+    status = await c.get_json(
+        f"/connectors/{connector_name}/tasks/{task_id}/status"
+    )
+    if full_traces:
+        return status
+    return compact_task_trace(
+        status, c.traces, trace_budget or default_budget()
+    )
 
 
 @mcp.tool()
-def restart_task(connector_name: str, task_id: int) -> str:
+async def get_trace(
+    trace_id: str, connector: str | None = None, cluster: str | None = None
+) -> str:
+    """Get the full stack trace for a trace_id from a status tool.
+
+    Full traces are kept in memory for a while. When this server no
+    longer has one (evicted, restarted, or the status came from another
+    worker process) the statuses are re-read from Connect: only
+    ``connector``'s when given, otherwise every connector's.
+    """
+    c = _cluster(cluster)
+    trace = c.traces.get(trace_id)
+    if trace is None:
+        if connector is not None:
+            statuses = [await c.get_json(f"/connectors/{connector}/status")]
+        else:
+            payload = await c.get_json(
+                "/connectors", params=[("expand", "status")]
+            )
+            statuses = [entry["status"] for entry in payload.values()]
+        for status in statuses:
+            remember_traces(status, c.traces)
+        trace = c.traces.get(trace_id)
+    if trace is None:
+        raise ValueError(
+            f"Unknown trace_id '{trace_id}': Connect no longer reports it. "
+            "Re-read the status for the current traces."
+        )
+    return trace
+
+
+@mcp.tool()
+async def restart_task(
+    connector_name: str, task_id: int, cluster: str | None = None
+) -> str:
     """Restart a specific task."""
-    enforce_mutation_allowed(tool="restart_task", connector=connector_name)
-    with _client() as c:
-        resp = c.post(
-            f"/connectors/{connector_name}/tasks/{task_id}/restart"
+    c = _cluster(cluster)
+    c.enforce_mutation_allowed(tool="restart_task", connector=connector_name)
+    async with c.mutations.admit(connector_name):
+        resp = await c.request(
+            "POST", f"/connectors/{connector_name}/tasks/{task_id}/restart"
         )
-        resp.raise_for_status()
-        return f"Task {task_id} of '{connector_name}' restarted."
+    resp.raise_for_status()
+    c.invalidate_connector(connector_name)
+    return f"Task {task_id} of '{connector_name}' restarted."
 
 
 # ── Plugins ───────────────────────────────────────────────────
 
 
 @mcp.tool()
-def list_connector_plugins() -> list[dict]:
-    """List available connector plugins on the cluster."""
-    with _client() as c:
-        return c.get("/connector-plugins").json()
+async def list_connector_plugins(
+    fresh: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    cluster: str | None = None,
+) -> list[dict] | dict:
+    """List available connector plugins on the cluster.
+
+    Results are cached briefly; pass fresh=True to bypass the cache.
+    With ``limit``/``cursor`` returns a page {'plugins', 'next_cursor',
+    'total'} sorted by class.
+    """
+    plugins = await _cluster(cluster).cached_get(
+        ("connector_plugins",), "/connector-plugins", fresh=fresh
+    )
+    if limit is None and cursor is None:
+        return plugins
+    page, next_cursor = paginate(
+        plugins, limit=limit, cursor=cursor, key=lambda p: p["class"]
+    )
+    return {"plugins": page, "next_cursor": next_cursor, "total": len(plugins)}
+
+
+async def _plugin_definition(
+    cluster: Cluster, plugin_class: str
+) -> list[dict] | None:
+    """A plugin's config definition, or ``None`` if Connect lacks the API."""
+    import httpx
+
+    key = ("plugin_config", plugin_class)
+    try:
+        return await cluster.cached_get(
+            key, f"/connector-plugins/{plugin_class}/config"
+        )
+    except httpx.HTTPStatusError as exc:
+        # Connect < 3.2 has no definition endpoint; remember that so the
+        # next validation goes straight to the remote check.
+        if exc.response.status_code not in (404, 405):
+            raise
+        cluster.cache.set(key, None)
+        return None
 
 
 @mcp.tool()
-def validate_connector_config(plugin_class: str, config: dict) -> dict:
+async def validate_connector_config(
+    plugin_class: str, config: dict, cluster: str | None = None
+) -> dict:
     """Validate a connector config against its plugin's schema.
 
-    Returns per-field validation errors if any.
+    Cheap checks run locally first against the cached plugin catalog and
+    config definition: unknown plugin, missing required keys and wrong
+    value types (errors) and unknown keys (warnings). Only when those
+    pass is the config sent to Connect for full validation. Returns the
+    combined error_count with the 'local' findings and the 'remote'
+    validation response (null when it was skipped).
     """
-    with _client() as c:
-        resp = c.put(
-            f"/connector-plugins/{plugin_class}/config/validate", json=config
-        )
-        return resp.json()
+    c = _cluster(cluster)
+    result: dict = {"plugin": plugin_class, "remote": None}
+    key = ("connector_plugins",)
+    catalog = await c.cached_get(key, "/connector-plugins")
+    if find_plugin(catalog, plugin_class) is None:
+        # The plugin may have been installed since the catalog was cached.
+        catalog = await c.cached_get(key, "/connector-plugins", fresh=True)
+    if find_plugin(catalog, plugin_class) is None:
+        result["local"] = {
+            "errors": {
+                "connector.class": [
+                    f"Unknown plugin '{plugin_class}'; see "
+                    "list_connector_plugins"
+                ]
+            },
+            "warnings": {},
+        }
+        result["error_count"] = 1
+        return result
+
+    definition = await _plugin_definition(c, plugin_class)
+    local = (
+        {"errors": {}, "warnings": {}}
+        if definition is None
+        else check_config(definition, config)
+    )
+    result["local"] = local
+    result["error_count"] = len(local["errors"])
+    if local["errors"]:
+        return result
+
+    resp = await c.request(
+        "PUT",
+        f"/connector-plugins/{plugin_class}/config/validate",
+        json=config,
+    )
+    remote = resp.json()
+    result["remote"] = remote
+    result["error_count"] = (
+        remote.get("error_count", 0) if resp.is_success else 1
+    )
+    return result
+
+
+# ── Server ────────────────────────────────────────────────────
+
+
+@mcp.tool()
+async def get_server_stats() -> dict:
+    """Get internal server counters and state.
+
+    Reported per cluster: connection pool, read cache, request
+    coalescing, worker routing and health, retries, circuit breaker,
+    mutation queue depth and wait times, policy source and reloads,
+    trace buffer, and status watcher state.
+    """
+    return {
+        "clusters": {cluster.name: cluster.stats() for cluster in _clusters()}
+    }
 
 
 # ── Entry point ───────────────────────────────────────────────
 
 
-def main():
+def create_app() -> Starlette:
+    """ASGI app for the HTTP transports, built once per worker process.
+
+    uvicorn calls this factory in every worker; ``main`` passes the
+    transport choice through ``KAFKA_CONNECT_MCP_TRANSPORT``,
+    ``KAFKA_CONNECT_MCP_STATELESS`` and ``KAFKA_CONNECT_MCP_WORKERS`` so
+    spawned workers see it too.
+    """
+    # Build the cluster registry in each worker at startup, so a bad
+    # cluster config fails before the first request and every worker owns
+    # its pooled clients and caches.
+    _clusters()
+    transport = os.environ.get(
+        "KAFKA_CONNECT_MCP_TRANSPORT", "streamable-http"
+    )
+    if transport == "sse":
+        return mcp.http_app(transport="sse")
+    return mcp.http_app(
+        transport="http",
+        stateless_http=env_bool("KAFKA_CONNECT_MCP_STATELESS", False),
+    )
+
+
+def _run_stdio() -> None:
+    # No banner: nobody sees stderr of a stdio server, and rendering it
+    # includes a PyPI version check on the startup path.
+    mcp.run(show_banner=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    import sys
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        # The default stdio launch skips argparse; MCP clients start this
+        # on demand, so it is on the user's wait.
+        _run_stdio()
+        return
+
     import argparse
 
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--transport",
-        choices=["stdio", "sse"],
+        choices=["stdio", "sse", "streamable-http", "daemon"],
         default="stdio",
-        help="MCP transport (default: stdio)",
+        help="MCP transport (default: stdio); 'daemon' serves stdio "
+        "sessions over a Unix socket for kafka-connect-mcp-shim",
+    )
+    parser.add_argument(
+        "--host", default="0.0.0.0", help="Host for HTTP transports"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="Port for HTTP transports"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for streamable-http (default: 1)",
+    )
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        help="Serve streamable-http without sessions "
+        "(implied by --workers > 1)",
     )
     parser.add_argument(
-        "--host", default="0.0.0.0", help="Host for SSE transport"
+        "--graceful-timeout",
+        type=float,
+        default=10.0,
+        help="Seconds to let in-flight requests finish on shutdown "
+        "(default: 10)",
     )
     parser.add_argument(
-        "--port", type=int, default=8000, help="Port for SSE transport"
+        "--keep-alive",
+        type=int,
+        default=5,
+        help="Seconds to keep idle client connections open (default: 5)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--socket",
+        help="Unix socket for the daemon (default: derived from the "
+        "KAFKA_CONNECT_* settings, as kafka-connect-mcp-shim does)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=env_float("KAFKA_CONNECT_MCP_IDLE_TIMEOUT", 600.0),
+        help="Seconds the daemon stays up without sessions; 0 keeps it "
+        "running (default: 600)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.transport in ("stdio", "daemon") and args.workers != 1:
+        parser.error("--workers needs an HTTP transport")
+    if args.transport == "stdio":
+        _run_stdio()
+        return
+    if args.transport == "daemon":
+        import logging
+
+        from kafka_connect_mcp.daemon import serve
+        from kafka_connect_mcp.shim import socket_path
 
-    if args.transport == "sse":
-        mcp.run(transport="sse", host=args.host, port=args.port)
-    else:
-        mcp.run()
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        )
+        asyncio.run(
+            serve(
+                args.socket or socket_path(),
+                idle_timeout=args.idle_timeout,
+            )
+        )
+        return
+    if args.transport == "sse" and args.workers != 1:
+        # An SSE session lives in the process that opened it; with several
+        # workers its follow-up POSTs would land on the wrong one.
+        parser.error("--workers > 1 needs --transport streamable-http")
+
+    import uvicorn
+
+    os.environ["KAFKA_CONNECT_MCP_TRANSPORT"] = args.transport
+    os.environ["KAFKA_CONNECT_MCP_WORKERS"] = str(args.workers)
+    os.environ["KAFKA_CONNECT_MCP_STATELESS"] = str(
+        args.stateless or args.workers > 1
+    ).lower()
+    uvicorn.run(
+        "kafka_connect_mcp.server:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        timeout_keep_alive=args.keep_alive,
+        lifespan="on",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,184 @@
+"""Thin stdio entry point that forwards MCP traffic to a shared daemon.
+
+``kafka-connect-mcp-shim`` is what an editor or agent launches instead of
+the full stdio server.  It connects to the daemon's Unix socket (starting
+the daemon on first use) and copies bytes between its own stdin/stdout
+and the socket.  The daemon speaks the same newline-delimited JSON-RPC
+as the stdio transport, so the shim never parses a message and imports
+nothing beyond the standard library.
+
+Sessions share a daemon only when their ``KAFKA_CONNECT_*`` settings are
+identical: the default socket path is derived from a hash of them, so a
+session pointed at another cluster or with another safety policy gets
+a daemon of its own.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+
+SOCKET_ENV = "KAFKA_CONNECT_MCP_SOCKET"
+_CHUNK = 65536
+
+
+def daemon_env(env: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Environment for the daemon, with relative ``*_FILE`` paths resolved.
+
+    The daemon outlives the session that started it and runs from ``/``,
+    so relative paths to cluster or policy files must be made absolute.
+    """
+    result = dict(os.environ if env is None else env)
+    for key, value in result.items():
+        if key.startswith("KAFKA_CONNECT_") and key.endswith("_FILE"):
+            result[key] = os.path.abspath(value) if value else value
+    return result
+
+
+def socket_path(env: Mapping[str, str] | None = None) -> str:
+    """Socket of the daemon serving this configuration.
+
+    ``KAFKA_CONNECT_MCP_SOCKET`` wins; otherwise the path lives in a
+    per-user directory and is named after a hash of every
+    ``KAFKA_CONNECT_*`` variable.
+    """
+    env = daemon_env(env)
+    explicit = env.get(SOCKET_ENV)
+    if explicit:
+        return explicit
+    settings = sorted(
+        (k, v)
+        for k, v in env.items()
+        if k.startswith("KAFKA_CONNECT_") and k != SOCKET_ENV
+    )
+    digest = hashlib.sha256(json.dumps(settings).encode()).hexdigest()[:16]
+    base = env.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(
+        base, f"kafka-connect-mcp-{os.getuid()}", f"{digest}.sock"
+    )
+
+
+def _private_dir(path: str) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    st = os.stat(directory)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(
+            f"{directory} must be owned by this user with mode 0700"
+        )
+
+
+def try_connect(path: str) -> socket.socket | None:
+    """Connected socket, or ``None`` when no daemon is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def connect_or_spawn(
+    path: str,
+    *,
+    env: Mapping[str, str] | None = None,
+    timeout: float = 30.0,
+) -> socket.socket:
+    """Connect to the daemon at ``path``, starting it if needed.
+
+    A lock file next to the socket makes sure concurrent shims start at
+    most one daemon.  The daemon's output goes to ``<socket>.log``.
+    """
+    sock = try_connect(path)
+    if sock is not None:
+        return sock
+    if SOCKET_ENV not in (os.environ if env is None else env):
+        _private_dir(path)
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = try_connect(path)
+        if sock is not None:
+            return sock
+        log_path = f"{path}.log"
+        with open(log_path, "ab") as log:
+            proc = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-c",
+                    "from kafka_connect_mcp.server import main; main()",
+                    "--transport",
+                    "daemon",
+                    "--socket",
+                    path,
+                ],
+                env=daemon_env(env),
+                cwd="/",
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            sock = try_connect(path)
+            if sock is not None:
+                return sock
+            if proc.poll() is not None:
+                raise RuntimeError(
+                    f"kafka-connect-mcp daemon exited with status "
+                    f"{proc.returncode}; see {log_path}"
+                )
+            time.sleep(0.05)
+    raise TimeoutError(
+        f"kafka-connect-mcp daemon did not listen on {path} "
+        f"within {timeout:.0f}s; see {log_path}"
+    )
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def forward(sock: socket.socket, stdin: int = 0, stdout: int = 1) -> None:
+    """Copy ``stdin`` to ``sock`` and ``sock`` to ``stdout`` until EOF."""
+
+    def upstream() -> None:
+        try:
+            while data := os.read(stdin, _CHUNK):
+                sock.sendall(data)
+        except OSError:
+            pass
+        try:
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+    threading.Thread(target=upstream, daemon=True).start()
+    while data := sock.recv(_CHUNK):
+        _write_all(stdout, data)
+
+
+def main() -> None:
+    try:
+        sock = connect_or_spawn(socket_path())
+    except (OSError, RuntimeError) as exc:
+        print(f"kafka-connect-mcp-shim: {exc}", file=sys.stderr)
+        sys.exit(1)
+    with sock:
+        forward(sock)
+
+
+if __name__ == "__main__":
+    main()
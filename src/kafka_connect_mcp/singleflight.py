@@ -0,0 +1,79 @@
+"""Coalescing of identical concurrent upstream requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from kafka_connect_mcp.deadlines import (
+    SharedDeadline,
+    cancel_message,
+    detached_context,
+)
+
+
+class SingleFlight:
+    """Share one in-flight call among all callers asking for the same key.
+
+    The first caller for a key starts the work in a task; callers that
+    arrive while it is running await the same task instead of issuing
+    their own request.  The task is shielded so one caller being
+    cancelled does not cancel the shared work for everyone else, but
+    it is cancelled once every caller has gone, so an abandoned request
+    does not keep its upstream connection busy.  The work runs until the
+    latest deadline among the callers still waiting, not the deadline of
+    the caller that started it.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        # The waiters of each task, by their deadlines.
+        self._waiters: dict[asyncio.Task[Any], SharedDeadline] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``fn`` for ``key`` unless an identical call is in flight."""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            waiters = SharedDeadline()
+            task = asyncio.get_running_loop().create_task(
+                fn(), context=detached_context(waiters)
+            )
+            self._inflight[key] = task
+            self._waiters[task] = waiters
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+            waiters = self._waiters[task]
+        deadline = waiters.join()
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if len(waiters) == 1 and not task.done():
+                task.cancel(cancel_message())
+                self.abandoned += 1
+            raise
+        finally:
+            waiters.leave(deadline)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._waiters.pop(task, None)
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter went away.
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._inflight),
+        }
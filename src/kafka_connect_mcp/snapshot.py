@@ -0,0 +1,126 @@
+"""Normalization and filtering of expanded ``/connectors`` responses.
+
+``GET /connectors?expand=status&expand=info`` returns every connector's
+status and info in a single round trip, keyed by connector name.  The
+helpers here flatten that payload into a compact shape that is cheap to
+filter and small enough to hand to a model.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from fnmatch import fnmatchcase
+from typing import Any
+
+EXPAND_PARAMS: list[tuple[str, str]] = [
+    ("expand", "status"),
+    ("expand", "info"),
+]
+
+
+def _first_line(trace: str | None) -> str | None:
+    if not trace:
+        return None
+    return trace.strip().splitlines()[0]
+
+
+def normalize_connector(name: str, entry: dict[str, Any]) -> dict[str, Any]:
+    """Flatten one ``expand=status&expand=info`` entry."""
+    status = entry.get("status") or {}
+    info = entry.get("info") or {}
+    connector = status.get("connector") or {}
+    config = info.get("config") or {}
+
+    tasks = []
+    for task in status.get("tasks") or []:
+        normalized = {
+            "id": task.get("id"),
+            "state": task.get("state"),
+            "worker_id": task.get("worker_id"),
+        }
+        error = _first_line(task.get("trace"))
+        if error:
+            normalized["error"] = error
+        tasks.append(normalized)
+
+    result: dict[str, Any] = {
+        "name": name,
+        "type": status.get("type") or info.get("type"),
+        "class": config.get("connector.class"),
+        "state": connector.get("state"),
+        "worker_id": connector.get("worker_id"),
+        "tasks": tasks,
+    }
+    error = _first_line(connector.get("trace"))
+    if error:
+        result["error"] = error
+    return result
+
+
+def normalize_snapshot(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Normalize a whole expanded response, sorted by connector name."""
+    return [
+        normalize_connector(name, payload[name]) for name in sorted(payload)
+    ]
+
+
+def _matches(value: str | None, wanted: str | None) -> bool:
+    return wanted is None or (value or "").upper() == wanted.upper()
+
+
+def filter_connectors(
+    connectors: list[dict[str, Any]],
+    *,
+    connector_state: str | None = None,
+    task_state: str | None = None,
+    name_glob: str | None = None,
+    connector_type: str | None = None,
+    worker_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Filter normalized connectors.
+
+    Connector-level filters (state, name glob, type) drop whole
+    connectors.  Task-level filters (task state, worker) keep a connector
+    only if at least one of its tasks matches and trim its task list to
+    the matching tasks; a connector whose own instance runs on the
+    requested worker is also kept.
+    """
+    selected = []
+    for conn in connectors:
+        if name_glob is not None and not fnmatchcase(conn["name"], name_glob):
+            continue
+        if not _matches(conn["type"], connector_type):
+            continue
+        if not _matches(conn["state"], connector_state):
+            continue
+
+        if task_state is None and worker_id is None:
+            selected.append(conn)
+            continue
+
+        tasks = [
+            t
+            for t in conn["tasks"]
+            if _matches(t["state"], task_state)
+            and (worker_id is None or t["worker_id"] == worker_id)
+        ]
+        on_worker = (
+            task_state is None
+            and worker_id is not None
+            and conn["worker_id"] == worker_id
+        )
+        if tasks or on_worker:
+            selected.append({**conn, "tasks": tasks})
+    return selected
+
+
+def summarize(connectors: list[dict[str, Any]]) -> dict[str, Any]:
+    """Count connectors and tasks by state."""
+    connector_states = Counter(c["state"] for c in connectors)
+    task_states = Counter(t["state"] for c in connectors for t in c["tasks"])
+    return {
+        "connectors": len(connectors),
+        "tasks": sum(task_states.values()),
+        "connector_states": dict(connector_states),
+        "task_states": dict(task_states),
+    }
@@ -0,0 +1,85 @@
+"""Optional OpenTelemetry spans for tool calls and Connect requests.
+
+Install the ``otel`` extra and set ``KAFKA_CONNECT_OTEL_ENDPOINT`` (an
+OTLP/HTTP traces URL such as ``http://collector:4318/v1/traces``) to
+export a span per tool call with a child span per upstream request.
+Without it, :func:`span` is a no-op and OpenTelemetry is never imported.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import Any
+
+_tracer: Any = None
+_provider: Any = None
+
+
+def _require_otel() -> None:
+    try:
+        import opentelemetry.exporter.otlp.proto.http  # noqa: F401
+        import opentelemetry.sdk  # noqa: F401
+    except ImportError as exc:
+        raise RuntimeError(
+            "KAFKA_CONNECT_OTEL_ENDPOINT requires the OpenTelemetry SDK; "
+            "install kafka-connect-mcp[otel]"
+        ) from exc
+
+
+def configure_tracing(endpoint: str | None = None) -> bool:
+    """Start exporting spans to ``endpoint`` (default: from the env).
+
+    Returns whether tracing is enabled.  Uses a private tracer provider
+    so the host process's global OpenTelemetry setup is left alone.
+    """
+    global _tracer, _provider
+    endpoint = endpoint or os.getenv("KAFKA_CONNECT_OTEL_ENDPOINT")
+    if not endpoint:
+        return False
+    _require_otel()
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "kafka-connect-mcp"})
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint))
+    )
+    shutdown_tracing()
+    _provider = provider
+    _tracer = provider.get_tracer("kafka_connect_mcp")
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop exporting."""
+    global _tracer, _provider
+    provider, _provider, _tracer = _provider, None, None
+    if provider is not None:
+        provider.shutdown()
+
+
+@contextmanager
+def _span(name: str, attributes: dict[str, Any]) -> Iterator[Any]:
+    from opentelemetry.trace import Status, StatusCode
+
+    with _tracer.start_as_current_span(name, attributes=attributes) as span:
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_status(Status(StatusCode.ERROR, type(exc).__name__))
+            raise
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """A span context manager, or a no-op when tracing is off."""
+    if _tracer is None:
+        return nullcontext()
+    return _span(name, attributes)
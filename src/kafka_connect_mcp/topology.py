@@ -0,0 +1,93 @@
+"""Task placement and skew across the workers of a cluster.
+
+Built from one normalized snapshot in a single pass, so it stays cheap
+enough to poll every few seconds on clusters with thousands of tasks.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import urlsplit
+
+
+def worker_id_from_url(url: str) -> str:
+    """``host:port`` of a worker URL, the form Connect uses for worker ids."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.hostname}:{port}"
+
+
+def _pct(value: float, mean: float) -> float:
+    return round((value - mean) / mean * 100, 1) if mean else 0.0
+
+
+def topology(
+    connectors: list[dict[str, Any]], known_workers: Iterable[str] = ()
+) -> dict[str, Any]:
+    """Tasks per worker, failures and skew for normalized ``connectors``.
+
+    ``known_workers`` names workers that are expected in the cluster (for
+    example the configured worker URLs). Those the snapshot never mentions
+    are listed under ``unseen_workers`` rather than counted as idle: the
+    name may be a load balancer, or a worker that left the group, and
+    either would drag the mean down and inflate the skew. ``skew_pct`` is
+    how far the busiest worker sits above the mean task count over the
+    workers seen in the snapshot; each worker's ``deviation_pct`` is its
+    own distance from it.
+    """
+    tasks: Counter[str] = Counter()
+    instances: Counter[str] = Counter()
+    failed: Counter[str] = Counter()
+    failed_by_class: Counter[str] = Counter()
+    states: Counter[str] = Counter()
+    unassigned = 0
+    for conn in connectors:
+        if conn["worker_id"]:
+            instances[conn["worker_id"]] += 1
+        cls = conn["class"] or "unknown"
+        if conn["state"] == "FAILED":
+            failed_by_class[cls] += 1
+            if conn["worker_id"]:
+                failed[conn["worker_id"]] += 1
+        for task in conn["tasks"]:
+            states[task["state"]] += 1
+            worker = task["worker_id"]
+            if not worker:
+                unassigned += 1
+                continue
+            tasks[worker] += 1
+            if task["state"] == "FAILED":
+                failed[worker] += 1
+                failed_by_class[cls] += 1
+
+    workers = sorted(set(tasks) | set(instances))
+    unseen = sorted(set(known_workers) - set(workers))
+    counts = [tasks[w] for w in workers]
+    mean = sum(counts) / len(counts) if counts else 0.0
+    return {
+        "summary": {
+            "workers": len(workers),
+            "connectors": len(connectors),
+            "tasks": sum(states.values()),
+            "task_states": dict(states),
+            "unassigned_tasks": unassigned,
+            "mean_tasks_per_worker": round(mean, 2),
+            "max_tasks_per_worker": max(counts, default=0),
+            "min_tasks_per_worker": min(counts, default=0),
+            "skew_pct": _pct(max(counts, default=0), mean),
+            "idle_workers": [w for w in workers if not tasks[w]],
+            "unseen_workers": unseen,
+        },
+        "workers": {
+            w: {
+                "tasks": tasks[w],
+                "connectors": instances[w],
+                "failed": failed[w],
+                "deviation_pct": _pct(tasks[w], mean),
+            }
+            for w in workers
+        },
+        "failed_by_class": dict(failed_by_class.most_common()),
+    }
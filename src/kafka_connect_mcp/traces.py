@@ -0,0 +1,154 @@
+"""Deduplication and truncation of Java stack traces in status payloads.
+
+Failed connectors and tasks carry the full Java stack trace in their
+``trace`` field, often tens of kilobytes and identical across every task
+of a connector.  Status tools replace each trace with a short hash, keep
+one compacted copy per distinct trace (exception chain plus root-cause
+frames, cut to a byte budget) and remember the full text so it can be
+fetched by hash on request.  The hash depends only on the trace, so a
+process that never saw it can find it again by re-reading statuses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Any
+
+from kafka_connect_mcp.env import env_int
+
+_FRAME = re.compile(r"^\s+(at |\.\.\. \d+ more)")
+_CAUSED_BY = "Caused by:"
+
+
+def trace_id(trace: str) -> str:
+    """Short, stable identifier for a trace."""
+    return hashlib.sha256(trace.encode()).hexdigest()[:12]
+
+
+def compact_trace(trace: str, budget: int) -> str:
+    """Exception chain and root-cause frames of ``trace``, within ``budget``.
+
+    Keeps the top-level exception line, every ``Caused by:`` line, and as
+    many frames of the innermost cause as fit in ``budget`` bytes.
+    """
+    lines = trace.strip().splitlines()
+    if not lines:
+        return ""
+    headers = [
+        i
+        for i, line in enumerate(lines)
+        if i == 0 or line.lstrip().startswith(_CAUSED_BY)
+    ]
+    root = headers[-1]
+    kept = [lines[i] for i in headers]
+    frames = [line for line in lines[root + 1 :] if _FRAME.match(line)]
+
+    size = sum(len(line.encode()) + 1 for line in kept)
+    shown = 0
+    for frame in frames:
+        cost = len(frame.encode()) + 1
+        if size + cost > budget:
+            break
+        kept.append(frame)
+        size += cost
+        shown += 1
+    omitted = len(lines) - len(headers) - shown
+    if omitted > 0:
+        kept.append(f"\t... {omitted} more lines omitted")
+    return "\n".join(kept)
+
+
+class TraceStore:
+    """Full traces by id, bounded by total size with LRU eviction."""
+
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._traces: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+
+    def put(self, trace: str) -> str:
+        key = trace_id(trace)
+        if key in self._traces:
+            self._traces.move_to_end(key)
+            return key
+        self._traces[key] = trace
+        self._bytes += len(trace.encode())
+        while self._bytes > self.max_bytes and len(self._traces) > 1:
+            _, evicted = self._traces.popitem(last=False)
+            self._bytes -= len(evicted.encode())
+        return key
+
+    def get(self, key: str) -> str | None:
+        trace = self._traces.get(key)
+        if trace is not None:
+            self._traces.move_to_end(key)
+        return trace
+
+    def stats(self) -> dict[str, int]:
+        return {"traces": len(self._traces), "bytes": self._bytes}
+
+
+def default_budget() -> int:
+    return env_int("KAFKA_CONNECT_TRACE_BUDGET", 2048)
+
+
+def dedupe_traces(
+    status: dict[str, Any], store: TraceStore, budget: int
+) -> dict[str, Any]:
+    """Replace traces in a connector status payload with ids.
+
+    Returns a copy where the connector and each task carry ``trace_id``
+    instead of ``trace``, plus a top-level ``traces`` map from id to the
+    compacted trace and the instances that reported it.
+    """
+    traces: dict[str, dict[str, Any]] = {}
+
+    def swap(entry: dict[str, Any], owner: str) -> dict[str, Any]:
+        trace = entry.get("trace")
+        if not trace:
+            return entry
+        key = store.put(trace)
+        if key not in traces:
+            traces[key] = {
+                "summary": compact_trace(trace, budget),
+                "bytes": len(trace.encode()),
+                "seen_in": [],
+            }
+        traces[key]["seen_in"].append(owner)
+        slim = {k: v for k, v in entry.items() if k != "trace"}
+        slim["trace_id"] = key
+        return slim
+
+    result = dict(status)
+    if isinstance(status.get("connector"), dict):
+        result["connector"] = swap(status["connector"], "connector")
+    if isinstance(status.get("tasks"), list):
+        result["tasks"] = [
+            swap(task, f"task {task.get('id')}") for task in status["tasks"]
+        ]
+    if traces:
+        result["traces"] = traces
+    return result
+
+
+def remember_traces(status: dict[str, Any], store: TraceStore) -> None:
+    """Put every trace in a connector status payload into ``store``."""
+    entries = [status.get("connector"), *(status.get("tasks") or [])]
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("trace"):
+            store.put(entry["trace"])
+
+
+def compact_task_trace(
+    task: dict[str, Any], store: TraceStore, budget: int
+) -> dict[str, Any]:
+    """Compact the trace of a single task status payload."""
+    trace = task.get("trace")
+    if not trace:
+        return task
+    result = dict(task)
+    result["trace_id"] = store.put(trace)
+    result["trace"] = compact_trace(trace, budget)
+    return result
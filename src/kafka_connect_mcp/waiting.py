@@ -0,0 +1,114 @@
+"""Server-side polling until a connector reaches a target state."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from kafka_connect_mcp.snapshot import normalize_connector
+
+NOT_FOUND = "NOT_FOUND"
+MAX_TIMEOUT = 600.0
+
+
+def _states(conn: dict[str, Any] | None) -> dict[str, Any]:
+    if conn is None:
+        return {"connector": NOT_FOUND, "tasks": {}}
+    return {
+        "connector": conn["state"],
+        "tasks": {str(t["id"]): t["state"] for t in conn["tasks"]},
+    }
+
+
+def _reached(
+    states: dict[str, Any], connector_state: str, task_state: str | None
+) -> bool:
+    if states["connector"] != connector_state:
+        return False
+    if task_state is None:
+        return True
+    tasks = states["tasks"]
+    return bool(tasks) and all(s == task_state for s in tasks.values())
+
+
+def _failed(states: dict[str, Any]) -> bool:
+    return states["connector"] == "FAILED" or "FAILED" in states[
+        "tasks"
+    ].values()
+
+
+async def wait_for_state(
+    fetch: Callable[[], Awaitable[dict[str, Any] | None]],
+    *,
+    name: str,
+    connector_state: str = "RUNNING",
+    task_state: str | None = "RUNNING",
+    timeout: float = 60.0,
+    fail_fast: bool = True,
+    min_interval: float = 0.5,
+    max_interval: float = 5.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[str, Any]:
+    """Poll ``fetch`` until the connector reaches the target state.
+
+    ``fetch`` returns the raw ``/connectors/{name}/status`` payload, or
+    ``None`` while the connector does not exist yet.  The poll interval
+    starts at ``min_interval`` and grows by half after every poll that
+    shows no change, up to ``max_interval``; any observed transition
+    resets it.  Returns the outcome (``reached``, ``failed`` or
+    ``timeout``), the final compact status and a timeline of every
+    distinct state seen.
+    """
+    connector_state = connector_state.upper()
+    task_state = task_state.upper() if task_state else None
+    timeout = min(max(timeout, 0.0), MAX_TIMEOUT)
+    start = clock()
+    deadline = start + timeout
+    interval = min_interval
+    timeline: list[dict[str, Any]] = []
+    polls = 0
+
+    while True:
+        payload = await fetch()
+        polls += 1
+        conn = (
+            None
+            if payload is None
+            else normalize_connector(name, {"status": payload})
+        )
+        states = _states(conn)
+        now = clock()
+        if not timeline or {
+            k: timeline[-1][k] for k in ("connector", "tasks")
+        } != states:
+            timeline.append({"t": round(now - start, 3), **states})
+            interval = min_interval
+        else:
+            interval = min(max_interval, interval * 1.5)
+
+        if _reached(states, connector_state, task_state):
+            outcome = "reached"
+        elif (
+            fail_fast
+            and _failed(states)
+            and "FAILED" not in (connector_state, task_state)
+        ):
+            outcome = "failed"
+        elif now >= deadline:
+            outcome = "timeout"
+        else:
+            await sleep(min(interval, deadline - now))
+            continue
+
+        return {
+            "name": name,
+            "outcome": outcome,
+            "reached": outcome == "reached",
+            "elapsed": round(now - start, 3),
+            "polls": polls,
+            "status": conn,
+            "timeline": timeline,
+        }
@@ -0,0 +1,230 @@
+"""Background status watcher that records connector/task transitions.
+
+One watcher per cluster polls the expanded ``/connectors`` endpoint at a
+steady interval, diffs each snapshot against the previous one and keeps
+the resulting transitions in a bounded ring buffer.  Every transition
+gets a monotonically increasing cursor, so any number of clients can ask
+"what changed since cursor N" and pay only for the changes.
+
+Cursors are ``<epoch>-<sequence>`` strings.  The epoch is random per
+watcher, so a cursor handed out before a restart (or by another server
+process) is recognised as foreign instead of being read as a position in
+this watcher's buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from kafka_connect_mcp.deadlines import detached_context
+from kafka_connect_mcp.env import env_float, env_int
+
+# {connector: {"state": ..., "tasks": {task_id: state}}}
+States = dict[str, dict[str, Any]]
+
+
+def snapshot_states(connectors: list[dict[str, Any]]) -> States:
+    """Reduce normalized connectors to their connector and task states."""
+    return {
+        c["name"]: {
+            "state": c["state"],
+            "tasks": {t["id"]: t["state"] for t in c["tasks"]},
+        }
+        for c in connectors
+    }
+
+
+def _change(
+    connector: str, task: int | None, was: str | None, now: str | None
+) -> dict[str, Any]:
+    return {"connector": connector, "task": task, "from": was, "to": now}
+
+
+def diff_states(old: States, new: States) -> list[dict[str, Any]]:
+    """Transitions between two snapshots, in a stable order.
+
+    ``from`` is ``None`` for connectors and tasks that appeared and
+    ``to`` is ``None`` for those that disappeared.
+    """
+    changes: list[dict[str, Any]] = []
+    for name in sorted(old.keys() | new.keys()):
+        before = old.get(name)
+        after = new.get(name)
+        if after is None:
+            changes.append(_change(name, None, before["state"], None))
+            continue
+        was = None if before is None else before["state"]
+        if was != after["state"]:
+            changes.append(_change(name, None, was, after["state"]))
+        old_tasks = {} if before is None else before["tasks"]
+        new_tasks = after["tasks"]
+        for task_id in sorted(old_tasks.keys() | new_tasks.keys()):
+            if old_tasks.get(task_id) != new_tasks.get(task_id):
+                changes.append(
+                    _change(
+                        name,
+                        task_id,
+                        old_tasks.get(task_id),
+                        new_tasks.get(task_id),
+                    )
+                )
+    return changes
+
+
+class StatusWatcher:
+    """Poll a cluster's status and buffer the transitions with cursors."""
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+        *,
+        interval: float = 5.0,
+        capacity: int = 10_000,
+    ) -> None:
+        self._fetch = fetch
+        self.interval = interval
+        self._events: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._states: States | None = None
+        self.epoch = secrets.token_hex(4)
+        self._cursor = 0
+        self._task: asyncio.Task[None] | None = None
+        self.ready = asyncio.Event()
+        self.polls = 0
+        self.errors = 0
+        self.last_error: str | None = None
+        self.last_poll: float | None = None
+
+    @classmethod
+    def from_env(
+        cls, fetch: Callable[[], Awaitable[list[dict[str, Any]]]]
+    ) -> StatusWatcher:
+        """Build a watcher from ``KAFKA_CONNECT_WATCH_*`` variables."""
+        return cls(
+            fetch,
+            interval=env_float("KAFKA_CONNECT_WATCH_INTERVAL", 5.0),
+            capacity=env_int("KAFKA_CONNECT_WATCH_BUFFER", 10_000),
+        )
+
+    @property
+    def cursor(self) -> str:
+        return self._format(self._cursor)
+
+    def _format(self, sequence: int) -> str:
+        return f"{self.epoch}-{sequence}"
+
+    def _parse(self, cursor: str) -> int | None:
+        """Sequence in ``cursor``, or ``None`` if another watcher issued it."""
+        epoch, sep, sequence = cursor.rpartition("-")
+        if not sep or not sequence.isdigit():
+            raise ValueError(f"Invalid change cursor '{cursor}'")
+        return int(sequence) if epoch == self.epoch else None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            # Started from a tool call; polls must not inherit its deadline.
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), context=detached_context()
+            )
+
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def poll_once(self) -> None:
+        """Take one snapshot and record its transitions."""
+        try:
+            states = snapshot_states(await self._fetch())
+        except Exception as exc:  # noqa: BLE001 - keep watching
+            self.errors += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            return
+        self.polls += 1
+        self.last_error = None
+        self.last_poll = time.time()
+        if self._states is not None:
+            for change in diff_states(self._states, states):
+                self._cursor += 1
+                self._events.append(
+                    {"cursor": self._cursor, "ts": self.last_poll, **change}
+                )
+        self._states = states
+        self.ready.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(self.interval)
+
+    def changes_since(
+        self, cursor: str | None, limit: int = 500
+    ) -> dict[str, Any]:
+        """Transitions with a cursor greater than ``cursor``.
+
+        ``cursor=None`` returns no changes, just the current cursor to
+        start from.  ``more`` is true when ``limit`` cut the page short
+        (ask again with the returned cursor).  ``truncated`` is true when
+        some changes after ``cursor`` are gone: evicted from the buffer,
+        or ``cursor`` came from before a restart; callers that need a
+        full picture should then re-read a snapshot.
+        """
+        result: dict[str, Any] = {
+            "cursor": self.cursor,
+            "changes": [],
+            "more": False,
+            "truncated": False,
+            "last_poll": self.last_poll,
+            "last_error": self.last_error,
+        }
+        if cursor is None:
+            return result
+        after = self._parse(cursor)
+        if after is None or after > self._cursor:
+            result["truncated"] = True
+            return result
+        if after == self._cursor:
+            return result
+        if not self._events:
+            result["truncated"] = True
+            return result
+        # Cursors in the buffer are contiguous, so wanted events are found
+        # by offset; deque indexing walks from the nearer end, which keeps
+        # a poll for recent changes O(changes) rather than O(buffer).
+        oldest = self._events[0]["cursor"]
+        if after < oldest - 1:
+            result["truncated"] = True
+        start = max(0, after - oldest + 1)
+        stop = min(len(self._events), start + max(limit, 1))
+        changes = []
+        for i in range(start, stop):
+            event = self._events[i]
+            changes.append({**event, "cursor": self._format(event["cursor"])})
+        last = self._events[stop - 1]["cursor"] if changes else self._cursor
+        if last < self._cursor:
+            result["more"] = True
+            result["cursor"] = self._format(last)
+        result["changes"] = changes
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "cursor": self.cursor,
+            "buffered": len(self._events),
+            "capacity": self._events.maxlen,
+            "polls": self.polls,
+            "errors": self.errors,
+        }
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 import respx
 
@@ -12,6 +17,16 @@ from kafka_connect_mcp import server
 def _mock_connect_url(monkeypatch: pytest.MonkeyPatch) -> None:
     """Point all tests at a fake base URL so nothing hits the network."""
     monkeypatch.setattr(server, "CONNECT_URL", "http://fake-connect:8083")
+    monkeypatch.delenv("KAFKA_CONNECT_CLUSTERS", raising=False)
+    monkeypatch.delenv("KAFKA_CONNECT_CLUSTERS_FILE", raising=False)
+    monkeypatch.setenv("KAFKA_CONNECT_RETRY_BASE_DELAY", "0")
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_clusters() -> None:
+    """Give every test fresh cluster state (pooled client, cache, counters)."""
+    yield
+    await server.aclose_clusters()
 
 
 @pytest.fixture(autouse=True)
@@ -31,3 +46,37 @@ def mock_api() -> respx.MockRouter:
     """Provide a respx mock router scoped to the fake Connect URL."""
     with respx.mock(base_url="http://fake-connect:8083") as router:
         yield router
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.peers.add(self.client_address)
+        self.server.paths.append(self.path)
+        time.sleep(self.server.delay)
+        body = json.dumps(["sink-a"]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def live_connect(monkeypatch: pytest.MonkeyPatch) -> ThreadingHTTPServer:
+    """Run a tiny keep-alive HTTP server that records client sockets."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    httpd.peers = set()
+    httpd.paths = []
+    httpd.delay = 0.0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    host, port = httpd.server_address
+    monkeypatch.setattr(server, "CONNECT_URL", f"http://{host}:{port}")
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
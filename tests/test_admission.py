@@ -0,0 +1,103 @@
+"""Tests for mutation admission control."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.admission import MutationRejectedError, MutationScheduler
+from kafka_connect_mcp.server import get_server_stats, pause_connector
+
+
+async def test_serializes_writes_to_same_connector() -> None:
+    scheduler = MutationScheduler("c", rate=0, max_concurrent=10)
+    order: list[str] = []
+
+    async def write(tag: str, connector: str) -> None:
+        async with scheduler.admit(connector):
+            order.append(f"{tag}-start")
+            await asyncio.sleep(0.01)
+            order.append(f"{tag}-end")
+
+    await asyncio.gather(write("a", "x"), write("b", "x"))
+    assert order == ["a-start", "a-end", "b-start", "b-end"]
+    assert scheduler.stats()["peak_queued"] == 1
+    assert scheduler._locks == {}
+
+
+async def test_caps_concurrent_writes() -> None:
+    scheduler = MutationScheduler("c", rate=0, max_concurrent=2)
+    active = peak = 0
+
+    async def write(connector: str) -> None:
+        nonlocal active, peak
+        async with scheduler.admit(connector):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(write(f"c{i}") for i in range(6)))
+    assert peak == 2
+    assert scheduler.stats()["admitted"] == 6
+
+
+async def test_reject_mode_fails_fast_when_rate_limited() -> None:
+    scheduler = MutationScheduler("c", rate=1, burst=1, saturation="reject")
+    async with scheduler.admit("a"):
+        pass
+    with pytest.raises(MutationRejectedError) as exc_info:
+        async with scheduler.admit("b"):
+            pass
+    details = exc_info.value.details
+    assert details["type"] == "mutation_rejected"
+    assert details["reason"] == "write rate limit reached"
+    assert 0 < details["retry_after"] <= 1
+    assert scheduler.stats()["rejected"] == 1
+
+
+async def test_wait_mode_rejects_after_deadline() -> None:
+    scheduler = MutationScheduler("c", rate=0, max_wait=0.02)
+    async with scheduler.admit("a"):
+        with pytest.raises(MutationRejectedError, match="still queued"):
+            async with scheduler.admit("a"):
+                pass
+    stats = scheduler.stats()
+    assert stats["queued"] == 0
+    assert stats["wait_seconds_max"] >= 0.02
+
+
+async def test_full_queue_rejects() -> None:
+    scheduler = MutationScheduler("c", rate=0, max_queue=0)
+    async with scheduler.admit("a"):
+        with pytest.raises(MutationRejectedError, match="already queued"):
+            async with scheduler.admit("a"):
+                pass
+
+
+def test_unknown_saturation_mode() -> None:
+    with pytest.raises(ValueError, match="saturation mode"):
+        MutationScheduler("c", saturation="drop")
+
+
+async def test_tools_go_through_scheduler(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_MUTATION_RATE", "1")
+    monkeypatch.setenv("KAFKA_CONNECT_MUTATION_BURST", "1")
+    monkeypatch.setenv("KAFKA_CONNECT_MUTATION_SATURATION", "reject")
+    route = mock_api.put("/connectors/my-sink/pause").mock(
+        return_value=httpx.Response(202)
+    )
+
+    await pause_connector("my-sink")
+    with pytest.raises(MutationRejectedError):
+        await pause_connector("my-sink")
+
+    assert route.call_count == 1
+    stats = (await get_server_stats())["clusters"]["default"]["mutations"]
+    assert stats["admitted"] == 1
+    assert stats["rejected"] == 1
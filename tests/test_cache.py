@@ -0,0 +1,162 @@
+"""Tests for the TTL read cache and its invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.cache import MISSING, TTLCache
+from kafka_connect_mcp.server import (
+    get_cluster_info,
+    get_connector_config,
+    get_server_stats,
+    list_connectors,
+    pause_connector,
+    update_connector_config,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_per_kind() -> None:
+    clock = _FakeClock()
+    cache = TTLCache(
+        max_entries=10, ttls={"short": 1.0, "long": 60.0}, clock=clock
+    )
+    cache.set(("short",), "a")
+    cache.set(("long",), "b")
+
+    clock.now = 5.0
+    assert cache.get(("short",)) is MISSING
+    assert cache.get(("long",)) == "b"
+
+
+def test_unknown_or_zero_ttl_is_not_cached() -> None:
+    cache = TTLCache(max_entries=10, ttls={"off": 0.0})
+    cache.set(("off",), "a")
+    cache.set(("other",), "b")
+    assert len(cache) == 0
+
+
+def test_lru_eviction() -> None:
+    cache = TTLCache(max_entries=2, ttls={"k": 60.0})
+    cache.set(("k", 1), 1)
+    cache.set(("k", 2), 2)
+    cache.get(("k", 1))
+    cache.set(("k", 3), 3)
+
+    assert cache.get(("k", 2)) is MISSING
+    assert cache.get(("k", 1)) == 1
+    assert cache.stats()["evictions"] == 1
+
+
+async def test_repeated_reads_hit_cache(mock_api: respx.MockRouter) -> None:
+    route = mock_api.get("/").mock(
+        return_value=httpx.Response(200, json={"version": "7.7.0"})
+    )
+    for _ in range(3):
+        assert (await get_cluster_info())["version"] == "7.7.0"
+
+    assert route.call_count == 1
+    stats = (await get_server_stats())["clusters"]["default"]["cache"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+async def test_fresh_bypasses_cache(mock_api: respx.MockRouter) -> None:
+    route = mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["a"])
+    )
+    await list_connectors()
+    await list_connectors(fresh=True)
+    assert route.call_count == 2
+
+
+async def test_update_invalidates_connector_config(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.get("/connectors/my-sink/config").mock(
+        side_effect=[
+            httpx.Response(200, json={"topics": "old"}),
+            httpx.Response(200, json={"topics": "new"}),
+        ]
+    )
+    mock_api.put("/connectors/my-sink/config").mock(
+        return_value=httpx.Response(200, json={"name": "my-sink"})
+    )
+
+    assert (await get_connector_config("my-sink"))["topics"] == "old"
+    assert (await get_connector_config("my-sink"))["topics"] == "old"
+    await update_connector_config("my-sink", {"topics": "new"})
+    assert (await get_connector_config("my-sink"))["topics"] == "new"
+    assert route.call_count == 2
+
+
+async def test_mutation_only_invalidates_its_connector(
+    mock_api: respx.MockRouter,
+) -> None:
+    other = mock_api.get("/connectors/other/config").mock(
+        return_value=httpx.Response(200, json={"topics": "x"})
+    )
+    mock_api.put("/connectors/my-sink/pause").mock(
+        return_value=httpx.Response(202)
+    )
+
+    await get_connector_config("other")
+    await pause_connector("my-sink")
+    await get_connector_config("other")
+    assert other.call_count == 1
+
+
+async def test_errors_are_not_cached(mock_api: respx.MockRouter) -> None:
+    route = mock_api.get("/connectors/missing/config").mock(
+        return_value=httpx.Response(404, json={"message": "not found"})
+    )
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_connector_config("missing")
+    assert route.call_count == 2
+
+
+async def test_read_in_flight_during_mutation_is_not_cached(
+    mock_api: respx.MockRouter,
+) -> None:
+    release = asyncio.Event()
+    started = asyncio.Event()
+    configs = iter([{"topics": "old"}, {"topics": "new"}])
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        body = next(configs)
+        if body["topics"] == "old":
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json=body)
+
+    route = mock_api.get("/connectors/my-sink/config").mock(
+        side_effect=respond
+    )
+    mock_api.put("/connectors/my-sink/config").mock(
+        return_value=httpx.Response(200, json={"name": "my-sink"})
+    )
+
+    before = asyncio.create_task(get_connector_config("my-sink"))
+    await started.wait()
+    await update_connector_config("my-sink", {"topics": "new"})
+    # Started after the update, so it must not join the older read.
+    after = asyncio.create_task(get_connector_config("my-sink"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await before)["topics"] == "old"
+    assert (await after)["topics"] == "new"
+    assert (await get_connector_config("my-sink"))["topics"] == "new"
+    assert route.call_count == 2
@@ -0,0 +1,66 @@
+"""Tests for the pooled Connect HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from kafka_connect_mcp import server
+from kafka_connect_mcp.client import ClientSettings
+
+
+async def test_repeated_tool_calls_reuse_one_connection(
+    live_connect: ThreadingHTTPServer,
+) -> None:
+    for _ in range(5):
+        assert await server.list_connectors() == ["sink-a"]
+    assert len(live_connect.peers) == 1
+
+
+async def test_concurrent_tool_calls_share_the_pool(
+    live_connect: ThreadingHTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_MAX_CONNECTIONS", "4")
+    # Distinct paths, so neither coalescing nor the read cache can fold
+    # the calls into one request; the delay keeps them overlapping.
+    live_connect.delay = 0.02
+    results = await asyncio.gather(
+        *(server.get_connector_config(f"sink-{i}") for i in range(50))
+    )
+    assert results == [["sink-a"]] * 50
+    assert len(live_connect.paths) == 50
+    assert 1 < len(live_connect.peers) <= 4
+
+
+async def test_client_is_shared_until_closed() -> None:
+    cluster = server._cluster(None)
+    first = cluster.client()
+    assert cluster.client() is first
+    await cluster.aclose()
+    assert first.is_closed
+    assert cluster.client() is not first
+
+
+def test_settings_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("KAFKA_CONNECT_MAX_KEEPALIVE_CONNECTIONS", "3")
+    monkeypatch.setenv("KAFKA_CONNECT_KEEPALIVE_EXPIRY", "12.5")
+    monkeypatch.setenv("KAFKA_CONNECT_CONNECT_TIMEOUT", "2")
+    monkeypatch.setenv("KAFKA_CONNECT_READ_TIMEOUT", "45")
+
+    settings = ClientSettings.from_env()
+    assert settings.max_connections == 7
+    assert settings.max_keepalive_connections == 3
+    assert settings.keepalive_expiry == 12.5
+    assert settings.timeout.connect == 2
+    assert settings.timeout.read == 45
+    assert settings.http2 is False
+
+
+def test_settings_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("KAFKA_CONNECT_MAX_CONNECTIONS", raising=False)
+    settings = ClientSettings.from_env()
+    assert settings.max_connections == 100
+    assert settings.timeout.read == 30
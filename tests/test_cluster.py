@@ -8,7 +8,7 @@ import respx
 from kafka_connect_mcp.server import get_cluster_info
 
 
-def test_get_cluster_info(mock_api: respx.MockRouter) -> None:
+async def test_get_cluster_info(mock_api: respx.MockRouter) -> None:
     payload = {
         "version": "7.7.0-ce",
         "commit": "abc123",
@@ -16,6 +16,6 @@ def test_get_cluster_info(mock_api: respx.MockRouter) -> None:
     }
     mock_api.get("/").mock(return_value=httpx.Response(200, json=payload))
 
-    result = get_cluster_info()
+    result = await get_cluster_info()
     assert result["version"] == "7.7.0-ce"
     assert result["kafka_cluster_id"] == "cluster-1"
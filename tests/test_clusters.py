@@ -0,0 +1,164 @@
+"""Tests for the multi-cluster registry and cross-cluster tools."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp import server
+from kafka_connect_mcp.clusters import ClusterRegistry, UnknownClusterError
+from kafka_connect_mcp.safety import PolicyBlockedError
+from kafka_connect_mcp.server import (
+    get_fleet_snapshot,
+    list_clusters,
+    list_connectors,
+    restart_task,
+)
+
+CLUSTERS = {
+    "default": "eu",
+    "clusters": {
+        "eu": {
+            "url": "http://connect-eu:8083",
+            "read_timeout": 60,
+            "auth": {"username": "svc", "password_env": "EU_PASSWORD"},
+        },
+        "us": {
+            "urls": ["http://connect-us:8083"],
+            "policy": {"KAFKA_CONNECT_ENABLE_RESTART": False},
+        },
+    },
+}
+
+
+def _status(state: str) -> dict:
+    return {
+        "status": {
+            "connector": {"state": "RUNNING", "worker_id": "w1"},
+            "tasks": [{"id": 0, "state": state, "worker_id": "w1"}],
+            "type": "sink",
+        },
+        "info": {"config": {"connector.class": "S3Sink"}},
+    }
+
+
+@pytest.fixture()
+def two_clusters(monkeypatch: pytest.MonkeyPatch) -> respx.MockRouter:
+    monkeypatch.setenv("KAFKA_CONNECT_CLUSTERS", json.dumps(CLUSTERS))
+    monkeypatch.setenv("EU_PASSWORD", "s3cret")
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+def test_cluster_config_repr_hides_secrets(two_clusters: respx.MockRouter) -> None:
+    config = server._cluster("eu").config
+    assert config.password == "s3cret"
+    assert "s3cret" not in repr(config)
+
+
+async def test_list_clusters(two_clusters: respx.MockRouter) -> None:
+    result = await list_clusters()
+    assert result["default"] == "eu"
+    assert [c["name"] for c in result["clusters"]] == ["eu", "us"]
+
+
+async def test_cluster_argument_routes_requests(
+    two_clusters: respx.MockRouter,
+) -> None:
+    eu = two_clusters.get("http://connect-eu:8083/connectors").mock(
+        return_value=httpx.Response(200, json=["eu-sink"])
+    )
+    us = two_clusters.get("http://connect-us:8083/connectors").mock(
+        return_value=httpx.Response(200, json=["us-sink"])
+    )
+
+    assert await list_connectors() == ["eu-sink"]
+    assert await list_connectors(cluster="us") == ["us-sink"]
+    assert eu.call_count == 1 and us.call_count == 1
+    assert eu.calls[0].request.headers["Authorization"].startswith("Basic ")
+
+
+async def test_each_cluster_has_its_own_client_and_settings(
+    two_clusters: respx.MockRouter,
+) -> None:
+    eu = server._cluster("eu")
+    us = server._cluster("us")
+    assert eu.client() is not us.client()
+    assert eu.config.client.read_timeout == 60
+    assert us.config.client.read_timeout == 30
+
+
+async def test_unknown_cluster(two_clusters: respx.MockRouter) -> None:
+    with pytest.raises(UnknownClusterError) as exc:
+        await list_connectors(cluster="apac")
+    assert exc.value.details["known_clusters"] == ["eu", "us"]
+
+
+async def test_per_cluster_policy(two_clusters: respx.MockRouter) -> None:
+    route = two_clusters.post(
+        "http://connect-eu:8083/connectors/my-sink/tasks/0/restart"
+    ).mock(return_value=httpx.Response(204))
+
+    await restart_task("my-sink", 0, cluster="eu")
+    assert route.call_count == 1
+
+    with pytest.raises(PolicyBlockedError) as exc:
+        await restart_task("my-sink", 0, cluster="us")
+    assert exc.value.details["cluster"] == "us"
+    assert len(two_clusters.calls) == 1
+
+
+async def test_fleet_snapshot_merges_and_reports_errors(
+    two_clusters: respx.MockRouter,
+) -> None:
+    two_clusters.get("http://connect-eu:8083/connectors").mock(
+        return_value=httpx.Response(
+            200, json={"a": _status("FAILED"), "b": _status("RUNNING")}
+        )
+    )
+    two_clusters.get("http://connect-us:8083/connectors").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+
+    result = await get_fleet_snapshot(task_state="FAILED")
+    assert [(c["cluster"], c["name"]) for c in result["connectors"]] == [
+        ("eu", "a")
+    ]
+    assert result["summary"]["task_states"] == {"FAILED": 1}
+    assert "ConnectError" in result["errors"]["us"]
+
+
+def test_toml_cluster_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "clusters.toml"
+    path.write_text(
+        '[clusters.staging]\n'
+        'url = "http://staging:8083"\n'
+        '[clusters.staging.auth]\n'
+        'token = "abc"\n'
+    )
+    monkeypatch.setenv("KAFKA_CONNECT_CLUSTERS_FILE", str(path))
+
+    registry = ClusterRegistry.from_env("http://unused:8083")
+    cluster = registry.get()
+    assert cluster.name == "staging"
+    assert cluster.config.headers == {"Authorization": "Bearer abc"}
+
+
+def test_default_registry_uses_connect_url() -> None:
+    registry = ClusterRegistry.from_env("http://single:8083")
+    assert registry.names == ["default"]
+    assert registry.get().base_url == "http://single:8083"
+
+
+def test_missing_url_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(
+        "KAFKA_CONNECT_CLUSTERS", json.dumps({"clusters": {"x": {}}})
+    )
+    with pytest.raises(ValueError, match="needs a 'url'"):
+        ClusterRegistry.from_env("http://unused:8083")
@@ -0,0 +1,181 @@
+"""Tests for the shared daemon and the stdio shim that forwards to it."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp import shim
+from kafka_connect_mcp.daemon import _claim_socket, serve
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+def _call(request_id: int, tool: str, arguments: dict | None = None) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool, "arguments": arguments or {}},
+    }
+
+
+def _lines(*messages: dict) -> bytes:
+    return b"".join(json.dumps(m).encode() + b"\n" for m in messages)
+
+
+@pytest.fixture()
+def sock_path(tmp_path: Path) -> str:
+    return str(tmp_path / "d.sock")
+
+
+async def _session(path: str, *messages: dict) -> list[dict]:
+    """Run one MCP session over the socket and return every reply."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(_lines(INITIALIZE, INITIALIZED, *messages))
+    await writer.drain()
+    replies = []
+    while len(replies) < len(messages) + 1:
+        replies.append(json.loads(await reader.readline()))
+    writer.close()
+    return replies
+
+
+async def _wait_listening(path: str) -> None:
+    for _ in range(200):
+        if os.path.exists(path):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("daemon never listened")
+
+
+def test_socket_path_follows_settings() -> None:
+    base = {"XDG_RUNTIME_DIR": "/run/user/1"}
+    a = shim.socket_path({**base, "KAFKA_CONNECT_URL": "http://a:8083"})
+    again = shim.socket_path({**base, "KAFKA_CONNECT_URL": "http://a:8083"})
+    b = shim.socket_path({**base, "KAFKA_CONNECT_URL": "http://b:8083"})
+
+    assert a == again
+    assert a != b
+    assert a.startswith(f"/run/user/1/kafka-connect-mcp-{os.getuid()}/")
+    assert shim.socket_path({"KAFKA_CONNECT_MCP_SOCKET": "/x.sock"}) == (
+        "/x.sock"
+    )
+
+
+def test_relative_config_files_are_resolved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    env = shim.daemon_env({"KAFKA_CONNECT_POLICY_FILE": "policy.toml"})
+
+    assert env["KAFKA_CONNECT_POLICY_FILE"] == str(tmp_path / "policy.toml")
+
+
+async def test_sessions_share_cluster_state(
+    sock_path: str, mock_api: respx.MockRouter
+) -> None:
+    route = mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["sink-a"])
+    )
+    daemon = asyncio.create_task(serve(sock_path, idle_timeout=0))
+    await _wait_listening(sock_path)
+
+    first, second = await asyncio.gather(
+        _session(sock_path, _call(1, "list_connectors")),
+        _session(sock_path, _call(1, "list_connectors")),
+    )
+    third = await _session(sock_path, _call(1, "list_connectors"))
+    daemon.cancel()
+    await asyncio.gather(daemon, return_exceptions=True)
+
+    for replies in (first, second, third):
+        assert replies[1]["result"]["structuredContent"] == {
+            "result": ["sink-a"]
+        }
+    # One pooled cluster and read cache behind every session.
+    assert route.call_count == 1
+
+
+async def test_daemon_exits_when_idle(sock_path: str) -> None:
+    await asyncio.wait_for(serve(sock_path, idle_timeout=0.01), timeout=5)
+
+    assert not os.path.exists(sock_path)
+
+
+async def test_claim_socket_refuses_running_daemon(sock_path: str) -> None:
+    daemon = asyncio.create_task(serve(sock_path, idle_timeout=0))
+    await _wait_listening(sock_path)
+    try:
+        with pytest.raises(RuntimeError, match="already listening"):
+            _claim_socket(sock_path)
+    finally:
+        daemon.cancel()
+        await asyncio.gather(daemon, return_exceptions=True)
+
+
+def test_claim_socket_removes_stale_socket(sock_path: str) -> None:
+    Path(sock_path).touch()
+
+    _claim_socket(sock_path)
+
+    assert not os.path.exists(sock_path)
+
+
+def test_shim_starts_daemon_on_first_use(tmp_path: Path) -> None:
+    path = str(tmp_path / "d.sock")
+    src = str(Path(shim.__file__).resolve().parents[1])
+    env = {
+        **os.environ,
+        "PYTHONPATH": src,
+        "KAFKA_CONNECT_MCP_SOCKET": path,
+        "KAFKA_CONNECT_MCP_IDLE_TIMEOUT": "5",
+    }
+    stdin = _lines(INITIALIZE, INITIALIZED, _call(1, "list_clusters"))
+
+    for _ in range(2):
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "kafka_connect_mcp.shim"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        # Fail rather than hang if the daemon never answers.
+        watchdog = threading.Timer(60, proc.kill)
+        watchdog.start()
+        proc.stdin.write(stdin)
+        proc.stdin.flush()
+        # Like a real client, hang up only after the replies are in: MCP
+        # servers may drop requests still in flight when stdin closes.
+        replies = [json.loads(proc.stdout.readline()) for _ in range(2)]
+        proc.stdin.close()
+        returncode = proc.wait(timeout=60)
+        watchdog.cancel()
+        assert returncode == 0, proc.stderr.read().decode()
+        proc.stdout.close()
+        proc.stderr.close()
+        assert [r["id"] for r in replies] == [0, 1]
+
+    # Both sessions were served by the one daemon, which then idles out.
+    log = Path(f"{path}.log").read_text()
+    assert log.count("daemon listening") == 1
@@ -0,0 +1,291 @@
+"""Tests for per-call deadlines and cancellation of upstream requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client
+from fastmcp.server.dependencies import get_context
+
+from kafka_connect_mcp import deadlines, server
+from kafka_connect_mcp.deadlines import DeadlineSettings, _requested_timeout
+from kafka_connect_mcp.watcher import StatusWatcher
+
+REBALANCE = httpx.Response(
+    409, json={"message": "Cannot complete request: rebalance expected"}
+)
+
+
+@pytest.fixture()
+def api() -> respx.MockRouter:
+    # respx only counts calls that returned, and these never do.
+    with respx.mock(
+        base_url="http://fake-connect:8083", assert_all_called=False
+    ) as router:
+        yield router
+
+
+class Hang:
+    """respx side effect that never answers and records its cancellation."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+        self.cancelled = asyncio.Event()
+        self.request_id: str | int | None = None
+
+    async def respond(self, request: httpx.Request) -> httpx.Response:
+        # Runs inside the tool call, so this is the MCP request's id as
+        # it went over the wire.
+        self.request_id = get_context().request_context.request_id
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        raise AssertionError("unreachable")
+
+
+def test_budget_per_tool_and_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUT", "20")
+    monkeypatch.setenv(
+        "KAFKA_CONNECT_TOOL_TIMEOUTS",
+        "get_cluster_snapshot=5, list_clusters=0",
+    )
+    settings = DeadlineSettings.from_env()
+
+    assert settings.budget("get_connector") == 20
+    assert settings.budget("get_cluster_snapshot") == 5
+    assert settings.budget("wait_for_connector_state") == 660
+    assert settings.budget("list_clusters") is None
+    # A call may shorten its budget but not extend it.
+    assert settings.budget("get_connector", requested=2) == 2
+    assert settings.budget("get_connector", requested=90) == 20
+    assert settings.budget("list_clusters", requested=3) == 3
+
+
+def test_malformed_budget_is_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUTS", "get_connector")
+
+    with pytest.raises(ValueError, match="tool=seconds"):
+        DeadlineSettings.from_env()
+
+
+async def test_deadline_cancels_upstream_request(
+    api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUT", "0.2")
+    hang = Hang()
+    api.get("/connectors/stuck/status").mock(side_effect=hang.respond)
+
+    start = time.monotonic()
+    async with Client(server.mcp) as client:
+        result = await client.call_tool(
+            "get_connector_status", {"name": "stuck"}, raise_on_error=False
+        )
+
+    assert result.is_error
+    assert "did not finish within 0.2s" in result.content[0].text
+    assert hang.cancelled.is_set()
+    assert time.monotonic() - start < 5
+
+
+async def test_call_meta_shortens_deadline(api: respx.MockRouter) -> None:
+    hang = Hang()
+    api.get("/connectors/stuck/config").mock(side_effect=hang.respond)
+
+    async with Client(server.mcp) as client:
+        result = await client.call_tool(
+            "get_connector_config",
+            {"name": "stuck"},
+            meta={"timeout": 0.1},
+            raise_on_error=False,
+        )
+
+    assert result.is_error
+    assert "within 0.1s" in result.content[0].text
+    assert hang.cancelled.is_set()
+
+
+async def test_client_cancellation_aborts_upstream_request(
+    api: respx.MockRouter,
+) -> None:
+    hang = Hang()
+    api.get("/connectors/stuck/status").mock(side_effect=hang.respond)
+
+    async with Client(server.mcp) as client:
+        call = asyncio.create_task(
+            client.call_tool("get_connector_status", {"name": "stuck"})
+        )
+        await asyncio.wait_for(hang.started.wait(), timeout=5)
+        # Not every SDK sends notifications/cancelled when the calling task
+        # is cancelled, so send it explicitly.  The server must drop the
+        # Connect request now, not when the read timeout expires.
+        await client.cancel(hang.request_id, "no longer needed")
+        await asyncio.wait_for(hang.cancelled.wait(), timeout=5)
+        call.cancel()
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [{"timeout": 0.5}, SimpleNamespace(timeout="0.5"), {"timeout": "soon"}],
+)
+def test_requested_timeout_reads_dict_and_model_meta(meta: object) -> None:
+    # Newer SDKs hand ``_meta`` over as a dict, older ones as a pydantic
+    # model with the extra fields as attributes.
+    request = SimpleNamespace(meta=meta)
+    context = SimpleNamespace(
+        message=SimpleNamespace(meta=None),
+        fastmcp_context=SimpleNamespace(request_context=request),
+    )
+
+    expected = None if meta == {"timeout": "soon"} else 0.5
+    assert _requested_timeout(context) == expected
+
+
+async def test_retries_stop_at_deadline(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUT", "1")
+    monkeypatch.setenv("KAFKA_CONNECT_RETRY_MAX_DELAY", "10")
+    route = mock_api.get("/connectors").mock(
+        return_value=httpx.Response(
+            409,
+            headers={"Retry-After": "5"},
+            json={"message": "Cannot complete request: rebalance expected"},
+        )
+    )
+
+    async with Client(server.mcp) as client:
+        result = await client.call_tool(
+            "list_connectors", {}, raise_on_error=False
+        )
+
+    # Gave up instead of sleeping 5s into a 1s budget, and says when to
+    # come back.
+    assert result.is_error
+    assert "rebalance in progress" in result.content[0].text
+    assert route.call_count == 1
+
+
+async def test_worker_silent_past_deadline_is_marked_down(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        server, "CONNECT_URL", "http://w1:8083,http://w2:8083"
+    )
+    monkeypatch.setenv("KAFKA_CONNECT_HEALTH_CHECK_INTERVAL", "0")
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUT", "0.2")
+    hang = Hang()
+    with respx.mock(assert_all_called=False) as router:
+        router.get("http://w1:8083/connectors").mock(
+            side_effect=hang.respond
+        )
+        healthy = router.get("http://w2:8083/connectors").mock(
+            return_value=httpx.Response(200, json=["a"])
+        )
+        async with Client(server.mcp) as client:
+            first = await client.call_tool(
+                "list_connectors", {"fresh": True}, raise_on_error=False
+            )
+            second = await client.call_tool(
+                "list_connectors", {"fresh": True}, raise_on_error=False
+            )
+            third = await client.call_tool(
+                "list_connectors", {"fresh": True}, raise_on_error=False
+            )
+            workers = server._cluster(None).workers.stats()["workers"]
+
+    assert first.is_error
+    assert not second.is_error and not third.is_error
+    # Round-robin would have sent the third call back to w1.
+    assert healthy.call_count == 2
+    assert workers[0]["healthy"] is False
+    assert "deadline" in workers[0]["last_error"]
+
+
+async def test_malformed_budget_fails_at_startup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_TOOL_TIMEOUTS", "get_connector")
+
+    with pytest.raises(Exception) as excinfo:
+        async with Client(server.mcp):
+            pass
+
+    # Some SDKs wrap lifespan errors; the cause must still be ours.
+    chain = []
+    error: BaseException | None = excinfo.value
+    while error is not None:
+        chain.append(str(error))
+        error = error.__cause__ or error.__context__
+    assert any("tool=seconds" in message for message in chain)
+
+
+async def test_coalesced_request_keeps_longest_waiters_deadline(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_RETRY_BASE_DELAY", "0.01")
+    started = asyncio.Event()
+
+    async def slow_rebalance(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(0.2)
+        return REBALANCE
+
+    mock_api.get("/connectors").mock(
+        side_effect=[slow_rebalance, httpx.Response(200, json=["a"])]
+    )
+
+    async with Client(server.mcp) as client:
+        short = asyncio.create_task(
+            client.call_tool(
+                "list_connectors",
+                {"fresh": True},
+                meta={"timeout": 0.05},
+                raise_on_error=False,
+            )
+        )
+        await asyncio.wait_for(started.wait(), timeout=5)
+        # Joins the short call's request, with the default 60s budget.
+        long = await client.call_tool(
+            "list_connectors", {"fresh": True}, raise_on_error=False
+        )
+        short = await short
+
+    assert short.is_error
+    assert "within 0.1s" in short.content[0].text
+    # The shared request retried the rebalance under the longer budget:
+    # only the second response lists a connector.
+    assert not long.is_error
+    assert long.structured_content == {"result": ["a"]}
+
+
+async def test_background_tasks_do_not_inherit_call_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    budgets: list[float | None] = []
+
+    async def fetch() -> list[dict]:
+        budgets.append(deadlines.remaining())
+        return []
+
+    watcher = StatusWatcher(fetch, interval=0)
+    token = deadlines._deadline.set(asyncio.get_running_loop().time() + 0.01)
+    try:
+        watcher.start()
+    finally:
+        deadlines._deadline.reset(token)
+    await asyncio.sleep(0.05)
+    await watcher.aclose()
+
+    assert budgets and budgets == [None] * len(budgets)
@@ -0,0 +1,93 @@
+"""Tests for the simulated Connect cluster used by the benchmarks.
+
+The tools run end to end against it, so these also check that the
+simulator speaks enough of the REST API for every benchmark scenario.
+"""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from benchmarks.fake_connect import SimSettings, build_app, make_trace
+from kafka_connect_mcp import server
+
+
+def _serve(mock_api: respx.MockRouter, **settings) -> object:
+    app = build_app(SimSettings(**settings))
+    mock_api.route().mock(side_effect=respx.ASGIHandler(app))
+    return app.state.cluster
+
+
+def test_trace_has_requested_size_and_cause_chain() -> None:
+    trace = make_trace(20_000, seed=1)
+
+    assert 20_000 <= len(trace) < 20_200
+    assert trace.count("Caused by:") == 2
+    assert trace == make_trace(20_000, seed=1)
+
+
+async def test_tools_run_against_simulator(mock_api: respx.MockRouter) -> None:
+    cluster = _serve(mock_api, connectors=8, failed_fraction=1.0, seed=3)
+
+    snapshot = await server.get_cluster_snapshot(task_state="FAILED")
+    status = await server.get_connector_status("sink-0000")
+    topology = await server.get_cluster_topology()
+    validation = await server.validate_connector_config(
+        "org.apache.kafka.connect.file.FileStreamSinkConnector",
+        {"file": "/tmp/out"},
+    )
+
+    assert snapshot["summary"]["connectors"] == 8
+    assert status["traces"]  # large traces were deduplicated
+    assert {"worker-1:8083", "worker-2:8083", "worker-3:8083"} <= set(
+        topology["workers"]
+    )
+    assert validation["remote"]["error_count"] == 0
+    assert cluster.requests >= 4
+
+
+async def test_restart_failed_recovers_tasks(
+    mock_api: respx.MockRouter,
+) -> None:
+    cluster = _serve(mock_api, connectors=6, failed_fraction=1.0)
+
+    await server.restart_failed(rate_per_second=0)
+
+    assert all(
+        task["state"] == "RUNNING"
+        for conn in cluster.connectors.values()
+        for task in conn["tasks"]
+    )
+
+
+async def test_writes_open_rebalance_window() -> None:
+    app = build_app(SimSettings(connectors=2, rebalance_after_write=60))
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://sim"
+    ) as client:
+        paused = await client.put("/connectors/sink-0000/pause")
+        resp = await client.get("/connectors")
+        created = await client.post(
+            "/connectors", json={"name": "x", "config": {}}
+        )
+
+    assert paused.status_code == 202
+    assert resp.status_code == 409
+    assert "rebalance" in resp.json()["message"]
+    assert created.status_code == 409
+    assert app.state.cluster.conflicts == 2
+
+
+@pytest.mark.parametrize(
+    "path", ["/connectors/nope", "/connectors/nope/status"]
+)
+async def test_unknown_connector_is_404(path: str) -> None:
+    app = build_app(SimSettings(connectors=1))
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://sim"
+    ) as client:
+        resp = await client.get(path)
+
+    assert resp.status_code == 404
@@ -0,0 +1,33 @@
+"""Tests that drive tools through the MCP protocol rather than direct calls."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+from fastmcp import Client
+
+from kafka_connect_mcp.server import mcp
+
+
+async def test_tools_are_registered() -> None:
+    async with Client(mcp) as client:
+        tools = {tool.name for tool in await client.list_tools()}
+    assert {"list_connectors", "get_connector_status", "restart_task"} <= tools
+
+
+async def test_call_tool_over_mcp(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors/my-sink/status").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "name": "my-sink",
+                "connector": {"state": "RUNNING", "worker_id": "w1:8083"},
+                "tasks": [],
+            },
+        )
+    )
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "get_connector_status", {"name": "my-sink"}
+        )
+    assert result.data["connector"]["state"] == "RUNNING"
@@ -0,0 +1,159 @@
+"""Tests for metrics, the /metrics endpoint and optional tracing."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client
+
+from kafka_connect_mcp import metrics, server, telemetry
+from kafka_connect_mcp.metrics import Histogram, Registry, endpoint_template
+
+
+def test_endpoint_template() -> None:
+    assert endpoint_template("/connectors") == "/connectors"
+    assert endpoint_template("/connectors/pg-sink/status") == (
+        "/connectors/{name}/status"
+    )
+    assert endpoint_template("/connectors/pg-sink/tasks/3/restart") == (
+        "/connectors/{name}/tasks/{id}/restart"
+    )
+    assert endpoint_template(
+        "/connector-plugins/JdbcSinkConnector/config/validate"
+    ) == "/connector-plugins/{plugin}/config/validate"
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = Registry()
+    hist = registry.histogram("demo_seconds", "Demo.", ("tool",))
+    assert isinstance(hist, Histogram)
+    for value in (0.0004, 0.02, 7.0, 100.0):
+        hist.observe(value, "t")
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{tool="t",le="0.0005"} 1.0' in text
+    assert 'demo_seconds_bucket{tool="t",le="0.025"} 2.0' in text
+    assert 'demo_seconds_bucket{tool="t",le="10.0"} 3.0' in text
+    assert 'demo_seconds_bucket{tool="t",le="+Inf"} 4.0' in text
+    assert 'demo_seconds_count{tool="t"} 4.0' in text
+
+
+async def test_tool_calls_are_counted_and_timed(
+    mock_api: respx.MockRouter,
+) -> None:
+    mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["a"])
+    )
+    mock_api.get("/connectors/missing/status").mock(
+        return_value=httpx.Response(404, json={"message": "not found"})
+    )
+    calls = metrics.TOOL_CALLS.value("list_connectors")
+    timed = metrics.TOOL_LATENCY.count("list_connectors")
+    errors = metrics.TOOL_ERRORS.value(
+        "get_connector_status", "HTTPStatusError"
+    )
+
+    async with Client(server.mcp) as client:
+        await client.call_tool("list_connectors", {})
+        await client.call_tool(
+            "get_connector_status", {"name": "missing"}, raise_on_error=False
+        )
+
+    assert metrics.TOOL_CALLS.value("list_connectors") == calls + 1
+    assert metrics.TOOL_LATENCY.count("list_connectors") == timed + 1
+    assert (
+        metrics.TOOL_ERRORS.value("get_connector_status", "HTTPStatusError")
+        == errors + 1
+    )
+
+
+async def test_upstream_phases_are_timed(
+    live_connect: ThreadingHTTPServer,
+) -> None:
+    before = {
+        phase: metrics.UPSTREAM_PHASES.count("default", "/connectors", phase)
+        for phase in ("connect", "ttfb", "body")
+    }
+    await server.list_connectors(fresh=True)
+    await server.list_connectors(fresh=True)
+
+    count = metrics.UPSTREAM_PHASES.count
+    # One new connection, then keep-alive reuse.
+    assert count("default", "/connectors", "connect") == before["connect"] + 1
+    assert count("default", "/connectors", "ttfb") == before["ttfb"] + 2
+    assert count("default", "/connectors", "body") == before["body"] + 2
+    assert metrics.UPSTREAM_REQUESTS.value(
+        "default", "GET", "/connectors", "200"
+    ) >= 2
+    stats = server._cluster(None).stats()["pool"]
+    assert stats == {"connections": 1, "idle": 1}
+
+
+async def test_metrics_endpoint(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["a"])
+    )
+    await server.list_connectors()
+    await server.list_connectors()
+
+    transport = httpx.ASGITransport(app=server.mcp.http_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://mcp"
+    ) as client:
+        resp = await client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'kafka_connect_mcp_cache_hits_total{cluster="default"} 1.0' in (
+        resp.text
+    )
+    assert "# TYPE kafka_connect_mcp_upstream_duration_seconds histogram" in (
+        resp.text
+    )
+
+
+class _Collector(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers["Content-Length"])
+        self.server.exports.append((self.path, self.rfile.read(length)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+async def test_spans_are_exported_to_collector(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    pytest.importorskip("opentelemetry.exporter.otlp.proto.http")
+    collector = ThreadingHTTPServer(("127.0.0.1", 0), _Collector)
+    collector.exports = []
+    threading.Thread(target=collector.serve_forever, daemon=True).start()
+    host, port = collector.server_address
+    mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["a"])
+    )
+
+    try:
+        assert telemetry.configure_tracing(f"http://{host}:{port}/v1/traces")
+        async with Client(server.mcp) as client:
+            await client.call_tool("list_connectors", {"fresh": True})
+        telemetry.shutdown_tracing()
+    finally:
+        telemetry.shutdown_tracing()
+        collector.shutdown()
+        collector.server_close()
+
+    assert collector.exports
+    path, body = collector.exports[0]
+    assert path == "/v1/traces"
+    assert b"tool list_connectors" in body
+    assert b"GET /connectors" in body
@@ -0,0 +1,130 @@
+"""Tests for merge-patch config updates."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import respx
+
+from kafka_connect_mcp.patching import config_diff, merge_patch
+from kafka_connect_mcp.server import get_connector_config, patch_connector_config
+
+CONFIG = {
+    "name": "my-sink",
+    "connector.class": "FileStreamSink",
+    "tasks.max": "1",
+    "topics": "orders",
+}
+
+
+def test_merge_patch_sets_and_removes_keys() -> None:
+    merged = merge_patch(CONFIG, {"tasks.max": 2, "topics": None, "x": True})
+    assert merged["tasks.max"] == "2"
+    assert merged["x"] == "true"
+    assert "topics" not in merged
+
+
+def test_config_diff() -> None:
+    new = merge_patch(CONFIG, {"tasks.max": 4, "topics": None, "x": "y"})
+    assert config_diff(CONFIG, new) == {
+        "added": {"x": "y"},
+        "removed": ["topics"],
+        "changed": {"tasks.max": {"from": "1", "to": "4"}},
+    }
+
+
+async def test_patch_noop_skips_put(mock_api: respx.MockRouter) -> None:
+    get = mock_api.get("/connectors/my-sink/config").mock(
+        return_value=httpx.Response(200, json=CONFIG)
+    )
+
+    # No PUT route: an unexpected PUT fails the test.
+    result = await patch_connector_config(
+        "my-sink", {"tasks.max": 1, "topics": "orders"}
+    )
+
+    assert result["applied"] is False
+    assert result["diff"] == {"added": {}, "removed": [], "changed": {}}
+    assert get.call_count == 1
+
+
+async def test_patch_sees_change_hidden_by_cache(
+    mock_api: respx.MockRouter,
+) -> None:
+    get = mock_api.get("/connectors/my-sink/config").mock(
+        side_effect=[
+            httpx.Response(200, json=CONFIG),
+            httpx.Response(200, json={**CONFIG, "topics": "payments"}),
+        ]
+    )
+    put = mock_api.put("/connectors/my-sink/config").mock(
+        side_effect=lambda request: httpx.Response(
+            200, json=json.loads(request.content)
+        )
+    )
+    await get_connector_config("my-sink")
+
+    # A no-op against the cached copy, but another client has since
+    # changed the topics.
+    result = await patch_connector_config("my-sink", {"topics": "orders"})
+
+    assert result["applied"] is True
+    assert result["diff"]["changed"] == {
+        "topics": {"from": "payments", "to": "orders"}
+    }
+    assert put.call_count == 1
+    assert get.call_count == 2
+
+
+async def test_patch_change_puts_merged_config_from_fresh_read(
+    mock_api: respx.MockRouter,
+) -> None:
+    get = mock_api.get("/connectors/my-sink/config").mock(
+        return_value=httpx.Response(200, json=CONFIG)
+    )
+    put = mock_api.put("/connectors/my-sink/config").mock(
+        side_effect=lambda request: httpx.Response(
+            200, json=json.loads(request.content)
+        )
+    )
+    await get_connector_config("my-sink")
+
+    result = await patch_connector_config("my-sink", {"tasks.max": 3})
+
+    assert result["applied"] is True
+    assert result["diff"]["changed"] == {"tasks.max": {"from": "1", "to": "3"}}
+    assert json.loads(put.calls[0].request.content) == {
+        **CONFIG,
+        "tasks.max": "3",
+    }
+    # Decided on a fresh read, not the cached one.
+    assert get.call_count == 2
+
+
+async def test_concurrent_patches_both_apply(
+    mock_api: respx.MockRouter,
+) -> None:
+    stored = dict(CONFIG)
+
+    async def get(request: httpx.Request) -> httpx.Response:
+        snapshot = dict(stored)
+        await asyncio.sleep(0.01)  # let the other patch interleave
+        return httpx.Response(200, json=snapshot)
+
+    def put(request: httpx.Request) -> httpx.Response:
+        stored.clear()
+        stored.update(json.loads(request.content))
+        return httpx.Response(200, json=stored)
+
+    mock_api.get("/connectors/my-sink/config").mock(side_effect=get)
+    mock_api.put("/connectors/my-sink/config").mock(side_effect=put)
+
+    results = await asyncio.gather(
+        patch_connector_config("my-sink", {"a": "2"}),
+        patch_connector_config("my-sink", {"b": "2"}),
+    )
+
+    assert [r["applied"] for r in results] == [True, True]
+    assert stored == {**CONFIG, "a": "2", "b": "2"}
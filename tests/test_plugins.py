@@ -5,10 +5,28 @@ from __future__ import annotations
 import httpx
 import respx
 
+from kafka_connect_mcp.plugins import check_config, find_plugin
 from kafka_connect_mcp.server import list_connector_plugins, validate_connector_config
 
+PLUGINS = [
+    {"class": "org.apache.kafka.connect.file.FileStreamSinkConnector", "type": "sink"},
+]
+DEFINITION = [
+    {"name": "file", "type": "STRING", "required": False, "default_value": None},
+    {"name": "batch.size", "type": "INT", "required": False, "default_value": "2000"},
+]
 
-def test_list_connector_plugins(mock_api: respx.MockRouter) -> None:
+
+def _mock_catalog(mock_api: respx.MockRouter, definition: list = DEFINITION) -> None:
+    mock_api.get("/connector-plugins").mock(
+        return_value=httpx.Response(200, json=PLUGINS)
+    )
+    mock_api.get("/connector-plugins/FileStreamSinkConnector/config").mock(
+        return_value=httpx.Response(200, json=definition)
+    )
+
+
+async def test_list_connector_plugins(mock_api: respx.MockRouter) -> None:
     payload = [
         {"class": "org.apache.kafka.connect.file.FileStreamSinkConnector", "type": "sink"},
         {"class": "org.apache.kafka.connect.file.FileStreamSourceConnector", "type": "source"},
@@ -16,12 +34,12 @@ def test_list_connector_plugins(mock_api: respx.MockRouter) -> None:
     mock_api.get("/connector-plugins").mock(
         return_value=httpx.Response(200, json=payload)
     )
-    result = list_connector_plugins()
+    result = await list_connector_plugins()
     assert len(result) == 2
     assert result[0]["type"] == "sink"
 
 
-def test_validate_connector_config(mock_api: respx.MockRouter) -> None:
+async def test_validate_connector_config(mock_api: respx.MockRouter) -> None:
     validation_response = {
         "name": "FileStreamSinkConnector",
         "error_count": 1,
@@ -31,26 +49,143 @@ def test_validate_connector_config(mock_api: respx.MockRouter) -> None:
             }
         ],
     }
+    _mock_catalog(mock_api)
     mock_api.put("/connector-plugins/FileStreamSinkConnector/config/validate").mock(
         return_value=httpx.Response(200, json=validation_response)
     )
-    result = validate_connector_config(
+    result = await validate_connector_config(
         "FileStreamSinkConnector", {"connector.class": "FileStreamSinkConnector"}
     )
     assert result["error_count"] == 1
+    assert result["remote"] == validation_response
 
 
-def test_validate_connector_config_clean(mock_api: respx.MockRouter) -> None:
+async def test_validate_connector_config_clean(mock_api: respx.MockRouter) -> None:
     validation_response = {
         "name": "FileStreamSinkConnector",
         "error_count": 0,
         "configs": [],
     }
+    _mock_catalog(mock_api)
     mock_api.put("/connector-plugins/FileStreamSinkConnector/config/validate").mock(
         return_value=httpx.Response(200, json=validation_response)
     )
-    result = validate_connector_config(
+    result = await validate_connector_config(
         "FileStreamSinkConnector",
         {"connector.class": "FileStreamSinkConnector", "topics": "test", "file": "/tmp/out"},
     )
     assert result["error_count"] == 0
+
+
+def test_find_plugin_accepts_aliases() -> None:
+    for name in (
+        "org.apache.kafka.connect.file.FileStreamSinkConnector",
+        "FileStreamSinkConnector",
+        "FileStreamSink",
+    ):
+        assert find_plugin(PLUGINS, name) is PLUGINS[0]
+    assert find_plugin(PLUGINS, "JdbcSinkConnector") is None
+
+
+def test_check_config() -> None:
+    definition = [
+        {"name": "connection.url", "type": "STRING", "required": True, "default_value": None},
+        {"name": "batch.size", "type": "INT", "required": False, "default_value": "3000"},
+        {"name": "auto.create", "type": "BOOLEAN", "required": False, "default_value": "false"},
+    ]
+    result = check_config(
+        definition,
+        {
+            "connector.class": "JdbcSinkConnector",
+            "batch.size": "lots",
+            "auto.create": "yes",
+            "transforms.route.type": "RegexRouter",
+            "conection.user": "svc",
+        },
+    )
+    assert sorted(result["errors"]) == ["auto.create", "batch.size", "connection.url"]
+    assert list(result["warnings"]) == ["conection.user"]
+
+
+async def test_validate_skips_remote_when_local_checks_fail(
+    mock_api: respx.MockRouter,
+) -> None:
+    _mock_catalog(mock_api)
+    # No validate route: a remote call would fail the test.
+    result = await validate_connector_config(
+        "FileStreamSinkConnector", {"file": "/tmp/out", "batch.size": "x"}
+    )
+    assert result["error_count"] == 1
+    assert result["remote"] is None
+    assert "batch.size" in result["local"]["errors"]
+
+
+async def test_validate_caches_catalog_and_definition(
+    mock_api: respx.MockRouter,
+) -> None:
+    _mock_catalog(mock_api)
+    validate = mock_api.put(
+        "/connector-plugins/FileStreamSinkConnector/config/validate"
+    ).mock(return_value=httpx.Response(200, json={"error_count": 0, "configs": []}))
+
+    for _ in range(3):
+        await validate_connector_config("FileStreamSinkConnector", {"file": "/tmp/out"})
+
+    assert mock_api.calls.call_count == 2 + 3
+    assert validate.call_count == 3
+
+
+async def test_validate_unknown_plugin(mock_api: respx.MockRouter) -> None:
+    catalog = mock_api.get("/connector-plugins").mock(
+        return_value=httpx.Response(200, json=PLUGINS)
+    )
+    result = await validate_connector_config("JdbcSinkConnector", {})
+    assert result["error_count"] == 1
+    assert "Unknown plugin" in result["local"]["errors"]["connector.class"][0]
+    # Connect was asked again before the plugin was reported unknown.
+    assert catalog.call_count == 2
+
+
+async def test_validate_rereads_catalog_for_new_plugin(
+    mock_api: respx.MockRouter,
+) -> None:
+    jdbc = {"class": "io.confluent.connect.jdbc.JdbcSinkConnector", "type": "sink"}
+    mock_api.get("/connector-plugins").mock(
+        side_effect=[
+            httpx.Response(200, json=PLUGINS),
+            httpx.Response(200, json=[*PLUGINS, jdbc]),
+        ]
+    )
+    mock_api.get("/connector-plugins/JdbcSinkConnector/config").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    mock_api.put("/connector-plugins/JdbcSinkConnector/config/validate").mock(
+        return_value=httpx.Response(200, json={"error_count": 0, "configs": []})
+    )
+    await list_connector_plugins()
+
+    # Installed after the catalog was cached.
+    result = await validate_connector_config("JdbcSinkConnector", {})
+
+    assert result["error_count"] == 0
+    assert result["remote"] == {"error_count": 0, "configs": []}
+
+
+async def test_validate_without_definition_endpoint(
+    mock_api: respx.MockRouter,
+) -> None:
+    mock_api.get("/connector-plugins").mock(
+        return_value=httpx.Response(200, json=PLUGINS)
+    )
+    definition = mock_api.get(
+        "/connector-plugins/FileStreamSinkConnector/config"
+    ).mock(return_value=httpx.Response(404, json={"message": "not found"}))
+    mock_api.put("/connector-plugins/FileStreamSinkConnector/config/validate").mock(
+        return_value=httpx.Response(200, json={"error_count": 0, "configs": []})
+    )
+
+    for _ in range(2):
+        result = await validate_connector_config("FileStreamSinkConnector", {})
+        assert result["error_count"] == 0
+
+    assert definition.call_count == 1
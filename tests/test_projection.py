@@ -0,0 +1,131 @@
+"""Tests for paging and field projection."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.projection import paginate, project
+from kafka_connect_mcp.server import (
+    get_cluster_snapshot,
+    get_connector,
+    get_connector_config,
+    get_connector_status,
+    list_connectors,
+)
+
+INFO = {
+    "name": "pg-sink",
+    "type": "sink",
+    "config": {
+        "name": "pg-sink",
+        "connector.class": "io.confluent.connect.jdbc.JdbcSinkConnector",
+        "transforms.route.type": "org.apache.kafka.connect.transforms.RegexRouter",
+        "table.whitelist": ",".join(f"t{i}" for i in range(500)),
+    },
+    "tasks": [{"connector": "pg-sink", "task": 0}, {"connector": "pg-sink", "task": 1}],
+}
+
+
+def test_project_dotted_keys_and_lists() -> None:
+    assert project(
+        INFO, ["type", "config.connector.class", "tasks[*].task"]
+    ) == {
+        "type": "sink",
+        "config": {
+            "connector.class": "io.confluent.connect.jdbc.JdbcSinkConnector"
+        },
+        "tasks": [{"task": 0}, {"task": 1}],
+    }
+    assert project(INFO, ["config.transforms.route.type", "tasks[1]"]) == {
+        "config": {
+            "transforms.route.type": "org.apache.kafka.connect.transforms.RegexRouter"
+        },
+        "tasks": [{"connector": "pg-sink", "task": 1}],
+    }
+
+
+def test_project_skips_missing_paths() -> None:
+    assert project(INFO, ["nope", "config.nope", "tasks[9]"]) == {}
+    assert project(INFO, None) is INFO
+
+
+def test_project_rejects_bad_path() -> None:
+    with pytest.raises(ValueError, match="Invalid field path"):
+        project(INFO, ["tasks[x"])
+
+
+def test_paginate_by_name() -> None:
+    names = ["d", "b", "a", "c", "e"]
+    page, cursor = paginate(names, limit=2, cursor=None)
+    assert (page, cursor) == (["a", "b"], "b")
+    page, cursor = paginate(names, limit=2, cursor=cursor)
+    assert (page, cursor) == (["c", "d"], "d")
+    page, cursor = paginate(names, limit=2, cursor=cursor)
+    assert (page, cursor) == (["e"], None)
+
+
+async def test_list_connectors_paged(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=["c", "a", "b"])
+    )
+    assert await list_connectors() == ["c", "a", "b"]
+    first = await list_connectors(limit=2)
+    assert first == {"connectors": ["a", "b"], "next_cursor": "b", "total": 3}
+    second = await list_connectors(limit=2, cursor=first["next_cursor"])
+    assert second == {"connectors": ["c"], "next_cursor": None, "total": 3}
+
+
+async def test_detail_tools_project_fields(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors/pg-sink").mock(
+        return_value=httpx.Response(200, json=INFO)
+    )
+    mock_api.get("/connectors/pg-sink/config").mock(
+        return_value=httpx.Response(200, json=INFO["config"])
+    )
+    mock_api.get("/connectors/pg-sink/status").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "name": "pg-sink",
+                "connector": {"state": "RUNNING", "worker_id": "w1"},
+                "tasks": [{"id": 0, "state": "FAILED", "trace": "boom"}],
+            },
+        )
+    )
+
+    info = await get_connector("pg-sink", fields=["config.connector.class"])
+    assert info == {"config": {"connector.class": INFO["config"]["connector.class"]}}
+    config = await get_connector_config("pg-sink", fields=["connector.class"])
+    assert list(config) == ["connector.class"]
+    status = await get_connector_status(
+        "pg-sink", fields=["connector.state", "tasks[*].state"]
+    )
+    assert status == {"connector": {"state": "RUNNING"}, "tasks": [{"state": "FAILED"}]}
+    # The cached payload is not modified by projection.
+    assert (await get_connector("pg-sink")) == INFO
+
+
+async def test_cluster_snapshot_paged(mock_api: respx.MockRouter) -> None:
+    payload = {
+        name: {
+            "status": {
+                "connector": {"state": "RUNNING"},
+                "tasks": [{"id": 0, "state": "RUNNING"}],
+                "type": "sink",
+            },
+            "info": {"config": {"connector.class": "X"}},
+        }
+        for name in ("c", "a", "b")
+    }
+    mock_api.get("/connectors").mock(return_value=httpx.Response(200, json=payload))
+
+    result = await get_cluster_snapshot(limit=2, fields=["name", "tasks[*].state"])
+
+    assert result["summary"]["connectors"] == 3
+    assert result["connectors"] == [
+        {"name": "a", "tasks": [{"state": "RUNNING"}]},
+        {"name": "b", "tasks": [{"state": "RUNNING"}]},
+    ]
+    assert result["next_cursor"] == "b"
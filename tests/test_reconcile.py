@@ -0,0 +1,130 @@
+"""Tests for plan/apply of desired-state manifests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.reconcile import apply_steps, plan_changes
+from kafka_connect_mcp.server import _cluster, apply_connectors, plan_connectors
+
+LIVE = {
+    "same": {"info": {"config": {"name": "same", "topics": "a"}}},
+    "drift": {"info": {"config": {"name": "drift", "topics": "a"}}},
+    "orphan": {"info": {"config": {"name": "orphan", "topics": "z"}}},
+}
+MANIFEST = {
+    "same": {"topics": "a"},
+    "drift": {"topics": "b"},
+    "new": {"connector.class": "FileStreamSink", "tasks.max": 1},
+}
+
+
+def _mock_live(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors", params={"expand": "info"}).mock(
+        return_value=httpx.Response(200, json=LIVE)
+    )
+
+
+def test_plan_changes() -> None:
+    live = {n: e["info"]["config"] for n, e in LIVE.items()}
+    steps = plan_changes(MANIFEST, live)
+    assert [(s["name"], s["action"]) for s in steps] == [
+        ("drift", "update"),
+        ("new", "create"),
+        ("same", "unchanged"),
+    ]
+    assert steps[0]["diff"]["changed"] == {"topics": {"from": "a", "to": "b"}}
+    assert steps[1]["config"]["tasks.max"] == "1"
+
+    pruned = plan_changes(MANIFEST, live, prune=True)
+    assert ("orphan", "delete") in [(s["name"], s["action"]) for s in pruned]
+
+
+async def test_plan_connectors_marks_blocked_steps(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_ENABLE_DELETE", "false")
+    _mock_live(mock_api)
+
+    result = await plan_connectors(MANIFEST, prune=True)
+
+    assert result["summary"] == {
+        "update": 1,
+        "create": 1,
+        "delete": 1,
+        "unchanged": 1,
+    }
+    steps = {s["name"]: s for s in result["steps"]}
+    assert steps["orphan"]["blocked"]["type"] == "policy_blocked"
+    assert "blocked" not in steps["new"]
+
+
+async def test_apply_connectors_reports_per_connector(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_ENABLE_DELETE", "false")
+    _mock_live(mock_api)
+    create = mock_api.post("/connectors").mock(
+        return_value=httpx.Response(201, json={"name": "new"})
+    )
+    update = mock_api.put("/connectors/drift/config").mock(
+        return_value=httpx.Response(
+            400, json={"message": "Connector configuration is invalid"}
+        )
+    )
+
+    result = await apply_connectors(MANIFEST, prune=True, batch_pause=0)
+
+    outcomes = {r["name"]: r["result"] for r in result["results"]}
+    assert outcomes == {
+        "drift": "error",
+        "new": "ok",
+        "orphan": "blocked",
+        "same": "skipped",
+    }
+    assert json.loads(create.calls[0].request.content) == {
+        "name": "new",
+        "config": {
+            "name": "new",
+            "connector.class": "FileStreamSink",
+            "tasks.max": "1",
+        },
+    }
+    assert update.call_count == 1
+    assert "invalid" in result["results"][0]["error"]
+
+
+async def test_apply_steps_bounds_concurrency_and_paces_batches(
+    mock_api: respx.MockRouter,
+) -> None:
+    active = peak = 0
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(201, json={})
+
+    mock_api.post("/connectors").mock(side_effect=slow)
+    steps = [
+        {"name": f"c{i}", "action": "create", "config": {}} for i in range(7)
+    ]
+    pauses: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        pauses.append(delay)
+
+    results = await apply_steps(
+        _cluster(None), steps, concurrency=3, batch_pause=1.5, sleep=sleep
+    )
+
+    assert all(r["result"] == "ok" for r in results)
+    assert peak == 3
+    assert pauses == [1.5, 1.5]
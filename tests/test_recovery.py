@@ -0,0 +1,129 @@
+"""Tests for bulk restart of failed connectors and tasks."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.ratelimit import TokenBucket
+from kafka_connect_mcp.recovery import find_failed
+from kafka_connect_mcp.server import restart_failed
+
+TIMEOUT = "org.apache.kafka.common.errors.TimeoutException: expired"
+AUTH = "org.apache.kafka.common.errors.SaslAuthenticationException: denied"
+
+
+def _entry(connector: str, *tasks: tuple[str, str | None]) -> dict:
+    return {
+        "status": {
+            "connector": {"state": connector},
+            "tasks": [
+                {"id": i, "state": state, **({"trace": t} if t else {})}
+                for i, (state, t) in enumerate(tasks)
+            ],
+        }
+    }
+
+
+PAYLOAD = {
+    "pg-orders": _entry("RUNNING", ("FAILED", TIMEOUT), ("FAILED", TIMEOUT)),
+    "pg-users": _entry("RUNNING", ("FAILED", TIMEOUT), ("FAILED", AUTH)),
+    "s3-sink": _entry("FAILED", ("RUNNING", None)),
+    "healthy": _entry("RUNNING", ("RUNNING", None)),
+}
+
+
+def test_find_failed_filters() -> None:
+    assert [t["name"] for t in find_failed(PAYLOAD)] == [
+        "pg-orders",
+        "pg-users",
+        "s3-sink",
+    ]
+    by_trace = find_failed(PAYLOAD, trace_pattern="TimeoutException")
+    assert by_trace == [
+        {"name": "pg-orders", "connector": False, "tasks": [0, 1], "all_failed": True},
+        {"name": "pg-users", "connector": False, "tasks": [0], "all_failed": False},
+    ]
+    assert [t["name"] for t in find_failed(PAYLOAD, name_glob="s3-*")] == [
+        "s3-sink"
+    ]
+
+
+def test_find_failed_rejects_bad_pattern() -> None:
+    with pytest.raises(ValueError, match="Invalid trace_pattern"):
+        find_failed(PAYLOAD, trace_pattern="(")
+
+
+async def test_token_bucket_limits_rate() -> None:
+    now = 0.0
+    slept: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        nonlocal now
+        slept.append(delay)
+        now += delay
+
+    bucket = TokenBucket(2.0, burst=2, clock=lambda: now, sleep=sleep)
+    for _ in range(4):
+        await bucket.acquire()
+    assert slept == [0.5, 0.5]
+
+
+def _mock_snapshot(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=PAYLOAD)
+    )
+
+
+async def test_restart_failed_uses_bulk_restart_where_possible(
+    mock_api: respx.MockRouter,
+) -> None:
+    _mock_snapshot(mock_api)
+    bulk = mock_api.post(
+        "/connectors/pg-orders/restart",
+        params={"includeTasks": "true", "onlyFailed": "true"},
+    ).mock(return_value=httpx.Response(202))
+    task = mock_api.post("/connectors/pg-users/tasks/0/restart").mock(
+        return_value=httpx.Response(204)
+    )
+
+    result = await restart_failed(trace_pattern="Timeout", rate_per_second=0)
+
+    assert result == {
+        "matched_connectors": 2,
+        "matched_tasks": 3,
+        "restarted_connectors": 2,
+        "restarted_tasks": 3,
+        "calls": 2,
+        "blocked": {},
+        "errors": {},
+    }
+    assert bulk.call_count == 1
+    assert task.call_count == 1
+
+
+async def test_restart_failed_applies_allowlist_per_connector(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_MUTATION_ALLOWLIST", "s3-sink")
+    _mock_snapshot(mock_api)
+    mock_api.post("/connectors/s3-sink/restart").mock(
+        return_value=httpx.Response(202)
+    )
+
+    result = await restart_failed(rate_per_second=0)
+
+    assert result["restarted_connectors"] == 1
+    assert sorted(result["blocked"]) == ["pg-orders", "pg-users"]
+    assert result["calls"] == 1
+
+
+async def test_restart_failed_dry_run(mock_api: respx.MockRouter) -> None:
+    _mock_snapshot(mock_api)
+    result = await restart_failed(dry_run=True)
+    assert result["targets"] == {
+        "pg-orders": [0, 1],
+        "pg-users": [0, 1],
+        "s3-sink": [],
+    }
@@ -0,0 +1,200 @@
+"""Tests for retries, backoff and the circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp import server
+from kafka_connect_mcp.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    UpstreamUnavailableError,
+)
+from kafka_connect_mcp.server import (
+    create_connector,
+    get_connector_status,
+    restart_connector,
+)
+
+REBALANCE = httpx.Response(
+    409,
+    json={
+        "error_code": 409,
+        "message": "Cannot complete request because of a conflicting "
+        "operation (e.g. worker rebalance)",
+    },
+)
+RUNNING = httpx.Response(200, json={"connector": {"state": "RUNNING"}})
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_rebalance_conflict_is_retried(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.get("/connectors/a/status").mock(
+        side_effect=[REBALANCE, REBALANCE, RUNNING]
+    )
+    result = await get_connector_status("a")
+    assert result["connector"]["state"] == "RUNNING"
+    assert route.call_count == 3
+    stats = server._cluster(None).stats()
+    assert stats["retries"]["retries"] == 2
+
+
+async def test_rebalance_rejection_retries_mutations_too(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.post("/connectors").mock(
+        side_effect=[REBALANCE, httpx.Response(201, json={"name": "a"})]
+    )
+    assert (await create_connector("a", {}))["name"] == "a"
+    assert route.call_count == 2
+
+
+async def test_503_is_not_retried_for_non_idempotent_calls(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.post("/connectors").mock(
+        return_value=httpx.Response(503)
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        await create_connector("a", {})
+    assert route.call_count == 1
+
+
+async def test_give_up_returns_structured_error(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_RETRY_MAX_ATTEMPTS", "3")
+    route = mock_api.get("/connectors/a/status").mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "0.01"})
+    )
+    with pytest.raises(UpstreamUnavailableError) as exc:
+        await get_connector_status("a")
+
+    assert route.call_count == 3
+    details = exc.value.details
+    assert details["type"] == "upstream_unavailable"
+    assert details["status"] == 503
+    assert details["attempts"] == 3
+    assert details["retry_after"] > 0
+
+
+async def test_restart_retried_on_timeout_only_when_only_failed(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.post("/connectors/a/restart").mock(
+        side_effect=[httpx.ReadTimeout("slow"), httpx.Response(204)]
+    )
+    await restart_connector("a", include_tasks=True, only_failed=True)
+    assert route.call_count == 2
+
+    route.reset()
+    route.side_effect = [httpx.ReadTimeout("slow"), httpx.Response(204)]
+    with pytest.raises(httpx.ReadTimeout):
+        await restart_connector("a")
+    assert route.call_count == 1
+
+
+async def test_breaker_opens_and_fails_fast(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_BREAKER_THRESHOLD", "3")
+    monkeypatch.setenv("KAFKA_CONNECT_RETRY_MAX_ATTEMPTS", "3")
+    route = mock_api.get("/connectors/a/status").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+    with pytest.raises(UpstreamUnavailableError):
+        await get_connector_status("a")
+    assert route.call_count == 3
+
+    with pytest.raises(CircuitOpenError) as exc:
+        await get_connector_status("a")
+    assert route.call_count == 3
+    assert exc.value.details["retry_after"] > 0
+
+
+async def test_retry_after_header_is_honoured() -> None:
+    policy = RetryPolicy(max_attempts=2, base_delay=0, max_delay=10)
+    delays: list[float] = []
+    responses = iter(
+        [httpx.Response(503, headers={"Retry-After": "4"}), RUNNING]
+    )
+
+    async def send() -> httpx.Response:
+        return next(responses)
+
+    async def sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    resp = await policy.run(
+        send,
+        cluster="c",
+        breaker=CircuitBreaker(),
+        idempotent=True,
+        sleep=sleep,
+    )
+    assert resp.status_code == 200
+    assert delays == [4.0]
+
+
+def test_breaker_half_open_allows_one_trial() -> None:
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.parametrize("error", [asyncio.CancelledError, RuntimeError])
+async def test_interrupted_trial_frees_half_open_breaker(
+    error: type[BaseException],
+) -> None:
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+
+    async def send() -> httpx.Response:
+        raise error()
+
+    with pytest.raises(error):
+        await RetryPolicy().run(
+            send, cluster="c", breaker=breaker, idempotent=True
+        )
+
+    # The next call gets the trial instead of failing fast forever.
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_backoff_is_bounded() -> None:
+    policy = RetryPolicy(base_delay=1, max_delay=3)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= 3
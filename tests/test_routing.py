@@ -0,0 +1,136 @@
+"""Tests for worker-aware routing, health checks and failover."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp import server
+from kafka_connect_mcp.routing import Worker, WorkerPool
+from kafka_connect_mcp.server import (
+    delete_connector,
+    get_connector_status,
+    pause_connector,
+)
+
+W1 = "http://w1:8083"
+W2 = "http://w2:8083"
+W3 = "http://w3:8083"
+
+
+def test_round_robin_spreads_reads() -> None:
+    pool = WorkerPool([W1, W2, W3])
+    firsts = [pool.read_candidates()[0].url for _ in range(6)]
+    assert firsts == [W1, W2, W3, W1, W2, W3]
+
+
+def test_least_latency_prefers_fastest_worker() -> None:
+    pool = WorkerPool([W1, W2], strategy="least_latency")
+    pool.workers[0].observe(0.2)
+    pool.workers[1].observe(0.05)
+    assert pool.read_candidates()[0].url == W2
+
+
+def test_unhealthy_workers_are_tried_last() -> None:
+    pool = WorkerPool([W1, W2, W3])
+    pool.workers[0].mark_down("boom")
+    for _ in range(4):
+        assert pool.read_candidates()[-1].url == W1
+
+
+def test_writes_prefer_leader_and_fail_over() -> None:
+    pool = WorkerPool([W1, W2, W3], leader_url=W3)
+    assert pool.write_candidates()[0].url == W3
+
+    pool.workers[2].mark_down("gone")
+    assert [w.url for w in pool.write_candidates()] == [W1, W2, W3]
+
+
+def test_unknown_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError, match="routing strategy"):
+        WorkerPool([W1], strategy="random")
+
+
+async def test_health_check_marks_workers() -> None:
+    pool = WorkerPool([W1, W2])
+
+    async def check(worker: Worker) -> None:
+        if worker.url == W2:
+            raise httpx.ConnectError("refused")
+
+    await pool.check_all(check)
+    assert pool.workers[0].healthy
+    assert not pool.workers[1].healthy
+    assert "ConnectError" in pool.workers[1].last_error
+
+    await pool.check_all(lambda worker: _noop())
+    assert pool.workers[1].healthy
+
+
+async def _noop() -> None:
+    return None
+
+
+@pytest.fixture()
+def workers(monkeypatch: pytest.MonkeyPatch) -> respx.MockRouter:
+    monkeypatch.setattr(server, "CONNECT_URL", f"{W1},{W2}")
+    monkeypatch.setenv("KAFKA_CONNECT_LEADER_URL", W2)
+    monkeypatch.setenv("KAFKA_CONNECT_HEALTH_CHECK_INTERVAL", "0")
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+async def test_reads_fail_over_to_next_worker(
+    workers: respx.MockRouter,
+) -> None:
+    workers.get(f"{W1}/connectors/a/status").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+    ok = workers.get(f"{W2}/connectors/a/status").mock(
+        return_value=httpx.Response(200, json={"name": "a"})
+    )
+
+    assert await get_connector_status("a") == {"name": "a"}
+    assert ok.call_count == 1
+    routing = server._cluster(None).workers
+    assert not routing.workers[0].healthy
+
+    # The failed worker is now skipped until it recovers.
+    assert await get_connector_status("a") == {"name": "a"}
+    assert ok.call_count == 2
+
+
+async def test_mutations_go_to_leader(workers: respx.MockRouter) -> None:
+    leader = workers.put(f"{W2}/connectors/a/pause").mock(
+        return_value=httpx.Response(202)
+    )
+    await pause_connector("a")
+    assert leader.call_count == 1
+
+
+async def test_mutations_are_not_resent_after_read_timeout(
+    workers: respx.MockRouter,
+) -> None:
+    workers.delete(f"{W2}/connectors/a").mock(
+        side_effect=httpx.ReadTimeout("slow")
+    )
+    other = workers.delete(f"{W1}/connectors/a").mock(
+        return_value=httpx.Response(204)
+    )
+    with pytest.raises(httpx.ReadTimeout):
+        await delete_connector("a")
+    assert other.call_count == 0
+
+
+async def test_mutations_fail_over_when_leader_refuses(
+    workers: respx.MockRouter,
+) -> None:
+    workers.put(f"{W2}/connectors/a/pause").mock(
+        side_effect=httpx.ConnectError("refused")
+    )
+    other = workers.put(f"{W1}/connectors/a/pause").mock(
+        return_value=httpx.Response(202)
+    )
+    await pause_connector("a")
+    assert other.call_count == 1
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import time
+from pathlib import Path
+
 import httpx
 import pytest
 import respx
 
-from kafka_connect_mcp.safety import PolicyBlockedError
+from kafka_connect_mcp.safety import (
+    PolicyBlockedError,
+    PolicyFile,
+    SafetyPolicy,
+)
 from kafka_connect_mcp.server import (
     create_connector,
     delete_connector,
@@ -14,40 +22,40 @@ from kafka_connect_mcp.server import (
 )
 
 
-def test_create_capability_blocks_mutations_by_default(
+async def test_create_capability_blocks_mutations_by_default(
     monkeypatch: pytest.MonkeyPatch, mock_api: respx.MockRouter
 ) -> None:
     monkeypatch.delenv("KAFKA_CONNECT_ENABLE_CREATE", raising=False)
 
     with pytest.raises(PolicyBlockedError) as exc:
-        create_connector("new-sink", {"connector.class": "FileStreamSink"})
+        await create_connector("new-sink", {"connector.class": "FileStreamSink"})
 
     assert exc.value.details["reason"] == "capability 'create' is disabled"
     assert "KAFKA_CONNECT_ENABLE_CREATE=true" in exc.value.details["required_env"]
     assert len(mock_api.calls) == 0
 
 
-def test_capability_gate_blocks_when_disabled(
+async def test_capability_gate_blocks_when_disabled(
     monkeypatch: pytest.MonkeyPatch, mock_api: respx.MockRouter
 ) -> None:
     monkeypatch.setenv("KAFKA_CONNECT_ENABLE_DELETE", "false")
 
     with pytest.raises(PolicyBlockedError) as exc:
-        delete_connector("my-sink")
+        await delete_connector("my-sink")
 
     assert exc.value.details["reason"] == "capability 'delete' is disabled"
     assert "KAFKA_CONNECT_ENABLE_DELETE=true" in exc.value.details["required_env"]
     assert len(mock_api.calls) == 0
 
 
-def test_allowlist_blocks_non_listed_connector(
+async def test_allowlist_blocks_non_listed_connector(
     monkeypatch: pytest.MonkeyPatch, mock_api: respx.MockRouter
 ) -> None:
     monkeypatch.setenv("KAFKA_CONNECT_ENABLE_RESTART", "true")
     monkeypatch.setenv("KAFKA_CONNECT_MUTATION_ALLOWLIST", "allowed-a,allowed-b")
 
     with pytest.raises(PolicyBlockedError) as exc:
-        restart_task("my-sink", 0)
+        await restart_task("my-sink", 0)
 
     assert (
         exc.value.details["reason"]
@@ -57,7 +65,7 @@ def test_allowlist_blocks_non_listed_connector(
     assert len(mock_api.calls) == 0
 
 
-def test_allowlist_allows_listed_connector(
+async def test_allowlist_allows_listed_connector(
     monkeypatch: pytest.MonkeyPatch, mock_api: respx.MockRouter
 ) -> None:
     monkeypatch.setenv("KAFKA_CONNECT_ENABLE_RESTART", "true")
@@ -66,5 +74,112 @@ def test_allowlist_allows_listed_connector(
         return_value=httpx.Response(204)
     )
 
-    result = restart_task("my-sink", 0)
+    result = await restart_task("my-sink", 0)
     assert "restarted" in result.lower()
+
+
+def test_policy_globs_regexes_and_denylist() -> None:
+    policy = SafetyPolicy.from_env(
+        {
+            "KAFKA_CONNECT_ENABLE_RESTART": "true",
+            "KAFKA_CONNECT_MUTATION_ALLOWLIST": "pg-*,re:^orders-\\d+$,s3-sink",
+            "KAFKA_CONNECT_RESTART_DENYLIST": "pg-critical*",
+        }
+    )
+    for name in ("pg-users", "orders-42", "s3-sink"):
+        policy.check(tool="restart_task", connector=name)
+    for name, reason in (
+        ("orders-x", "connector is not in KAFKA_CONNECT_MUTATION_ALLOWLIST"),
+        ("pg-critical-1", "connector matches KAFKA_CONNECT_RESTART_DENYLIST"),
+    ):
+        with pytest.raises(PolicyBlockedError) as exc:
+            policy.check(tool="restart_task", connector=name)
+        assert exc.value.details["reason"] == reason
+
+
+def test_invalid_regex_is_rejected_at_compile_time() -> None:
+    with pytest.raises(ValueError, match="Invalid pattern"):
+        SafetyPolicy.from_env({"KAFKA_CONNECT_MUTATION_ALLOWLIST": "re:("})
+
+
+def test_global_regex_flag_is_rejected_as_value_error() -> None:
+    # Valid on its own, but not once joined with the other entries.
+    with pytest.raises(ValueError, match="scoped flags"):
+        SafetyPolicy.from_env(
+            {"KAFKA_CONNECT_MUTATION_ALLOWLIST": "re:(?i)orders-.*,pg-*"}
+        )
+    policy = SafetyPolicy.from_env(
+        {
+            "KAFKA_CONNECT_ENABLE_RESTART": "true",
+            "KAFKA_CONNECT_MUTATION_ALLOWLIST": "re:(?i:orders-.*),pg-*",
+        }
+    )
+    policy.check(tool="restart_task", connector="ORDERS-eu")
+
+
+def test_policy_check_is_fast_for_bulk_operations() -> None:
+    policy = SafetyPolicy.from_env(
+        {
+            "KAFKA_CONNECT_ENABLE_RESTART": "true",
+            "KAFKA_CONNECT_MUTATION_ALLOWLIST": ",".join(
+                [f"team{i}-*" for i in range(50)] + ["re:^legacy-\\d+$"]
+            ),
+        }
+    )
+    names = [f"team{i % 50}-conn-{i}" for i in range(5000)]
+    start = time.perf_counter()
+    for name in names:
+        policy.check(tool="restart_connector", connector=name)
+    per_check = (time.perf_counter() - start) / len(names)
+    assert per_check < 1e-4
+
+
+def test_policy_file_reloads_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "policy.toml"
+    path.write_text(
+        '[capabilities.restart]\nenabled = true\nallow = ["pg-*"]\n'
+    )
+    policy_file = PolicyFile(path, check_interval=0)
+    policy_file.current().check(tool="restart_task", connector="pg-a")
+    with pytest.raises(PolicyBlockedError):
+        policy_file.current().check(tool="delete_connector", connector="pg-a")
+
+    path.write_text('[capabilities.delete]\nenabled = true\n')
+    os.utime(path, ns=(1, 1))
+    policy_file.current().check(tool="delete_connector", connector="x")
+    assert policy_file.reloads == 1
+
+    # A broken file keeps the last good policy in force.
+    path.write_text("[capabilities.delete\n")
+    os.utime(path, ns=(2, 2))
+    policy_file.current().check(tool="delete_connector", connector="x")
+    assert policy_file.last_error is not None
+
+    # So does a pattern list that only fails once joined into one regex.
+    path.write_text(
+        '[capabilities.delete]\nenabled = true\nallow = ["re:(?i)orders-.*"]\n'
+    )
+    os.utime(path, ns=(3, 3))
+    policy_file.current().check(tool="delete_connector", connector="x")
+    assert "scoped flags" in policy_file.last_error
+    assert policy_file.reloads == 1
+
+
+async def test_cluster_uses_policy_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_api: respx.MockRouter,
+) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(
+        '{"capabilities": {"delete": {"enabled": false}}}'
+    )
+    monkeypatch.setenv("KAFKA_CONNECT_POLICY_FILE", str(path))
+
+    with pytest.raises(PolicyBlockedError) as exc:
+        await delete_connector("my-sink")
+
+    assert exc.value.details["required_env"] == [
+        f"capabilities.delete.enabled = true in {path}"
+    ]
+    assert len(mock_api.calls) == 0
@@ -0,0 +1,135 @@
+"""Tests for coalescing identical in-flight GET requests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.server import (
+    get_connector_status,
+    get_server_stats,
+    list_connector_plugins,
+)
+from kafka_connect_mcp.singleflight import SingleFlight
+
+
+async def test_concurrent_identical_calls_share_one_run() -> None:
+    flight = SingleFlight()
+    runs = 0
+    release = asyncio.Event()
+
+    async def work() -> str:
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return "done"
+
+    waiters = [
+        asyncio.create_task(flight.do("k", work)) for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["done"] * 10
+    assert runs == 1
+    assert flight.stats() == {
+        "calls": 10,
+        "coalesced": 9,
+        "abandoned": 0,
+        "in_flight": 0,
+    }
+
+
+async def test_errors_are_shared_and_not_remembered() -> None:
+    flight = SingleFlight()
+
+    async def boom() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await flight.do("k", boom)
+
+    async def ok() -> str:
+        return "ok"
+
+    assert await flight.do("k", ok) == "ok"
+
+
+async def test_cancelled_waiter_does_not_cancel_others() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+
+
+async def test_work_is_cancelled_when_every_waiter_leaves() -> None:
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work() -> None:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiters = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+    await started.wait()
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert flight.stats()["abandoned"] == 1
+    assert flight.stats()["in_flight"] == 0
+
+
+async def _slow(payload: object) -> httpx.Response:
+    await asyncio.sleep(0.01)
+    return httpx.Response(200, json=payload)
+
+
+async def test_concurrent_status_calls_coalesce(
+    mock_api: respx.MockRouter,
+) -> None:
+    payload = {"name": "my-sink", "connector": {"state": "RUNNING"}}
+    route = mock_api.get("/connectors/my-sink/status").mock(
+        side_effect=lambda request: _slow(payload)
+    )
+
+    results = await asyncio.gather(
+        *(get_connector_status("my-sink") for _ in range(20))
+    )
+
+    assert all(r == payload for r in results)
+    assert route.call_count == 1
+    stats = (await get_server_stats())["clusters"]["default"][
+        "coalescing"
+    ]
+    assert stats["coalesced"] == 19
+
+
+async def test_sequential_calls_are_not_coalesced(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.get("/connector-plugins").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    await list_connector_plugins(fresh=True)
+    await list_connector_plugins(fresh=True)
+    assert route.call_count == 2
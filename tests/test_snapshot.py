@@ -0,0 +1,107 @@
+"""Tests for the expanded cluster snapshot tool."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+
+from kafka_connect_mcp.server import get_cluster_snapshot
+
+EXPANDED = {
+    "pg-orders": {
+        "status": {
+            "name": "pg-orders",
+            "connector": {"state": "RUNNING", "worker_id": "w1:8083"},
+            "tasks": [
+                {"id": 0, "state": "RUNNING", "worker_id": "w1:8083"},
+                {
+                    "id": 1,
+                    "state": "FAILED",
+                    "worker_id": "w2:8083",
+                    "trace": "org.apache.kafka.connect.errors.ConnectException: boom\n\tat Foo.bar(Foo.java:1)",
+                },
+            ],
+            "type": "source",
+        },
+        "info": {
+            "name": "pg-orders",
+            "config": {"connector.class": "io.debezium.PostgresConnector"},
+            "tasks": [],
+            "type": "source",
+        },
+    },
+    "s3-sink": {
+        "status": {
+            "name": "s3-sink",
+            "connector": {"state": "PAUSED", "worker_id": "w2:8083"},
+            "tasks": [{"id": 0, "state": "PAUSED", "worker_id": "w1:8083"}],
+            "type": "sink",
+        },
+        "info": {
+            "name": "s3-sink",
+            "config": {"connector.class": "S3SinkConnector"},
+            "tasks": [],
+            "type": "sink",
+        },
+    },
+}
+
+
+def _mock_expanded(mock_api: respx.MockRouter) -> respx.Route:
+    return mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=EXPANDED)
+    )
+
+
+async def test_snapshot_uses_single_expanded_request(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = _mock_expanded(mock_api)
+    result = await get_cluster_snapshot()
+
+    assert len(mock_api.calls) == 1
+    params = route.calls[0].request.url.params
+    assert params.get_list("expand") == ["status", "info"]
+    assert result["summary"] == {
+        "connectors": 2,
+        "tasks": 3,
+        "connector_states": {"RUNNING": 1, "PAUSED": 1},
+        "task_states": {"RUNNING": 1, "FAILED": 1, "PAUSED": 1},
+    }
+    first = result["connectors"][0]
+    assert first["name"] == "pg-orders"
+    assert first["class"] == "io.debezium.PostgresConnector"
+    assert first["tasks"][1]["error"].endswith("ConnectException: boom")
+
+
+async def test_snapshot_task_state_filter_trims_tasks(
+    mock_api: respx.MockRouter,
+) -> None:
+    _mock_expanded(mock_api)
+    result = await get_cluster_snapshot(task_state="failed")
+
+    assert [c["name"] for c in result["connectors"]] == ["pg-orders"]
+    assert [t["id"] for t in result["connectors"][0]["tasks"]] == [1]
+
+
+async def test_snapshot_connector_filters(mock_api: respx.MockRouter) -> None:
+    _mock_expanded(mock_api)
+
+    by_glob = await get_cluster_snapshot(name_glob="s3-*")
+    assert [c["name"] for c in by_glob["connectors"]] == ["s3-sink"]
+
+    by_type = await get_cluster_snapshot(connector_type="source")
+    assert [c["name"] for c in by_type["connectors"]] == ["pg-orders"]
+
+    by_state = await get_cluster_snapshot(connector_state="PAUSED")
+    assert [c["name"] for c in by_state["connectors"]] == ["s3-sink"]
+
+
+async def test_snapshot_worker_filter(mock_api: respx.MockRouter) -> None:
+    _mock_expanded(mock_api)
+    result = await get_cluster_snapshot(worker_id="w2:8083")
+
+    by_name = {c["name"]: c for c in result["connectors"]}
+    assert [t["id"] for t in by_name["pg-orders"]["tasks"]] == [1]
+    # The connector instance itself runs on w2 even though no task does.
+    assert by_name["s3-sink"]["tasks"] == []
@@ -0,0 +1,120 @@
+"""Tests for cluster topology and task skew."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import respx
+
+from kafka_connect_mcp.server import get_cluster_topology
+from kafka_connect_mcp.topology import topology, worker_id_from_url
+
+
+def _conn(name: str, cls: str, worker: str, *tasks: tuple[str, str | None]) -> dict:
+    return {
+        "name": name,
+        "class": cls,
+        "state": "RUNNING",
+        "worker_id": worker,
+        "tasks": [
+            {"id": i, "state": state, "worker_id": w}
+            for i, (state, w) in enumerate(tasks)
+        ],
+    }
+
+
+def test_worker_id_from_url() -> None:
+    assert worker_id_from_url("http://w1:8083") == "w1:8083"
+    assert worker_id_from_url("https://connect.example.com") == "connect.example.com:443"
+
+
+def test_topology_counts_skew_and_idle_workers() -> None:
+    connectors = [
+        _conn("a", "JdbcSink", "w1:8083", ("RUNNING", "w1:8083"), ("FAILED", "w1:8083")),
+        _conn("b", "JdbcSink", "w2:8083", ("RUNNING", "w1:8083"), ("FAILED", "w2:8083")),
+        _conn("c", "S3Sink", "w1:8083", ("UNASSIGNED", None)),
+        _conn("d", "S3Sink", "w4:8083"),
+    ]
+    result = topology(connectors, known_workers=["w1:8083", "w2:8083", "w3:8083"])
+
+    summary = result["summary"]
+    assert summary["workers"] == 3
+    assert summary["tasks"] == 5
+    assert summary["unassigned_tasks"] == 1
+    assert summary["max_tasks_per_worker"] == 3
+    assert summary["mean_tasks_per_worker"] == 1.33
+    assert summary["skew_pct"] == 125.0
+    assert summary["idle_workers"] == ["w4:8083"]
+    assert summary["unseen_workers"] == ["w3:8083"]
+    assert result["workers"]["w1:8083"] == {
+        "tasks": 3,
+        "connectors": 2,
+        "failed": 1,
+        "deviation_pct": 125.0,
+    }
+    assert result["failed_by_class"] == {"JdbcSink": 2}
+
+
+def test_topology_is_fast_for_10k_tasks() -> None:
+    connectors = [
+        _conn(
+            f"c{i}",
+            f"Class{i % 7}",
+            f"w{i % 40}:8083",
+            *(("RUNNING", f"w{(i + t) % 40}:8083") for t in range(10)),
+        )
+        for i in range(1000)
+    ]
+    start = time.perf_counter()
+    result = topology(connectors)
+    assert time.perf_counter() - start < 0.1
+    assert result["summary"]["tasks"] == 10_000
+    assert result["summary"]["skew_pct"] == 0.0
+
+
+async def test_get_cluster_topology(mock_api: respx.MockRouter) -> None:
+    payload = {
+        "sink": {
+            "status": {
+                "connector": {"state": "RUNNING", "worker_id": "fake-connect:8083"},
+                "tasks": [{"id": 0, "state": "RUNNING", "worker_id": "fake-connect:8083"}],
+                "type": "sink",
+            },
+            "info": {"config": {"connector.class": "FileStreamSink"}},
+        }
+    }
+    route = mock_api.get("/connectors").mock(
+        return_value=httpx.Response(200, json=payload)
+    )
+
+    result = await get_cluster_topology()
+
+    assert route.call_count == 1
+    assert result["workers"]["fake-connect:8083"]["tasks"] == 1
+    assert result["summary"]["idle_workers"] == []
+
+
+async def test_get_cluster_topology_ignores_single_ingress_url(
+    mock_api: respx.MockRouter,
+) -> None:
+    # fake-connect:8083 fronts two workers; it is not a worker itself.
+    payload = {
+        name: {
+            "status": {
+                "connector": {"state": "RUNNING", "worker_id": worker},
+                "tasks": [{"id": 0, "state": "RUNNING", "worker_id": worker}],
+                "type": "sink",
+            },
+            "info": {"config": {"connector.class": "FileStreamSink"}},
+        }
+        for name, worker in (("a", "w1:8083"), ("b", "w2:8083"))
+    }
+    mock_api.get("/connectors").mock(return_value=httpx.Response(200, json=payload))
+
+    result = await get_cluster_topology()
+
+    assert sorted(result["workers"]) == ["w1:8083", "w2:8083"]
+    assert result["summary"]["idle_workers"] == []
+    assert result["summary"]["unseen_workers"] == []
+    assert result["summary"]["skew_pct"] == 0.0
@@ -0,0 +1,156 @@
+"""Tests for stack-trace deduplication and truncation."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp.server import (
+    get_connector_status,
+    get_task_status,
+    get_trace,
+)
+from kafka_connect_mcp.traces import (
+    TraceStore,
+    compact_trace,
+    dedupe_traces,
+    trace_id,
+)
+
+
+def _trace(frames: int = 60) -> str:
+    outer = [
+        "org.apache.kafka.connect.errors.ConnectException: task failed",
+        *(f"\tat org.example.Outer.method{i}(Outer.java:{i})" for i in range(frames)),
+        "Caused by: java.sql.SQLException: connection refused",
+        *(f"\tat org.example.Root.method{i}(Root.java:{i})" for i in range(frames)),
+        "\t... 12 more",
+    ]
+    return "\n".join(outer)
+
+
+def test_compact_trace_keeps_chain_and_root_frames() -> None:
+    trace = _trace()
+    compact = compact_trace(trace, 400)
+    lines = compact.splitlines()
+
+    assert lines[0].startswith("org.apache.kafka.connect.errors.ConnectException")
+    assert lines[1].startswith("Caused by: java.sql.SQLException")
+    assert "Root.method0" in lines[2]
+    assert "Outer.method" not in compact
+    assert lines[-1].endswith("more lines omitted")
+    assert len(compact.encode()) < 500
+
+
+def test_compact_trace_short_trace_unchanged() -> None:
+    trace = "java.lang.RuntimeException: boom"
+    assert compact_trace(trace, 2048) == trace
+
+
+def test_trace_store_evicts_least_recently_used() -> None:
+    store = TraceStore(max_bytes=25)
+    first = store.put("a" * 10)
+    second = store.put("b" * 10)
+    store.get(first)
+    store.put("c" * 10)
+
+    assert store.get(first) == "a" * 10
+    assert store.get(second) is None
+    assert store.stats() == {"traces": 2, "bytes": 20}
+
+
+def test_dedupe_traces_shares_identical_traces() -> None:
+    trace = _trace()
+    status = {
+        "name": "sink",
+        "connector": {"state": "RUNNING"},
+        "tasks": [
+            {"id": i, "state": "FAILED", "trace": trace} for i in range(3)
+        ]
+        + [{"id": 3, "state": "RUNNING"}],
+    }
+    store = TraceStore()
+    result = dedupe_traces(status, store, 512)
+
+    key = trace_id(trace)
+    assert all("trace" not in t for t in result["tasks"])
+    assert [t.get("trace_id") for t in result["tasks"]] == [key] * 3 + [None]
+    assert list(result["traces"]) == [key]
+    assert result["traces"][key]["seen_in"] == ["task 0", "task 1", "task 2"]
+    assert result["traces"][key]["bytes"] == len(trace)
+    assert store.get(key) == trace
+    assert "trace" in status["tasks"][0]  # input left untouched
+
+
+async def test_get_connector_status_dedupes_and_get_trace_returns_full(
+    mock_api: respx.MockRouter,
+) -> None:
+    trace = _trace()
+    payload = {
+        "name": "sink",
+        "connector": {"state": "RUNNING", "worker_id": "w1"},
+        "tasks": [
+            {"id": 0, "state": "FAILED", "worker_id": "w1", "trace": trace},
+            {"id": 1, "state": "FAILED", "worker_id": "w2", "trace": trace},
+        ],
+    }
+    mock_api.get("/connectors/sink/status").mock(
+        return_value=httpx.Response(200, json=payload)
+    )
+
+    result = await get_connector_status("sink", trace_budget=300)
+    key = result["tasks"][0]["trace_id"]
+    assert len(result["traces"]) == 1
+    assert len(result["traces"][key]["summary"].encode()) < 400
+    assert await get_trace(key) == trace
+
+    raw = await get_connector_status("sink", full_traces=True)
+    assert raw == payload
+
+
+async def test_get_task_status_compacts_trace(
+    mock_api: respx.MockRouter,
+) -> None:
+    trace = _trace()
+    mock_api.get("/connectors/sink/tasks/0/status").mock(
+        return_value=httpx.Response(
+            200, json={"id": 0, "state": "FAILED", "trace": trace}
+        )
+    )
+
+    result = await get_task_status("sink", 0, trace_budget=300)
+    assert result["trace_id"] == trace_id(trace)
+    assert len(result["trace"]) < len(trace)
+    assert "Caused by: java.sql.SQLException" in result["trace"]
+
+
+async def test_get_trace_unknown_id(mock_api: respx.MockRouter) -> None:
+    mock_api.get("/connectors").mock(return_value=httpx.Response(200, json={}))
+
+    with pytest.raises(ValueError, match="Unknown trace_id"):
+        await get_trace("deadbeef0000")
+
+
+@pytest.mark.parametrize("connector", [None, "sink"])
+async def test_get_trace_rereads_connect_on_miss(
+    mock_api: respx.MockRouter, connector: str | None
+) -> None:
+    # As when another worker process answered get_connector_status.
+    trace = _trace()
+    status = {
+        "name": "sink",
+        "connector": {"state": "RUNNING", "worker_id": "w1"},
+        "tasks": [{"id": 0, "state": "FAILED", "trace": trace}],
+    }
+    if connector is None:
+        route = mock_api.get("/connectors", params={"expand": "status"})
+        body = {"sink": {"status": status}}
+    else:
+        route = mock_api.get("/connectors/sink/status")
+        body = status
+    route.mock(return_value=httpx.Response(200, json=body))
+
+    assert await get_trace(trace_id(trace), connector=connector) == trace
+    assert await get_trace(trace_id(trace), connector=connector) == trace
+    assert route.call_count == 1
@@ -0,0 +1,124 @@
+"""Tests for the HTTP transports and the command line."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import uvicorn
+
+from kafka_connect_mcp import server
+
+ACCEPT = {"Accept": "application/json, text/event-stream"}
+
+
+def _rpc_result(resp: httpx.Response) -> dict:
+    """JSON-RPC result from a JSON or single-event SSE response."""
+    if resp.headers["content-type"].startswith("text/event-stream"):
+        data = next(
+            line[len("data:") :]
+            for line in resp.text.splitlines()
+            if line.startswith("data:")
+        )
+        return json.loads(data)["result"]
+    return resp.json()["result"]
+
+
+@pytest.fixture()
+def uvicorn_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    calls: list[dict] = []
+    monkeypatch.setattr(
+        uvicorn, "run", lambda app, **kw: calls.append({"app": app, **kw})
+    )
+    # main() exports the transport choice for the worker processes.
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_TRANSPORT", "")
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_STATELESS", "")
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_WORKERS", "")
+    return calls
+
+
+def test_main_runs_workers_with_tuning(uvicorn_calls: list[dict]) -> None:
+    server.main(
+        [
+            "--transport",
+            "streamable-http",
+            "--workers",
+            "4",
+            "--port",
+            "9000",
+            "--graceful-timeout",
+            "3",
+            "--keep-alive",
+            "75",
+        ]
+    )
+
+    [call] = uvicorn_calls
+    assert call["app"] == "kafka_connect_mcp.server:create_app"
+    assert call["factory"] is True
+    assert call["workers"] == 4
+    assert call["port"] == 9000
+    assert call["timeout_graceful_shutdown"] == 3.0
+    assert call["timeout_keep_alive"] == 75
+    assert server.os.environ["KAFKA_CONNECT_MCP_TRANSPORT"] == (
+        "streamable-http"
+    )
+    # Sessions cannot follow a client across worker processes.
+    assert server.os.environ["KAFKA_CONNECT_MCP_STATELESS"] == "true"
+    assert server.os.environ["KAFKA_CONNECT_MCP_WORKERS"] == "4"
+
+
+def test_single_worker_keeps_sessions(uvicorn_calls: list[dict]) -> None:
+    server.main(["--transport", "streamable-http"])
+
+    assert uvicorn_calls[0]["workers"] == 1
+    assert server.os.environ["KAFKA_CONNECT_MCP_STATELESS"] == "false"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--workers", "2"],
+        ["--transport", "sse", "--workers", "2"],
+        ["--transport", "streamable-http", "--workers", "0"],
+    ],
+)
+def test_main_rejects_unsupported_workers(
+    argv: list[str], uvicorn_calls: list[dict]
+) -> None:
+    with pytest.raises(SystemExit):
+        server.main(argv)
+    assert uvicorn_calls == []
+
+
+async def test_app_loads_clusters_at_startup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(server, "CONNECT_URL", None)
+    monkeypatch.setenv("KAFKA_CONNECT_URL", "http://from-env:8083")
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_TRANSPORT", "streamable-http")
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_STATELESS", "true")
+    assert server._registry is None
+    app = server.create_app()
+
+    assert server._registry is not None
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://localhost"
+        ) as client:
+            # Stateless: a bare tools/call works without a session.
+            resp = await client.post(
+                "/mcp",
+                headers=ACCEPT,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "tools/call",
+                    "params": {"name": "list_clusters", "arguments": {}},
+                },
+            )
+    assert resp.status_code == 200
+    result = _rpc_result(resp)["structuredContent"]
+    assert result["clusters"][0]["urls"] == ["http://from-env:8083"]
+    assert server._registry is None
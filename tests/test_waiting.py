@@ -0,0 +1,123 @@
+"""Tests for server-side waiting on connector state."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+
+from kafka_connect_mcp.server import wait_for_connector_state
+from kafka_connect_mcp.waiting import wait_for_state
+
+
+def _status(connector: str, *tasks: str, trace: str | None = None) -> dict:
+    return {
+        "name": "a",
+        "connector": {"state": connector, "worker_id": "w1"},
+        "tasks": [
+            {"id": i, "state": s, "worker_id": "w1", "trace": trace}
+            for i, s in enumerate(tasks)
+        ],
+    }
+
+
+class _Timer:
+    """Fake clock whose sleep advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _feed(*payloads: dict | None):
+    items = list(payloads)
+
+    async def fetch() -> dict | None:
+        return items.pop(0) if len(items) > 1 else items[0]
+
+    return fetch
+
+
+async def test_reaches_target_with_timeline() -> None:
+    timer = _Timer()
+    result = await wait_for_state(
+        _feed(
+            None,
+            _status("UNASSIGNED", "UNASSIGNED"),
+            _status("RUNNING", "UNASSIGNED"),
+            _status("RUNNING", "RUNNING"),
+        ),
+        name="a",
+        sleep=timer.sleep,
+        clock=timer.clock,
+    )
+    assert result["outcome"] == "reached"
+    assert result["polls"] == 4
+    assert [step["connector"] for step in result["timeline"]] == [
+        "NOT_FOUND",
+        "UNASSIGNED",
+        "RUNNING",
+        "RUNNING",
+    ]
+    assert result["timeline"][-1]["tasks"] == {"0": "RUNNING"}
+
+
+async def test_backoff_grows_while_nothing_changes() -> None:
+    timer = _Timer()
+    result = await wait_for_state(
+        _feed(_status("RUNNING", "UNASSIGNED")),
+        name="a",
+        timeout=20,
+        sleep=timer.sleep,
+        clock=timer.clock,
+    )
+    assert result["outcome"] == "timeout"
+    assert timer.sleeps[:3] == [0.5, 0.75, 1.125]
+    assert max(timer.sleeps) <= 5.0
+    assert len(result["timeline"]) == 1
+
+
+async def test_fail_fast_on_failed_task() -> None:
+    timer = _Timer()
+    result = await wait_for_state(
+        _feed(_status("RUNNING", "RUNNING", "FAILED", trace="Boom\n\tat x")),
+        name="a",
+        sleep=timer.sleep,
+        clock=timer.clock,
+    )
+    assert result["outcome"] == "failed"
+    assert result["status"]["tasks"][1]["error"] == "Boom"
+    assert timer.sleeps == []
+
+
+async def test_can_wait_for_failed_without_fail_fast_tripping() -> None:
+    timer = _Timer()
+    result = await wait_for_state(
+        _feed(_status("RUNNING", "FAILED")),
+        name="a",
+        connector_state="running",
+        task_state="failed",
+        sleep=timer.sleep,
+        clock=timer.clock,
+    )
+    assert result["outcome"] == "reached"
+
+
+async def test_tool_polls_status_endpoint(
+    mock_api: respx.MockRouter,
+) -> None:
+    route = mock_api.get("/connectors/a/status").mock(
+        side_effect=[
+            httpx.Response(404, json={"message": "not found"}),
+            httpx.Response(200, json=_status("RUNNING", "RUNNING")),
+        ]
+    )
+    result = await wait_for_connector_state("a")
+    assert result["reached"] is True
+    assert route.call_count == 2
@@ -0,0 +1,167 @@
+"""Tests for the background status watcher and change feed."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from kafka_connect_mcp import server
+from kafka_connect_mcp.server import get_changes_since
+from kafka_connect_mcp.watcher import StatusWatcher, diff_states
+
+
+def _conn(name: str, state: str, *tasks: str) -> dict:
+    return {
+        "name": name,
+        "state": state,
+        "tasks": [{"id": i, "state": s} for i, s in enumerate(tasks)],
+    }
+
+
+def test_diff_states_reports_transitions() -> None:
+    old = {
+        "a": {"state": "RUNNING", "tasks": {0: "RUNNING", 1: "RUNNING"}},
+        "gone": {"state": "RUNNING", "tasks": {}},
+    }
+    new = {
+        "a": {"state": "RUNNING", "tasks": {0: "RUNNING", 1: "FAILED"}},
+        "new": {"state": "UNASSIGNED", "tasks": {0: "UNASSIGNED"}},
+    }
+    assert diff_states(old, new) == [
+        {"connector": "a", "task": 1, "from": "RUNNING", "to": "FAILED"},
+        {"connector": "gone", "task": None, "from": "RUNNING", "to": None},
+        {"connector": "new", "task": None, "from": None, "to": "UNASSIGNED"},
+        {"connector": "new", "task": 0, "from": None, "to": "UNASSIGNED"},
+    ]
+
+
+def _watcher(*snapshots: list[dict], capacity: int = 100) -> StatusWatcher:
+    items = list(snapshots)
+
+    async def fetch() -> list[dict]:
+        return items.pop(0)
+
+    return StatusWatcher(fetch, capacity=capacity)
+
+
+async def test_cursor_feed() -> None:
+    watcher = _watcher(
+        [_conn("a", "RUNNING", "RUNNING")],
+        [_conn("a", "RUNNING", "FAILED")],
+        [_conn("a", "FAILED", "FAILED")],
+    )
+    await watcher.poll_once()
+    start = watcher.changes_since(None)
+    assert start["cursor"] == f"{watcher.epoch}-0"
+    assert start["changes"] == []
+
+    await watcher.poll_once()
+    await watcher.poll_once()
+    page = watcher.changes_since(start["cursor"])
+    assert [(c["task"], c["to"]) for c in page["changes"]] == [
+        (0, "FAILED"),
+        (None, "FAILED"),
+    ]
+    assert page["cursor"] == page["changes"][-1]["cursor"] == watcher.cursor
+
+    assert watcher.changes_since(page["cursor"])["changes"] == []
+
+
+async def test_limit_pages_and_eviction_truncates() -> None:
+    watcher = _watcher(
+        [_conn("a", "RUNNING", "RUNNING", "RUNNING", "RUNNING")],
+        [_conn("a", "RUNNING", "FAILED", "FAILED", "FAILED")],
+        capacity=2,
+    )
+    await watcher.poll_once()
+    await watcher.poll_once()
+
+    page = watcher.changes_since(f"{watcher.epoch}-0", limit=1)
+    assert page["truncated"] is True
+    assert page["more"] is True
+    assert [c["cursor"] for c in page["changes"]] == [f"{watcher.epoch}-2"]
+
+    rest = watcher.changes_since(page["cursor"])
+    assert rest["truncated"] is False
+    assert [c["cursor"] for c in rest["changes"]] == [f"{watcher.epoch}-3"]
+
+
+async def test_cursor_from_before_restart_is_truncated() -> None:
+    snapshots = (
+        [_conn("a", "RUNNING", "RUNNING")],
+        [_conn("a", "RUNNING", "FAILED")],
+    )
+    before = _watcher(*snapshots)
+    await before.poll_once()
+    await before.poll_once()
+    held = before.cursor
+
+    # Same position in a new process life: the old cursor means nothing.
+    after = _watcher(*snapshots)
+    await after.poll_once()
+    await after.poll_once()
+    page = after.changes_since(held)
+
+    assert page["truncated"] is True
+    assert page["changes"] == []
+    assert page["cursor"] == after.cursor
+    assert after.changes_since(page["cursor"])["truncated"] is False
+    with pytest.raises(ValueError, match="Invalid change cursor"):
+        after.changes_since("12")
+
+
+async def test_fetch_errors_are_recorded_not_raised() -> None:
+    async def fetch() -> list[dict]:
+        raise httpx.ConnectError("down")
+
+    watcher = StatusWatcher(fetch)
+    await watcher.poll_once()
+    assert watcher.errors == 1
+    assert "ConnectError" in watcher.changes_since(None)["last_error"]
+
+
+def _expanded(task_state: str) -> dict:
+    return {
+        "a": {
+            "status": {
+                "connector": {"state": "RUNNING", "worker_id": "w1"},
+                "tasks": [{"id": 0, "state": task_state, "worker_id": "w1"}],
+            },
+            "info": {"config": {}},
+        }
+    }
+
+
+async def test_tool_shares_one_watcher(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_WATCH_INTERVAL", "3600")
+    route = mock_api.get("/connectors").mock(
+        side_effect=[
+            httpx.Response(200, json=_expanded("RUNNING")),
+            httpx.Response(200, json=_expanded("FAILED")),
+        ]
+    )
+
+    first = await get_changes_since()
+    second = await get_changes_since()
+    assert first["cursor"] == second["cursor"]
+    assert route.call_count == 1
+
+    await server._cluster(None).watcher().poll_once()
+    result = await get_changes_since(first["cursor"])
+    assert result["changes"][0]["to"] == "FAILED"
+    assert route.call_count == 2
+
+
+async def test_tool_refused_with_several_workers(
+    mock_api: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("KAFKA_CONNECT_MCP_WORKERS", "4")
+
+    with pytest.raises(RuntimeError, match="single server process"):
+        await get_changes_since()
+
+    # No watcher was started to poll Connect from every worker.
+    assert not mock_api.calls